@@ -1,36 +1,370 @@
-from flask import Flask, request, render_template, jsonify, redirect, url_for
+from flask import Flask, Request, Response, current_app, request, render_template, jsonify, redirect, url_for, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+import click
 import os
 import re
+import io
+import sys
+import tempfile
+import importlib
+import importlib.util
 from werkzeug.utils import secure_filename
-import PyPDF2
-import docx
-from collections import Counter
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from collections import Counter, namedtuple
 import time
 import json
+import threading
+import queue
+import multiprocessing
+import multiprocessing.connection
+import hashlib
+import sqlite3
+import uuid
+import zipfile
+import tarfile
+from xml.etree import ElementTree
+import gc
+import logging
+import bisect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import islice
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
-from fuzzywuzzy import fuzz
-# from sklearn.feature_extraction.text import TfidfVectorizer
-# from sklearn.metrics.pairwise import cosine_similarity
+from types import MappingProxyType
+try:
+    # rapidfuzz scores a whole requirement x skill matrix in one call
+    from rapidfuzz.process import cdist
+    from rapidfuzz.fuzz import ratio as batch_ratio
+except ImportError:
+    cdist = None
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+import pickle
 import numpy as np
 
+# PDF/DOCX parsing, the LinkedIn scraper (selenium, bs4), fuzzywuzzy and
+# scikit-learn are imported where they are first used, so a worker that never
+# needs them never pays for them.
+
+# TF-IDF semantic scoring (SEMANTIC_SCORING=tfidf) needs scikit-learn and scipy
+SEMANTIC_BACKEND_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('sklearn', 'scipy'))
+
+class SpooledUploadRequest(Request):
+    """Request that keeps uploaded files in memory up to UPLOAD_SPOOL_MAX_SIZE.
+
+    Larger files spill to an anonymous temporary file in UPLOAD_FOLDER, so
+    concurrent uploads with the same name never share a path.
+    """
+
+    @property
+    def max_content_length(self):
+        # Resume archives have their own, larger limit
+        if self.url_rule is not None and self.url_rule.endpoint == 'upload_archive':
+            return current_app.config['ARCHIVE_MAX_SIZE']
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(
+            max_size=current_app.config['UPLOAD_SPOOL_MAX_SIZE'],
+            mode='rb+',
+            dir=current_app.config['UPLOAD_FOLDER']
+        )
+
 app = Flask(__name__)
+app.request_class = SpooledUploadRequest
 
 # Configuration
-app.config['UPLOAD_FOLDER'] = 'uploads'
+app.config['UPLOAD_FOLDER'] = 'uploads'  # only used when a large upload spills to disk
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['UPLOAD_SPOOL_MAX_SIZE'] = int(os.environ.get('UPLOAD_SPOOL_MAX_SIZE', 4 * 1024 * 1024))  # bytes kept in memory per file
 ALLOWED_EXTENSIONS = {'txt', 'pdf', 'docx'}
 
+# Skill taxonomy data file; edits are picked up without a restart
+app.config['SKILL_TAXONOMY_PATH'] = os.environ.get(
+    'SKILL_TAXONOMY_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skills_taxonomy.json')
+)
+app.config['SKILL_TAXONOMY_RELOAD_INTERVAL'] = float(os.environ.get('SKILL_TAXONOMY_RELOAD_INTERVAL', 5))  # seconds, 0 disables
+
+# Resume parsing pool for the batch endpoints
+app.config['PARSE_POOL_WORKERS'] = int(os.environ.get('PARSE_POOL_WORKERS', min(4, os.cpu_count() or 1)))  # 0 parses on the request thread
+app.config['PARSE_TIMEOUT'] = float(os.environ.get('PARSE_TIMEOUT', 30))  # seconds per file
+
+# Parsed-resume cache, keyed by file content hash and taxonomy version
+app.config['RESUME_CACHE_SIZE'] = int(os.environ.get('RESUME_CACHE_SIZE', 256))  # in-process entries, 0 disables
+app.config['RESUME_CACHE_DB'] = os.environ.get('RESUME_CACHE_DB', '')  # SQLite file shared by workers, empty disables
+app.config['RESUME_CACHE_DB_MAX_MB'] = float(os.environ.get('RESUME_CACHE_DB_MAX_MB', 256))
+
+# Semantic part of the advanced match score: 'overlap' (share of JD words found in
+# the resume's skills) or 'tfidf' (cosine similarity under a fitted TF-IDF vectorizer)
+app.config['SEMANTIC_SCORING'] = os.environ.get('SEMANTIC_SCORING', 'overlap')
+app.config['SEMANTIC_MODEL_PATH'] = os.environ.get(
+    'SEMANTIC_MODEL_PATH', os.path.join(app.config['UPLOAD_FOLDER'], 'semantic_tfidf.pkl')
+)  # fitted on first use if missing, or with `flask --app app fit-semantic-model`
+
+# Parsed job descriptions, keyed by normalized text and taxonomy version
+app.config['JOB_DESCRIPTION_CACHE_SIZE'] = int(os.environ.get('JOB_DESCRIPTION_CACHE_SIZE', 128))  # 0 disables
+
+# Asynchronous batch screening jobs (POST /batch-jobs)
+app.config['BATCH_JOB_DB'] = os.environ.get('BATCH_JOB_DB', os.path.join(app.config['UPLOAD_FOLDER'], 'batch_jobs.db'))
+app.config['BATCH_JOB_THREADS'] = int(os.environ.get('BATCH_JOB_THREADS', 1))  # per web worker process
+app.config['BATCH_JOB_STALE_AFTER'] = float(os.environ.get('BATCH_JOB_STALE_AFTER', 120))  # seconds without a heartbeat before a job is retried
+app.config['BATCH_JOB_MAX_ATTEMPTS'] = int(os.environ.get('BATCH_JOB_MAX_ATTEMPTS', 3))
+app.config['BATCH_JOB_RETENTION_HOURS'] = float(os.environ.get('BATCH_JOB_RETENTION_HOURS', 7 * 24))
+
+# Resume archives (POST /upload-archive), read member by member without extracting to disk
+app.config['ARCHIVE_MAX_SIZE'] = int(os.environ.get('ARCHIVE_MAX_SIZE', 128 * 1024 * 1024))  # bytes per uploaded archive, instead of MAX_CONTENT_LENGTH
+app.config['ARCHIVE_MAX_MEMBERS'] = int(os.environ.get('ARCHIVE_MAX_MEMBERS', 1000))  # files per archive, skipped ones included
+app.config['ARCHIVE_MAX_MEMBER_SIZE'] = int(os.environ.get('ARCHIVE_MAX_MEMBER_SIZE', 16 * 1024 * 1024))  # uncompressed bytes per resume
+app.config['ARCHIVE_MAX_TOTAL_SIZE'] = int(os.environ.get('ARCHIVE_MAX_TOTAL_SIZE', 256 * 1024 * 1024))  # uncompressed bytes per archive
+app.config['ARCHIVE_MAX_RATIO'] = float(os.environ.get('ARCHIVE_MAX_RATIO', 100))  # uncompressed / compressed size of a ZIP member or a whole tarball
+
+# Persistent candidate pool (POST /candidates/search ranks it for a job description)
+app.config['CANDIDATE_STORE_DB'] = os.environ.get('CANDIDATE_STORE_DB', os.path.join(app.config['UPLOAD_FOLDER'], 'candidates.db'))  # empty disables
+app.config['CANDIDATE_SEARCH_BACKEND'] = os.environ.get('CANDIDATE_SEARCH_BACKEND', 'postings')  # 'postings' or 'bitset'
+app.config['CANDIDATE_STORE_RETAIN_UPLOADS'] = os.environ.get('CANDIDATE_STORE_RETAIN_UPLOADS', '0') == '1'  # also add resumes uploaded for screening, not just POST /candidates
+
+# LinkedIn job postings are scraped in the background into a cache; requests only read it
+app.config['JOB_CACHE_DB'] = os.environ.get('JOB_CACHE_DB', os.path.join(app.config['UPLOAD_FOLDER'], 'linkedin_jobs.db'))
+app.config['JOB_CACHE_TTL_HOURS'] = float(os.environ.get('JOB_CACHE_TTL_HOURS', 72))  # postings expire this long after they were scraped
+app.config['LINKEDIN_REFRESH_INTERVAL'] = float(os.environ.get('LINKEDIN_REFRESH_INTERVAL', 3600))  # seconds between scrapes of a profile, 0 disables
+app.config['LINKEDIN_REFRESH_IN_WORKERS'] = os.environ.get('LINKEDIN_REFRESH_IN_WORKERS', '0') == '1'  # refresh from a web worker instead of `flask refresh-linkedin-jobs --watch`
+app.config['LINKEDIN_MAX_POSTS_PER_PROFILE'] = int(os.environ.get('LINKEDIN_MAX_POSTS_PER_PROFILE', 10))
+app.config['LINKEDIN_FIXTURES_DIR'] = os.environ.get('LINKEDIN_FIXTURES_DIR') or None  # saved activity pages instead of a browser
+
+# Headless Chrome sessions shared by scraper runs in a worker process
+app.config['BROWSER_POOL_SIZE'] = int(os.environ.get('BROWSER_POOL_SIZE', 2))  # concurrent sessions, so profiles scraped in parallel
+app.config['BROWSER_MAX_USES'] = int(os.environ.get('BROWSER_MAX_USES', 20))  # pages per session before it is replaced
+app.config['BROWSER_IDLE_TIMEOUT'] = float(os.environ.get('BROWSER_IDLE_TIMEOUT', 300))  # seconds an unused session stays open
+
+# Logging and request metrics (GET /metrics, Prometheus text format)
+app.config['LOG_LEVEL'] = os.environ.get('LOG_LEVEL', 'INFO').upper()  # DEBUG also logs the skills extracted per request
+app.config['METRICS_DB'] = os.environ.get('METRICS_DB', os.path.join(app.config['UPLOAD_FOLDER'], 'metrics.db'))  # shared by workers, empty keeps them per process
+app.config['METRICS_FLUSH_INTERVAL'] = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))  # seconds between writes to METRICS_DB
+
+# PDF text extraction; pages are read one at a time and reading stops at either cap
+app.config['PDF_BACKEND'] = os.environ.get('PDF_BACKEND', 'auto')  # 'pymupdf', 'pypdf', 'pypdf2', or 'auto' for the fastest installed
+app.config['PDF_MAX_PAGES'] = int(os.environ.get('PDF_MAX_PAGES', 50))  # 0 reads every page
+app.config['PDF_MAX_CHARS'] = int(os.environ.get('PDF_MAX_CHARS', 200000))  # characters of text kept per PDF, 0 keeps all
+
 # Ensure upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
+# Messages go to stderr with the worker pid; below LOG_LEVEL a call only
+# compares levels, and its %-style arguments are never formatted
+logger = logging.getLogger('ats')
+logger.setLevel(app.config['LOG_LEVEL'])
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(process)d] %(message)s'))
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+
+class RequestTrace:
+    """Where one request (or batch job) spent its time, plus what it uploaded.
+
+    ``stages`` sums seconds per stage: save, extract_text, extract_skills,
+    scrape, score and serialize. Text and skill extraction run on the parse
+    pool, so for a batch they add up the time of every pool process and can
+    exceed the request's own latency.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = Counter()
+        self.bytes_read = 0
+        self.resumes = 0
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] += time.perf_counter() - start
+
+    def add(self, timings):
+        """Add {stage: seconds} measured elsewhere, e.g. in a parse pool process"""
+        self.stages.update(timings)
+
+_TRACE = threading.local()
+
+def current_trace():
+    """The RequestTrace of the request or batch job on this thread, or None"""
+    return getattr(_TRACE, 'trace', None)
+
+@contextmanager
+def tracing(trace):
+    """Make ``trace`` this thread's current trace for the duration"""
+    previous = current_trace()
+    _TRACE.trace = trace
+    try:
+        yield trace
+    finally:
+        _TRACE.trace = previous
+
+@contextmanager
+def trace_stage(name):
+    """Time the block as a stage of the current trace; a no-op without one"""
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+    with trace.stage(name):
+        yield
+
+class TracedJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, timing every response body as the serialize stage"""
+
+    def dumps(self, obj, **kwargs):
+        with trace_stage('serialize'):
+            return super().dumps(obj, **kwargs)
+
+app.json = TracedJSONProvider(app)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+BYTES_BUCKETS = (1024, 16 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024, 4 * 1024 * 1024, 16 * 1024 * 1024)
+RESUME_COUNT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+SCRAPE_BUCKETS = (1, 2.5, 5, 10, 20, 30, 60, 120)
+
+# name: (help text, bucket upper bounds)
+HISTOGRAMS = {
+    'ats_request_duration_seconds': ('Time to serve a request, until its body was sent', LATENCY_BUCKETS),
+    'ats_stage_duration_seconds': ('Time a request spent in each stage, summed over parse pool processes', LATENCY_BUCKETS),
+    'ats_request_bytes': ('Bytes of uploaded resumes read per request', BYTES_BUCKETS),
+    'ats_request_resumes': ('Resumes uploaded per request', RESUME_COUNT_BUCKETS),
+    'ats_linkedin_scrape_duration_seconds': ('Time to scrape one LinkedIn profile in the background', SCRAPE_BUCKETS)
+}
+
+class MetricsStore:
+    """Prometheus histograms, added up across worker processes.
+
+    Observations are counted in memory. Every ``flush_interval`` seconds (and
+    whenever /metrics is scraped) each process adds what it counted since its
+    last flush to one SQLite table, so any worker can render the totals of all
+    of them. Without a database each process only reports its own counts.
+    """
+
+    def __init__(self, db_path, flush_interval=5.0):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._pending = Counter()  # (name, labels, bucket): increment since the last flush
+        self._totals = Counter()  # everything this process counted, without a database
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across forks and threads
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        if not self._schema_ready:
+            # Created on first use, so importing the module opens no database
+            with self._schema_lock:
+                if not self._schema_ready:
+                    with connection:
+                        self._create_schema(connection)
+                    self._schema_ready = True
+        return connection
+
+    @staticmethod
+    def _create_schema(connection):
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS histogram_buckets ('
+            'name TEXT NOT NULL, labels TEXT NOT NULL, bucket TEXT NOT NULL, value REAL NOT NULL, '
+            'PRIMARY KEY (name, labels, bucket))'
+        )
+
+    @staticmethod
+    def labels(**labels):
+        """Labels rendered as Prometheus expects them inside braces"""
+        return ','.join(
+            '{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for name, value in sorted(labels.items())
+        )
+
+    def observe(self, name, value, **labels):
+        # Only the smallest bucket the value fits in is counted; render() adds
+        # them up into Prometheus' cumulative buckets
+        buckets = HISTOGRAMS[name][1]
+        position = bisect.bisect_left(buckets, value)
+        bucket = repr(float(buckets[position])) if position < len(buckets) else '+Inf'
+        labels = self.labels(**labels)
+        with self._lock:
+            self._pending[(name, labels, bucket)] += 1
+            self._pending[(name, labels, 'sum')] += value
+
+    def record_request(self, endpoint, status, trace):
+        """Observe a finished request's latency, stages and uploads, then flush if due"""
+        self.observe('ats_request_duration_seconds', time.perf_counter() - trace.started,
+                     endpoint=endpoint, status=status)
+        for stage, seconds in trace.stages.items():
+            self.observe('ats_stage_duration_seconds', seconds, endpoint=endpoint, stage=stage)
+        if trace.resumes:
+            self.observe('ats_request_bytes', trace.bytes_read, endpoint=endpoint)
+            self.observe('ats_request_resumes', trace.resumes, endpoint=endpoint)
+        self.flush()
+
+    def flush(self, force=False):
+        if not force and time.monotonic() - self._last_flush < self.flush_interval:
+            return
+
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._last_flush = time.monotonic()
+
+        if not self.db_path:
+            self._totals.update(pending)
+            return
+
+        try:
+            with self._connect() as connection:
+                connection.executemany(
+                    'INSERT INTO histogram_buckets (name, labels, bucket, value) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT (name, labels, bucket) DO UPDATE SET value = value + excluded.value',
+                    [(name, labels, bucket, value) for (name, labels, bucket), value in pending.items()]
+                )
+        except sqlite3.Error as e:
+            logger.error('Error writing metrics: %s', e)
+            # Keep the counts for the next flush
+            with self._lock:
+                self._pending.update(pending)
+
+    def totals(self):
+        """{(name, labels, bucket): value} for every process, including this one's latest counts"""
+        self.flush(force=True)
+        if not self.db_path:
+            return dict(self._totals)
+        with self._connect() as connection:
+            rows = connection.execute('SELECT name, labels, bucket, value FROM histogram_buckets').fetchall()
+        return {(name, labels, bucket): value for name, labels, bucket, value in rows}
+
+    def render(self):
+        """Every histogram in the Prometheus text exposition format"""
+        series = defaultdict(dict)
+        for (name, labels, bucket), value in self.totals().items():
+            series[(name, labels)][bucket] = value
+
+        lines = []
+        for name, (help_text, buckets) in HISTOGRAMS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for labels in sorted(labels for series_name, labels in series if series_name == name):
+                values = series[(name, labels)]
+                prefix = labels + ',' if labels else ''
+                count = 0
+                for bucket in [repr(float(bound)) for bound in buckets] + ['+Inf']:
+                    count += int(values.get(bucket, 0))
+                    lines.append(f'{name}_bucket{{{prefix}le="{bucket}"}} {count}')
+                lines.append(f'{name}_sum{{{labels}}} {values.get("sum", 0.0)!r}')
+                lines.append(f'{name}_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+METRICS = MetricsStore(app.config['METRICS_DB'], app.config['METRICS_FLUSH_INTERVAL'])
+
 # LinkedIn Profile URLs for job postings
 TRUSTED_LINKEDIN_PROFILES = [
     "https://www.linkedin.com/in/zeeshan-ali-562109131",
@@ -38,86 +372,402 @@ TRUSTED_LINKEDIN_PROFILES = [
     "https://www.linkedin.com/in/avinash-yadav-jeniga-10a1b31a0"
 ]
 
+class PluginRegistry:
+    """Named plugins (resume text extractors, job scrapers) whose heavy
+    dependencies are imported on first use rather than at startup.
+
+    A plugin is registered with the top-level modules it needs and imports
+    them itself when it runs. The registry lets callers look plugins up by
+    name, report which are installed and loaded without importing anything,
+    and ``preload()`` their dependencies ahead of time.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self._plugins = {}
+
+    def register(self, name, requires=()):
+        """Decorator adding a function or class under ``name``"""
+        def decorator(plugin):
+            self._plugins[name] = (plugin, tuple(requires))
+            return plugin
+        return decorator
+
+    def get(self, name):
+        try:
+            return self._plugins[name][0]
+        except KeyError:
+            raise KeyError(f'No {self.kind} registered for {name!r}') from None
+
+    def __contains__(self, name):
+        return name in self._plugins
+
+    def names(self):
+        return list(self._plugins)
+
+    def requires(self, name):
+        return self._plugins[name][1]
+
+    def installed(self, name):
+        """Whether every dependency of ``name`` can be imported, without importing it"""
+        return all(importlib.util.find_spec(module) is not None for module in self._plugins[name][1])
+
+    def first_installed(self):
+        """The first registered plugin whose dependencies are installed, or None"""
+        return next((name for name in self._plugins if self.installed(name)), None)
+
+    def preload(self, names=None):
+        """Import the dependencies of ``names`` (default: all plugins);
+        returns {name: error} for the ones that couldn't be imported"""
+        errors = {}
+        for name in names if names is not None else self._plugins:
+            for module in self._plugins[name][1]:
+                try:
+                    importlib.import_module(module)
+                except ImportError as e:
+                    errors[name] = str(e)
+        return errors
+
+    def stats(self):
+        """{name: 'loaded', 'available' or 'missing'} without importing anything"""
+        stats = {}
+        for name, (_, requires) in self._plugins.items():
+            if all(module in sys.modules for module in requires):
+                stats[name] = 'loaded'
+            elif self.installed(name):
+                stats[name] = 'available'
+            else:
+                stats[name] = 'missing'
+        return stats
+
+# Resume text extractors by file extension
+EXTRACTORS = PluginRegistry('extractor')
+
+# PDF text libraries, fastest first; PDF_BACKEND=auto uses the first one installed
+PDF_BACKENDS = PluginRegistry('PDF backend')
+
+# Job posting scrapers by source
+SCRAPERS = PluginRegistry('scraper')
+
+def chrome_driver():
+    """A new headless Chrome session for scraping"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+    return webdriver.Chrome(options=chrome_options)
+
+class BrowserPool:
+    """Warm, reusable browser sessions for the scraper.
+
+    At most ``size`` sessions exist at once and ``session()`` waits for a
+    free one. An idle session is health-checked before it is handed out. It
+    is quit and replaced after ``max_uses`` pages or after any error while in
+    use, and quit once it has been idle for ``idle_timeout`` seconds.
+    ``driver_factory`` makes a new session; tests can pass a stub driver.
+    """
+
+    def __init__(self, driver_factory, size=2, max_uses=20, idle_timeout=300):
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle = []  # (driver, uses, last used)
+        self._counts = Counter()
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Borrow a driver for one page load"""
+        with self._lock:
+            # Sessions belong to the process that started them
+            if self._pid != os.getpid():
+                self._reset()
+            slots = self._slots
+
+        if not slots.acquire(timeout=timeout):
+            raise TimeoutError('No browser session became available')
+        try:
+            driver, uses = self._checkout()
+            try:
+                yield driver
+            except BaseException:
+                self._quit(driver, 'discarded')
+                raise
+            self._checkin(driver, uses + 1)
+        finally:
+            slots.release()
+
+    def _checkout(self):
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                driver = self.driver_factory()
+                self._counts['created'] += 1
+                return driver, 0
+
+            driver, uses, last_used = entry
+            if time.monotonic() - last_used > self.idle_timeout:
+                self._quit(driver, 'expired')
+            elif not self._healthy(driver):
+                self._quit(driver, 'unhealthy')
+            else:
+                self._counts['reused'] += 1
+                return driver, uses
+
+    def _checkin(self, driver, uses):
+        if uses >= self.max_uses:
+            self._quit(driver, 'recycled')
+            return
+        with self._lock:
+            self._idle.append((driver, uses, time.monotonic()))
+
+    @staticmethod
+    def _healthy(driver):
+        try:
+            driver.execute_script('return document.readyState')
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver, reason):
+        self._counts[reason] += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_idle(self, idle_for=None):
+        """Quit sessions unused for ``idle_for`` seconds (default idle_timeout)"""
+        idle_for = self.idle_timeout if idle_for is None else idle_for
+        now = time.monotonic()
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            expired = [entry for entry in self._idle if now - entry[2] >= idle_for]
+            self._idle = [entry for entry in self._idle if now - entry[2] < idle_for]
+        for driver, _, _ in expired:
+            self._quit(driver, 'expired')
+
+    def stats(self):
+        with self._lock:
+            idle = len(self._idle) if self._pid == os.getpid() else 0
+        return dict(self._counts, size=self.size, idle=idle)
+
+BROWSER_POOL = BrowserPool(
+    chrome_driver,
+    app.config['BROWSER_POOL_SIZE'],
+    app.config['BROWSER_MAX_USES'],
+    app.config['BROWSER_IDLE_TIMEOUT']
+)
+
+def activity_number(post_id):
+    """Numeric part of a post ID like urn:li:activity:7123456789 (newer posts
+    have larger numbers), or None"""
+    match = re.search(r'(\d+)\D*$', post_id or '')
+    return int(match.group(1)) if match else None
+
+@SCRAPERS.register('linkedin', requires=('selenium', 'bs4'))
 class LinkedInJobScraper:
-    def __init__(self):
+    """Scrape job postings from the activity pages of LinkedIn profiles
+
+    Pages are loaded through a BrowserPool (BROWSER_POOL by default). With
+    ``fixtures_dir`` they are read from saved HTML files named after each
+    profile (``<profile-slug>.html``) instead, so scraping can be exercised
+    offline.
+    """
+
+    # Posts mentioning none of these are not job postings
+    job_keywords = (
+        'hiring', 'job', 'opportunity', 'position', 'role',
+        'vacancy', 'opening', 'career', 'recruit', 'apply',
+        'developer', 'engineer', 'analyst', 'manager', 'intern'
+    )
+
+    # Every post on an activity page carries its urn:li:activity ID
+    post_selector = '[data-id*="activity"]'
+
+    # Longest waits for the first post after navigating, and for more posts
+    # after scrolling to the bottom of the page
+    page_timeout = 10
+    scroll_timeout = 2
+    max_scrolls = 10
+    wait_poll = 0.1
+
+    def __init__(self, fixtures_dir=None, browser_pool=None):
         """Initialize the LinkedIn job scraper"""
-        self.chrome_options = Options()
-        self.chrome_options.add_argument("--headless")
-        self.chrome_options.add_argument("--no-sandbox")
-        self.chrome_options.add_argument("--disable-dev-shm-usage")
-        self.chrome_options.add_argument("--disable-gpu")
-        self.chrome_options.add_argument("--window-size=1920,1080")
-        self.chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        
-    def scrape_linkedin_posts(self, profile_urls, max_posts_per_profile=10):
-        """Scrape job posts from LinkedIn profiles"""
-        all_jobs = []
+        self.fixtures_dir = fixtures_dir
+        self.browser_pool = browser_pool or BROWSER_POOL
+        # {profile_url: {'seconds', 'first_post', 'scrolls', 'posts'}} for the
+        # profiles scraped so far
+        self.timings = {}
+        
+    def scrape_profiles(self, profile_urls, max_posts_per_profile=10, watermarks=None):
+        """Scrape job posts from LinkedIn profiles
         
+        Profiles are scraped in parallel, as many at once as the browser pool
+        has sessions. Yields (profile_url, jobs, watermark, error) as each
+        profile finishes. ``watermarks`` maps a profile to the ID of the newest
+        post scraped before; only newer posts are turned into jobs, and the
+        returned watermark is the newest post seen this time.
+        """
+        watermarks = watermarks or {}
+        workers = 1 if self.fixtures_dir is not None else self.browser_pool.size
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(profile_urls)))) as executor:
+            futures = [
+                executor.submit(self.scrape_profile, profile_url, max_posts_per_profile, watermarks.get(profile_url))
+                for profile_url in profile_urls
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def scrape_profile(self, profile_url, max_posts_per_profile=10, watermark=None):
+        """(profile_url, jobs, watermark, error) for one profile; its timing goes to ``timings``"""
+        timing = self.timings[profile_url] = {'seconds': None, 'first_post': None, 'scrolls': 0, 'posts': 0}
+        started = time.monotonic()
         try:
-            driver = webdriver.Chrome(options=self.chrome_options)
-            
-            for profile_url in profile_urls:
-                try:
-                    print(f"Scraping profile: {profile_url}")
-                    
-                    # Navigate to profile activity page
-                    activity_url = f"{profile_url}/recent-activity/"
-                    driver.get(activity_url)
-                    
-                    # Wait for page to load
-                    time.sleep(3)
-                    
-                    # Scroll to load more posts
-                    for _ in range(3):
-                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(2)
-                    
-                    # Find posts that might be job-related
-                    posts = driver.find_elements(By.CSS_SELECTOR, '[data-id*="activity"]')
-                    
-                    for post in posts[:max_posts_per_profile]:
-                        try:
-                            post_text = post.text.lower()
-                            
-                            # Check if post contains job-related keywords
-                            job_keywords = [
-                                'hiring', 'job', 'opportunity', 'position', 'role', 
-                                'vacancy', 'opening', 'career', 'recruit', 'apply',
-                                'developer', 'engineer', 'analyst', 'manager', 'intern'
-                            ]
-                            
-                            if any(keyword in post_text for keyword in job_keywords):
-                                # Extract job details
-                                job_data = self.extract_job_details(post.text)
-                                if job_data and job_data['title'] and job_data['description']:
-                                    job_data['source_profile'] = profile_url
-                                    job_data['scraped_at'] = datetime.now().isoformat()
-                                    all_jobs.append(job_data)
-                                    
-                        except Exception as e:
-                            print(f"Error processing post: {e}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"Error scraping profile {profile_url}: {e}")
-                    continue
-                    
+            html = self.load_activity_page(profile_url, max_posts_per_profile, watermark, timing)
+            jobs, watermark = self.jobs_from_posts(
+                profile_url, self.parse_activity_posts(html), max_posts_per_profile, watermark
+            )
+            return profile_url, jobs, watermark, None
         except Exception as e:
-            print(f"Error initializing driver: {e}")
-            # Fallback to mock job data for demonstration
-            return self.get_mock_jobs()
-            
+            logger.warning('Error scraping profile %s: %s', profile_url, e)
+            return profile_url, [], watermark, str(e)
         finally:
+            timing['seconds'] = time.monotonic() - started
+    
+    def fixture_path(self, profile_url):
+        """Saved activity page for a profile: <fixtures_dir>/<profile-slug>.html"""
+        return os.path.join(self.fixtures_dir, profile_url.rstrip('/').rsplit('/', 1)[-1] + '.html')
+    
+    def load_activity_page(self, profile_url, max_posts_per_profile=10, watermark=None, timing=None):
+        """HTML of a profile's recent activity page
+        
+        Waits until the first post is on the page, then scrolls only while
+        scrolling loads more posts, and stops once ``max_posts_per_profile``
+        posts are loaded or the oldest loaded post is not newer than
+        ``watermark``. ``timing`` gets when the first post appeared, how many
+        scrolls were needed and how many posts were loaded.
+        """
+        if timing is None:
+            timing = {}
+        if self.fixtures_dir is not None:
+            with open(self.fixture_path(profile_url), 'r', encoding='utf-8') as file:
+                return file.read()
+        
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        logger.info('Scraping profile: %s', profile_url)
+        previous = activity_number(watermark)
+        
+        with self.browser_pool.session() as driver:
+            started = time.monotonic()
+            
+            # Navigate to profile activity page
+            activity_url = f"{profile_url}/recent-activity/"
+            driver.get(activity_url)
+            
             try:
-                driver.quit()
-            except:
-                pass
+                WebDriverWait(driver, self.page_timeout, self.wait_poll).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.post_selector))
+                )
+            except TimeoutException:
+                # No posts, or LinkedIn served a login wall
+                timing['posts'] = 0
+                return driver.page_source
+            timing['first_post'] = time.monotonic() - started
+            
+            posts = driver.find_elements(By.CSS_SELECTOR, self.post_selector)
+            for _ in range(self.max_scrolls):
+                if len(posts) >= max_posts_per_profile:
+                    break
+                if previous is not None:
+                    oldest = activity_number(posts[-1].get_attribute('data-id'))
+                    if oldest is not None and oldest <= previous:
+                        break
                 
-        # If no jobs found, return mock data
-        if not all_jobs:
-            return self.get_mock_jobs()
+                # Scroll to load more posts
+                loaded = len(posts)
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                timing['scrolls'] = timing.get('scrolls', 0) + 1
+                try:
+                    WebDriverWait(driver, self.scroll_timeout, self.wait_poll).until(
+                        lambda d: len(d.find_elements(By.CSS_SELECTOR, self.post_selector)) > loaded
+                    )
+                except TimeoutException:
+                    # End of the activity feed
+                    break
+                posts = driver.find_elements(By.CSS_SELECTOR, self.post_selector)
             
-        return all_jobs[:20]  # Return max 20 jobs
+            timing['posts'] = len(posts)
+            return driver.page_source
+    
+    def parse_activity_posts(self, html):
+        """(post_id, text) for every post on an activity page, in page order (newest first)"""
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        posts = []
+        for post in soup.select(self.post_selector):
+            # Line breaks where the browser would render them, as WebElement.text does
+            for tag in post.find_all(('br', 'p', 'div', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')):
+                tag.insert_after('\n')
+            lines = (' '.join(line.split()) for line in post.get_text().split('\n'))
+            posts.append((post['data-id'], '\n'.join(line for line in lines if line)))
+        
+        return posts
+    
+    def jobs_from_posts(self, profile_url, posts, max_posts_per_profile=10, watermark=None):
+        """Job postings among the posts newer than ``watermark``; returns (jobs, new watermark)"""
+        previous = newest = activity_number(watermark)
+        new_posts = []
+        
+        for post_id, post_text in posts:
+            number = activity_number(post_id)
+            if number is not None:
+                # Scraped by an earlier refresh
+                if previous is not None and number <= previous:
+                    continue
+                if newest is None or number > newest:
+                    newest, watermark = number, post_id
+            new_posts.append((post_id, post_text))
+        
+        jobs = []
+        for post_id, post_text in new_posts[:max_posts_per_profile]:
+            try:
+                # Check if post contains job-related keywords
+                if any(keyword in post_text.lower() for keyword in self.job_keywords):
+                    # Extract job details
+                    job_data = self.extract_job_details(post_text)
+                    if job_data and job_data['title'] and job_data['description']:
+                        job_data['source_profile'] = profile_url
+                        job_data['post_id'] = post_id
+                        job_data['scraped_at'] = datetime.now().isoformat()
+                        jobs.append(job_data)
+                        
+            except Exception as e:
+                logger.warning('Error processing post: %s', e)
+                continue
+        
+        return jobs, watermark
     
     def extract_job_details(self, post_text):
         """Extract job details from post text"""
@@ -243,94 +893,793 @@ class LinkedInJobScraper:
             }
         ]
 
+class JobCache:
+    """SQLite cache of scraped LinkedIn job postings.
+
+    Request handlers only read ``jobs()``; LinkedInJobRefresher fills it. Each
+    profile row keeps a watermark (the newest post already scraped), when it
+    was last scraped and a claim lease, so worker processes split the due
+    profiles between them and a refresh that died is picked up again once its
+    lease runs out. Postings expire ``ttl`` seconds after they were scraped.
+    """
+
+    def __init__(self, db_path, ttl=72 * 3600, max_jobs=20):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_jobs = max_jobs
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across forks and threads
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        if not self._schema_ready:
+            # Created on first use, so importing the module opens no database
+            with self._schema_lock:
+                if not self._schema_ready:
+                    with connection:
+                        self._create_schema(connection)
+                    self._schema_ready = True
+        return connection
+
+    @staticmethod
+    def _create_schema(connection):
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS linkedin_jobs ('
+            'source_profile TEXT NOT NULL, post_id TEXT NOT NULL, data TEXT NOT NULL, scraped_at REAL NOT NULL, '
+            'PRIMARY KEY (source_profile, post_id))'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS linkedin_jobs_scraped_at ON linkedin_jobs (scraped_at)')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS linkedin_profiles ('
+            'profile_url TEXT PRIMARY KEY, watermark TEXT, last_scraped_at REAL, claimed_until REAL, '
+            'last_error TEXT, last_duration REAL)'
+        )
+
+    def jobs(self):
+        """Unexpired postings, most recently scraped first (page order within a scrape)"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                'SELECT data FROM linkedin_jobs WHERE scraped_at >= ? ORDER BY scraped_at DESC, rowid LIMIT ?',
+                (time.time() - self.ttl, self.max_jobs)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def claim_due(self, profile_urls, refresh_interval, lease=600):
+        """Claim the profiles not scraped within ``refresh_interval`` seconds that
+        no other worker is scraping; returns {profile_url: watermark}"""
+        now = time.time()
+        claimed = {}
+
+        with self._connect() as connection:
+            connection.executemany(
+                'INSERT OR IGNORE INTO linkedin_profiles (profile_url) VALUES (?)', [(url,) for url in profile_urls]
+            )
+            for profile_url in profile_urls:
+                # Only one worker wins the update while the claim is unexpired
+                if connection.execute(
+                    'UPDATE linkedin_profiles SET claimed_until = ? WHERE profile_url = ? '
+                    'AND (last_scraped_at IS NULL OR last_scraped_at <= ?) '
+                    'AND (claimed_until IS NULL OR claimed_until < ?)',
+                    (now + lease, profile_url, now - refresh_interval, now)
+                ).rowcount:
+                    claimed[profile_url] = connection.execute(
+                        'SELECT watermark FROM linkedin_profiles WHERE profile_url = ?', (profile_url,)
+                    ).fetchone()[0]
+
+        return claimed
+
+    def store(self, profile_url, jobs, watermark, duration):
+        """Add a profile's newly scraped postings and move its watermark"""
+        now = time.time()
+
+        with self._connect() as connection:
+            connection.executemany(
+                'INSERT OR IGNORE INTO linkedin_jobs (source_profile, post_id, data, scraped_at) VALUES (?, ?, ?, ?)',
+                [(profile_url, job['post_id'], json.dumps(job), now) for job in jobs]
+            )
+            connection.execute(
+                'UPDATE linkedin_profiles SET watermark = ?, last_scraped_at = ?, claimed_until = NULL, '
+                'last_error = NULL, last_duration = ? WHERE profile_url = ?',
+                (watermark, now, duration, profile_url)
+            )
+            connection.execute('DELETE FROM linkedin_jobs WHERE scraped_at < ?', (now - self.ttl,))
+
+    def release(self, profile_url, error):
+        """Give up a claimed profile after a failed scrape; it is retried when next due"""
+        with self._connect() as connection:
+            connection.execute(
+                'UPDATE linkedin_profiles SET last_scraped_at = ?, claimed_until = NULL, last_error = ? '
+                'WHERE profile_url = ?',
+                (time.time(), error, profile_url)
+            )
+
+    def last_refresh(self):
+        """When any profile was last scraped (epoch seconds), or None if none ever was"""
+        with self._connect() as connection:
+            return connection.execute('SELECT MAX(last_scraped_at) FROM linkedin_profiles').fetchone()[0]
+
+    def stats(self):
+        with self._connect() as connection:
+            jobs = connection.execute(
+                'SELECT COUNT(*) FROM linkedin_jobs WHERE scraped_at >= ?', (time.time() - self.ttl,)
+            ).fetchone()[0]
+            profiles = connection.execute(
+                'SELECT profile_url, watermark, last_scraped_at, last_error, last_duration '
+                'FROM linkedin_profiles ORDER BY profile_url'
+            ).fetchall()
+
+        return {
+            'jobs': jobs,
+            'profiles': [{
+                'profile_url': profile_url,
+                'watermark': watermark,
+                'last_scraped_at': datetime.fromtimestamp(last_scraped_at).isoformat() if last_scraped_at else None,
+                'last_error': last_error,
+                'last_duration': round(last_duration, 2) if last_duration is not None else None
+            } for profile_url, watermark, last_scraped_at, last_error, last_duration in profiles]
+        }
+
+JOB_CACHE = JobCache(app.config['JOB_CACHE_DB'], app.config['JOB_CACHE_TTL_HOURS'] * 3600)
+
+class LinkedInJobRefresher:
+    """Background thread that keeps the job cache fresh in this process.
+
+    Every ``poll_interval`` seconds it claims the profiles that are due (not
+    scraped for ``refresh_interval`` seconds) and scrapes them, storing each
+    profile as soon as it is done. Claims go through JobCache, so several
+    worker processes never scrape the same profile at once.
+
+    With a ``lock_path``, only the process holding an exclusive lock on that
+    file refreshes, so a host runs one scraper however many workers started
+    the thread. The others keep trying, and one takes over when the holder
+    exits.
+    """
+
+    def __init__(self, job_cache, profile_urls, refresh_interval, max_posts_per_profile=10, fixtures_dir=None,
+                 poll_interval=60, lease=600, browser_pool=None, lock_path=None):
+        self.job_cache = job_cache
+        self.profile_urls = profile_urls
+        self.refresh_interval = refresh_interval
+        self.max_posts_per_profile = max_posts_per_profile
+        self.fixtures_dir = fixtures_dir
+        self.browser_pool = browser_pool or BROWSER_POOL
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.lock_path = lock_path
+        self._lock_file = None
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        with self._lock:
+            # Threads don't survive a fork, so a forked worker starts its own
+            if self._started_pid == os.getpid() or self.refresh_interval <= 0:
+                return
+            self._started_pid = os.getpid()
+            threading.Thread(target=self.run_forever, daemon=True).start()
+
+    def refresh(self, force=False):
+        """Scrape the due profiles (all unclaimed ones with ``force``); returns
+        {profile_url: number of new jobs, or the error}"""
+        watermarks = self.job_cache.claim_due(self.profile_urls, 0 if force else self.refresh_interval, self.lease)
+        results = {}
+        if not watermarks:
+            return results
+
+        scraper = SCRAPERS.get('linkedin')(self.fixtures_dir, self.browser_pool)
+        try:
+            for profile_url, jobs, watermark, error in scraper.scrape_profiles(
+                list(watermarks), self.max_posts_per_profile, watermarks
+            ):
+                timing = scraper.timings[profile_url]
+                if error is None:
+                    self.job_cache.store(profile_url, jobs, watermark, timing['seconds'])
+                else:
+                    self.job_cache.release(profile_url, error)
+                results[profile_url] = error if error is not None else len(jobs)
+                METRICS.observe('ats_linkedin_scrape_duration_seconds', timing['seconds'],
+                                outcome='ok' if error is None else 'error')
+                if timing['first_post'] is not None:
+                    logger.info('Scraped %s in %.1fs: first post after %.1fs, %d posts, %d scrolls', profile_url,
+                                timing['seconds'], timing['first_post'], timing['posts'], timing['scrolls'])
+        except Exception as e:
+            # The browser itself failed; the rest are retried when next due
+            logger.error('Error refreshing LinkedIn jobs: %s', e)
+            for profile_url in watermarks:
+                if profile_url not in results:
+                    self.job_cache.release(profile_url, str(e))
+                    results[profile_url] = str(e)
+
+        return results
+
+    def status(self):
+        """Whether some process is keeping the job cache fresh, judged by when a
+        profile was last scraped: 'stale' after two refresh intervals without a
+        scrape, 'never' if none ever was, 'disabled' with no refresh interval"""
+        last_refresh = self.job_cache.last_refresh()
+        if self.refresh_interval <= 0:
+            state = 'disabled'
+        elif last_refresh is None:
+            state = 'never'
+        elif time.time() - last_refresh > 2 * self.refresh_interval + self.poll_interval:
+            state = 'stale'
+        else:
+            state = 'fresh'
+        return {
+            'state': state,
+            'last_refresh': datetime.fromtimestamp(last_refresh).isoformat() if last_refresh else None,
+            'in_workers': app.config['LINKEDIN_REFRESH_IN_WORKERS']
+        }
+
+    def holds_lock(self):
+        """Whether this process is the one that refreshes (see lock_path)"""
+        if self.lock_path is None or fcntl is None:
+            return True
+        try:
+            if self._lock_file is None:
+                self._lock_file = open(self.lock_path, 'a')
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def run_forever(self):
+        while True:
+            if not self.holds_lock():
+                time.sleep(self.poll_interval)
+                continue
+            try:
+                results = self.refresh()
+                if results:
+                    logger.info('Refreshed LinkedIn jobs: %s', results)
+            except sqlite3.Error as e:
+                logger.error('Error refreshing LinkedIn jobs: %s', e)
+            # Don't keep browsers open until the next refresh is due
+            self.browser_pool.close_idle()
+            time.sleep(self.poll_interval)
+
+JOB_REFRESHER = LinkedInJobRefresher(
+    JOB_CACHE,
+    TRUSTED_LINKEDIN_PROFILES,
+    app.config['LINKEDIN_REFRESH_INTERVAL'],
+    app.config['LINKEDIN_MAX_POSTS_PER_PROFILE'],
+    app.config['LINKEDIN_FIXTURES_DIR'],
+    lock_path=app.config['JOB_CACHE_DB'] + '.refresh.lock'
+)
+
+def cached_linkedin_jobs():
+    """Job postings for the request handlers, read from the job cache
+    
+    Never launches a browser. Until the first refresh has stored any postings
+    (or if none are left), the sample jobs are used, as when scraping fails.
+    """
+    try:
+        with trace_stage('scrape'):
+            jobs = JOB_CACHE.jobs()
+    except sqlite3.Error as e:
+        logger.error('Error reading LinkedIn job cache: %s', e)
+        jobs = []
+    
+    return jobs or LinkedInJobScraper().get_mock_jobs()
+
+class SkillSimilarityMatrix:
+    """fuzz.ratio scores for every (requirement, resume skill) pair in a request.
+
+    The distinct lowercased requirements and skills of the whole request are
+    scored in one batch, so scoring a candidate against a job only needs to
+    look up rows and columns instead of calling fuzz.ratio per pair.
+    """
+
+    def __init__(self, requirements, skills):
+        self.requirement_rows = {req: row for row, req in enumerate(dict.fromkeys(requirements))}
+        self.skill_columns = {skill: col for col, skill in enumerate(dict.fromkeys(skills))}
+        self.scores = self._score(list(self.requirement_rows), list(self.skill_columns))
+
+    @staticmethod
+    def _score(requirements, skills):
+        if not requirements or not skills:
+            return np.zeros((len(requirements), len(skills)), dtype=np.uint8)
+
+        if cdist is not None:
+            # rapidfuzz returns unrounded percentages; fuzz.ratio rounds to int
+            scores = cdist(requirements, skills, scorer=batch_ratio, dtype=np.float32)
+            return np.rint(scores).astype(np.uint8)
+
+        from fuzzywuzzy import fuzz
+        
+        scores = np.empty((len(requirements), len(skills)), dtype=np.uint8)
+        for row, req in enumerate(requirements):
+            for col, skill in enumerate(skills):
+                scores[row, col] = fuzz.ratio(req, skill)
+        return scores
+
+    def columns(self, skills):
+        """Column indices for lowercased resume skills, or None if any is unknown"""
+        try:
+            return np.fromiter((self.skill_columns[skill] for skill in skills), dtype=np.intp, count=len(skills))
+        except KeyError:
+            return None
+
+    def best_match(self, requirement, columns):
+        """Return (score, position in columns) of the most similar skill, first one on ties"""
+        row = self.requirement_rows.get(requirement)
+        if row is None or columns is None or len(columns) == 0:
+            return None
+        scores = self.scores[row, columns]
+        position = int(np.argmax(scores))
+        return int(scores[position]), position
+
+class MatchScoreMatrix:
+    """Dense candidate x job matrix of total scores plus compact per-cell details.
+
+    ``scores`` is a NumPy array that rankings can argsort directly; the rest of
+    each calculate_advanced_match_score result is kept as a tuple per cell and
+    only turned back into a dict for rows that are actually returned.
+    """
+
+    detail_fields = ('exact_score', 'fuzzy_score', 'semantic_score', 'matched_skills',
+                     'missing_skills', 'total_required', 'total_matched')
+
+    def __init__(self, rows, columns):
+        self.scores = np.zeros((rows, columns), dtype=np.float64)
+        self._details = [None] * (rows * columns)
+
+    def set(self, row, column, match_result):
+        self.scores[row, column] = match_result['total_score']
+        self._details[row * self.scores.shape[1] + column] = tuple(
+            match_result[field] for field in self.detail_fields
+        )
+
+    @classmethod
+    def from_rows(cls, rows, columns):
+        """Build a matrix from per-row lists of match results"""
+        score_matrix = cls(len(rows), columns)
+        for row, match_results in enumerate(rows):
+            for column, match_result in enumerate(match_results):
+                score_matrix.set(row, column, match_result)
+        return score_matrix
+
+    def result(self, row, column):
+        """Rebuild the calculate_advanced_match_score result for one cell"""
+        match_result = dict(zip(self.detail_fields, self._details[row * self.scores.shape[1] + column]))
+        match_result['total_score'] = float(self.scores[row, column])
+        return match_result
+
+def top_k_indices(scores, k=None, offset=0):
+    """Indices of the k highest scores after the first offset, best first; ties
+    keep their original order
+    
+    Matches a stable ``sort(reverse=True)`` followed by ``[offset:offset + k]``
+    but only fully sorts the entries that can make the cut.
+    """
+    if offset:
+        return top_k_indices(scores, None if k is None else offset + k)[offset:]
+    
+    scores = np.asarray(scores)
+    n = len(scores)
+    
+    if k is None or k >= n:
+        return np.argsort(-scores, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    kth_largest = np.partition(scores, n - k)[n - k]
+    
+    # Everything above the k-th score makes the cut; of the rows tied with it,
+    # the earliest ones fill the remaining places, as a stable sort would do
+    above = np.flatnonzero(scores > kth_largest)
+    tied = np.flatnonzero(scores == kth_largest)[:k - len(above)]
+    return np.concatenate([above[np.argsort(-scores[above], kind='stable')], tied])
+
+BYTE_POPCOUNTS = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+def popcount_rows(words):
+    """Number of set bits in each row of a 2-D uint64 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        counts = np.bitwise_count(words)
+    else:
+        counts = BYTE_POPCOUNTS[np.ascontiguousarray(words).view(np.uint8)]
+    
+    # Rows are only a few words wide, so adding whole columns beats sum(axis=1)
+    total = counts[:, 0].astype(np.int64)
+    for column in range(1, counts.shape[1]):
+        total += counts[:, column]
+    return total
+
+class SkillBitsetMatrix:
+    """Resumes as fixed-width bitsets over one taxonomy version.
+
+    Row i holds ceil(skills / 64) uint64 words with bit ``id`` set for each
+    canonical skill ID of resume i, plus a second bitset over the words of
+    the taxonomy's skill names. The exact-match count of every resume against
+    a job is then a single popcount of ``skill_bits & job_bits``, and the word
+    overlap used by the semantic score is another, instead of one set
+    intersection per pair. Skills the taxonomy doesn't know get no bit; job
+    requirements are canonical after extraction, so exact matching is the same.
+    """
+
+    def __init__(self, taxonomy, capacity=1024):
+        self.taxonomy = taxonomy
+        self.word_ids = {}
+        for term in taxonomy.term_ids:
+            for word in term.split():
+                self.word_ids.setdefault(word, len(self.word_ids))
+
+        self.skill_bits = np.zeros((capacity, (len(taxonomy.skill_names) + 63) // 64), dtype=np.uint64)
+        self.word_bits = np.zeros((capacity, (len(self.word_ids) + 63) // 64), dtype=np.uint64)
+        self.rows = 0
+
+    @staticmethod
+    def encode(ids, width):
+        """Bitset of ``width`` uint64 words with the given bit positions set"""
+        bits = np.zeros(width, dtype=np.uint64)
+        ids = np.fromiter(ids, dtype=np.uint64)
+        np.bitwise_or.at(bits, (ids >> np.uint64(6)).astype(np.intp), np.left_shift(np.uint64(1), ids & np.uint64(63)))
+        return bits
+
+    def _word_positions(self, words):
+        return [self.word_ids[word] for word in words if word in self.word_ids]
+
+    def set_rows(self, rows, skill_lists):
+        """Encode each resume's skill list into its row, growing the matrix if needed"""
+        if not rows:
+            return
+
+        needed = max(rows) + 1
+        if needed > len(self.skill_bits):
+            capacity = max(needed, 2 * len(self.skill_bits))
+            for name in ('skill_bits', 'word_bits'):
+                grown = np.zeros((capacity, getattr(self, name).shape[1]), dtype=np.uint64)
+                grown[:self.rows] = getattr(self, name)[:self.rows]
+                setattr(self, name, grown)
+
+        rows = np.asarray(rows, dtype=np.intp)
+        self.skill_bits[rows] = 0
+        self.word_bits[rows] = 0
+
+        # Set every (row, bit) pair of the batch in one scatter per bitset
+        skill_rows, skill_positions, word_rows, word_positions = [], [], [], []
+        for row, skills in zip(rows.tolist(), skill_lists):
+            ids = self.taxonomy.skill_ids(skills)
+            skill_rows.extend([row] * len(ids))
+            skill_positions.extend(ids)
+            words = self._word_positions(set(' '.join(skills).lower().split()))
+            word_rows.extend([row] * len(words))
+            word_positions.extend(words)
+
+        for bits, bit_rows, positions in ((self.skill_bits, skill_rows, skill_positions),
+                                          (self.word_bits, word_rows, word_positions)):
+            positions = np.array(positions, dtype=np.uint64)
+            np.bitwise_or.at(
+                bits, (np.array(bit_rows, dtype=np.intp), (positions >> np.uint64(6)).astype(np.intp)),
+                np.left_shift(np.uint64(1), positions & np.uint64(63))
+            )
+
+        self.rows = max(self.rows, needed)
+
+    def append(self, skill_lists):
+        """Encode resumes' skill lists into new rows; returns the first new row"""
+        first = self.rows
+        self.set_rows(list(range(first, first + len(skill_lists))), skill_lists)
+        return first
+
+    def exact_counts(self, job_requirements):
+        """Distinct canonical requirements each resume has, like the exact-match set intersection"""
+        job_bits = self.encode(self.taxonomy.skill_ids(job_requirements), self.skill_bits.shape[1])
+        return popcount_rows(self.skill_bits[:self.rows] & job_bits)
+
+    def word_counts(self, words):
+        """Words of ``words`` that appear in each resume's skill names"""
+        job_bits = self.encode(self._word_positions(set(words)), self.word_bits.shape[1])
+        return popcount_rows(self.word_bits[:self.rows] & job_bits)
+
+    def exact_scores(self, job_requirements):
+        """calculate_advanced_match_score's exact_score (unrounded) for every row"""
+        if not job_requirements:
+            return np.zeros(self.rows)
+        term_ids = self.taxonomy.term_ids
+        required = len({term_ids.get(key, key) for key in (req.lower().strip() for req in job_requirements)})
+        return (self.exact_counts(job_requirements) / required) * 100
+
+    def top_k(self, job_requirements, k):
+        """(rows, exact scores) of the k best rows by exact score, ties in row order"""
+        scores = self.exact_scores(job_requirements)
+        rows = top_k_indices(scores, k)
+        return rows, scores[rows]
+
+class JobRequirementIndex:
+    """Per-job lookup structures for calculate_advanced_match_score.
+
+    Holds the lowercased requirements, their canonical keys (skill ID, or the
+    string for free text) and the description's word set, so scoring many
+    resumes against one job computes them once.
+    """
+
+    __slots__ = ('lower', 'keys', 'key_set', 'words')
+
+    def __init__(self, requirements, description, taxonomy):
+        self.lower = [req.lower().strip() for req in requirements]
+        self.keys = [taxonomy.term_ids.get(req, req) for req in self.lower]
+        self.key_set = frozenset(self.keys)
+        self.words = frozenset((description or '').lower().split())
+
+class ResumeSkillIndex:
+    """Per-resume counterpart of JobRequirementIndex: the lowercased skills,
+    their canonical keys and the words of the skill names, so scoring one
+    resume against many jobs computes them once."""
+
+    __slots__ = ('skills', 'lower', 'keys', 'key_set', 'words')
+
+    def __init__(self, skills, taxonomy):
+        self.skills = skills
+        self.lower = [skill.lower().strip() for skill in skills]
+        self.keys = [taxonomy.term_ids.get(skill, skill) for skill in self.lower]
+        self.key_set = frozenset(self.keys)
+        self.words = frozenset(' '.join(skills).lower().split())
+
+PreparedJobs = namedtuple('PreparedJobs', ['jobs', 'requirement_lists', 'requirement_indexes', 'similarity', 'taxonomy',
+                                           'vectorizer', 'job_vectors'])
+
 class JobMatcher:
     def __init__(self):
         """Initialize the job matcher"""
         pass
+    
+    def build_similarity_matrix(self, resume_skill_lists, requirement_lists, taxonomy=None):
+        """Batch-score every free-text requirement against every resume skill of a request"""
+        if taxonomy is None:
+            taxonomy = SKILL_TAXONOMY.current()
+        
+        # Requirements with a canonical skill ID never reach fuzzy matching
+        requirements = [req.lower().strip() for reqs in requirement_lists for req in reqs]
+        requirements = [req for req in requirements if req not in taxonomy.term_ids]
+        skills = [skill.lower().strip() for skills in resume_skill_lists for skill in skills]
+        
+        return SkillSimilarityMatrix(requirements, skills)
         
-    def calculate_advanced_match_score(self, resume_skills, job_requirements, job_description=""):
-        """Calculate advanced match score using multiple algorithms"""
+    def calculate_advanced_match_score(self, resume_skills, job_requirements, job_description="", taxonomy=None,
+                                       similarity=None, requirement_index=None, semantic_score=None,
+                                       resume_index=None):
+        """Calculate advanced match score using multiple algorithms
+        
+        ``similarity`` is an optional SkillSimilarityMatrix built for the whole
+        request; without it fuzzy scores are computed pair by pair.
+        ``requirement_index`` is an optional JobRequirementIndex for this job
+        and description, so repeated scoring against one job skips rebuilding it.
+        ``resume_index`` is the same for the resume (a ResumeSkillIndex).
+        ``semantic_score`` is this pair's precomputed TF-IDF score (see
+        semantic_scores); without it the semantic part is the word overlap.
+        """
         
         if not resume_skills:
             resume_skills = []
         if not job_requirements:
             job_requirements = []
+        if taxonomy is None:
+            taxonomy = SKILL_TAXONOMY.current()
             
-        # Convert to lowercase for matching
-        resume_skills_lower = [skill.lower().strip() for skill in resume_skills]
-        job_req_lower = [req.lower().strip() for req in job_requirements]
+        if requirement_index is None:
+            requirement_index = JobRequirementIndex(job_requirements, job_description, taxonomy)
+        if resume_index is None:
+            resume_index = ResumeSkillIndex(resume_skills, taxonomy)
+        similarity_columns = similarity.columns(resume_index.lower) if similarity is not None else None
         
-        # 1. Exact matching score
-        exact_matches = set(resume_skills_lower) & set(job_req_lower)
-        exact_score = (len(exact_matches) / len(job_req_lower)) * 100 if job_req_lower else 0
+        exact_matches, fuzzy_matched_keys, matched_requirements = self._match(
+            resume_index, requirement_index, similarity, similarity_columns
+        )
+        exact_score, fuzzy_score, semantic_score, combined_score = self._scores(
+            resume_index, requirement_index, len(exact_matches), len(matched_requirements), semantic_score
+        )
         
-        # 2. Fuzzy matching for similar skills
-        fuzzy_matches = 0
-        fuzzy_matched_skills = []
+        # Find missing skills
+        all_matched = exact_matches | set(fuzzy_matched_keys)
+        missing_skills = [skill for index, skill in enumerate(job_requirements) if index not in matched_requirements]
+        matched_skills = [skill for skill, key in zip(resume_skills, resume_index.keys) if key in all_matched]
         
-        for job_req in job_req_lower:
+        return {
+            'total_score': round(combined_score, 2),
+            'exact_score': round(exact_score, 2),
+            'fuzzy_score': round(fuzzy_score, 2),
+            'semantic_score': round(semantic_score, 2),
+            'matched_skills': matched_skills,
+            'missing_skills': missing_skills,
+            'total_required': len(job_requirements),
+            'total_matched': len(all_matched)
+        }
+    
+    def match_score(self, resume_index, requirement_index, similarity=None, similarity_columns=None,
+                    semantic_score=None):
+        """The total_score calculate_advanced_match_score would return, without
+        building the rest of its result; for ranking before the page is known"""
+        exact_matches, _, matched_requirements = self._match(
+            resume_index, requirement_index, similarity, similarity_columns
+        )
+        return round(self._scores(
+            resume_index, requirement_index, len(exact_matches), len(matched_requirements), semantic_score
+        )[3], 2)
+    
+    def _match(self, resume_index, requirement_index, similarity, similarity_columns):
+        """(exactly matched keys, fuzzily matched keys, positions of matched requirements)"""
+        # Skills are keyed by canonical ID where the taxonomy knows them, so aliases
+        # like 'postgres'/'postgresql' are the same skill; free text keeps its string
+        resume_keys = resume_index.keys
+        resume_key_set = resume_index.key_set
+        
+        # 1. Exact matching
+        exact_matches = resume_key_set & requirement_index.key_set
+        
+        # 2. Fuzzy matching for similar skills. Canonical requirements are decided
+        # by the ID lookup alone; only free-text requirements are compared fuzzily
+        fuzzy_matched_keys = []
+        matched_requirements = set()
+        
+        for index, (job_req, job_key) in enumerate(zip(requirement_index.lower, requirement_index.keys)):
+            if job_key in resume_key_set:
+                fuzzy_matched_keys.append(job_key)
+                matched_requirements.add(index)
+                continue
+            
+            if isinstance(job_key, int):
+                continue
+            
             best_match_score = 0
-            best_match_skill = ""
+            best_match_key = None
             
-            for resume_skill in resume_skills_lower:
-                similarity = fuzz.ratio(job_req, resume_skill)
-                if similarity > best_match_score:
-                    best_match_score = similarity
-                    best_match_skill = resume_skill
+            batch_match = similarity.best_match(job_req, similarity_columns) if similarity is not None else None
+            if batch_match is not None:
+                best_match_score, position = batch_match
+                best_match_key = resume_keys[position]
+            else:
+                from fuzzywuzzy import fuzz
+                
+                for resume_skill, resume_key in zip(resume_index.lower, resume_keys):
+                    ratio = fuzz.ratio(job_req, resume_skill)
+                    if ratio > best_match_score:
+                        best_match_score = ratio
+                        best_match_key = resume_key
                     
             if best_match_score >= 80:  # 80% similarity threshold
-                fuzzy_matches += 1
-                fuzzy_matched_skills.append(best_match_skill)
+                fuzzy_matched_keys.append(best_match_key)
+                matched_requirements.add(index)
         
-        fuzzy_score = (fuzzy_matches / len(job_req_lower)) * 100 if job_req_lower else 0
+        return exact_matches, fuzzy_matched_keys, matched_requirements
+    
+    @staticmethod
+    def _scores(resume_index, requirement_index, exact_matches, fuzzy_matches, semantic_score):
+        """Unrounded (exact, fuzzy, semantic, combined) scores from the match counts"""
+        required = len(requirement_index.lower)
         
-        # 3. Semantic similarity using simple word overlap (without sklearn for now)
-        semantic_score = 0
-        if job_description and resume_skills:
-            try:
-                # Simple word overlap scoring
-                job_words = set(job_description.lower().split())
-                resume_words = set(' '.join(resume_skills).lower().split())
-                common_words = job_words.intersection(resume_words)
-                if len(job_words) > 0:
-                    semantic_score = (len(common_words) / len(job_words)) * 100
-            except:
-                semantic_score = 0
+        # Requirements that are aliases of one skill count once in the exact
+        # score, like the resume skills they are matched against
+        exact_score = (exact_matches / len(requirement_index.key_set)) * 100 if required else 0
+        fuzzy_score = (fuzzy_matches / required) * 100 if required else 0
+        
+        # 3. Semantic similarity: TF-IDF cosine when given, else simple word overlap
+        if semantic_score is not None:
+            semantic_score = float(semantic_score)
+        else:
+            semantic_score = 0
+            job_words = requirement_index.words
+            if job_words and resume_index.skills:
+                semantic_score = (len(job_words & resume_index.words) / len(job_words)) * 100
         
         # Combined score (weighted average)
         combined_score = (exact_score * 0.5) + (fuzzy_score * 0.3) + (semantic_score * 0.2)
+        return exact_score, fuzzy_score, semantic_score, combined_score
+    
+    def job_requirements(self, job):
+        """Return a job's requirements as a list"""
+        job_skills = job.get('requirements', [])
+        if isinstance(job_skills, str):
+            job_skills = [job_skills]
+        return job_skills
+    
+    def prepare_jobs(self, jobs, taxonomy=None, resume_skill_lists=None):
+        """Precompute per-job requirement indexes and fuzzy scores for score_resume
         
-        # Find missing skills
-        all_matched = set(exact_matches) | set(fuzzy_matched_skills)
-        missing_skills = [skill for skill in job_requirements if skill.lower() not in all_matched]
-        matched_skills = [skill for skill in resume_skills if skill.lower() in all_matched]
+        With resume_skill_lists the similarity matrix covers exactly those
+        skills; without it (resumes still arriving) it covers the taxonomy's
+        canonical names, which is what extract_skills_and_keywords returns.
+        """
+        if taxonomy is None:
+            taxonomy = SKILL_TAXONOMY.current()
+        if resume_skill_lists is None:
+            resume_skill_lists = [taxonomy.skill_names]
         
-        return {
-            'total_score': round(combined_score, 2),
-            'exact_score': round(exact_score, 2),
-            'fuzzy_score': round(fuzzy_score, 2),
-            'semantic_score': round(semantic_score, 2),
-            'matched_skills': matched_skills,
-            'missing_skills': missing_skills,
-            'total_required': len(job_requirements),
-            'total_matched': len(all_matched)
-        }
+        requirement_lists = [self.job_requirements(job) for job in jobs]
+        requirement_indexes = [
+            JobRequirementIndex(job_skills, job.get('description', ''), taxonomy)
+            for job, job_skills in zip(jobs, requirement_lists)
+        ]
+        similarity = self.build_similarity_matrix(resume_skill_lists, requirement_lists, taxonomy)
+        
+        # With TF-IDF semantic scoring, every job description is vectorized once
+        vectorizer = SEMANTIC_MODEL.current()
+        job_vectors = None
+        if vectorizer is not None:
+            job_vectors = semantic_vectors(vectorizer, [job.get('description', '') for job in jobs])
+        
+        return PreparedJobs(jobs, requirement_lists, requirement_indexes, similarity, taxonomy, vectorizer, job_vectors)
+    
+    def score_resume(self, resume_skills, prepared_jobs, semantic_row=None):
+        """Score one resume against every prepared job; returns results in job order
+        
+        ``semantic_row`` holds this resume's TF-IDF scores for every job when
+        they were computed for a whole batch (see score_matrix).
+        """
+        if semantic_row is None and prepared_jobs.vectorizer is not None:
+            semantic_row = semantic_scores(prepared_jobs.vectorizer, [resume_skills], prepared_jobs.job_vectors)[0]
+        if semantic_row is None:
+            semantic_row = [None] * len(prepared_jobs.jobs)
+        resume_index = ResumeSkillIndex(resume_skills or [], prepared_jobs.taxonomy)
+        
+        return [
+            self.calculate_advanced_match_score(
+                resume_skills, job_skills, job.get('description', ''), prepared_jobs.taxonomy,
+                prepared_jobs.similarity, requirement_index, semantic_score, resume_index
+            )
+            for job, job_skills, requirement_index, semantic_score in zip(
+                prepared_jobs.jobs, prepared_jobs.requirement_lists, prepared_jobs.requirement_indexes, semantic_row
+            )
+        ]
     
-    def rank_jobs(self, resume_skills, jobs):
-        """Rank jobs based on match score"""
+    def score_matrix(self, resume_skill_lists, jobs, taxonomy=None):
+        """Score every resume against every job once, as a MatchScoreMatrix"""
+        prepared_jobs = self.prepare_jobs(jobs, taxonomy, resume_skill_lists)
+        
+        # All resume x job TF-IDF scores come from one sparse matrix product
+        semantic_rows = [None] * len(resume_skill_lists)
+        if prepared_jobs.vectorizer is not None:
+            semantic_rows = semantic_scores(prepared_jobs.vectorizer, resume_skill_lists, prepared_jobs.job_vectors)
+        
+        return MatchScoreMatrix.from_rows(
+            [self.score_resume(resume_skills, prepared_jobs, semantic_row)
+             for resume_skills, semantic_row in zip(resume_skill_lists, semantic_rows)],
+            len(jobs)
+        )
+    
+    def rank_jobs(self, resume_skills, jobs, taxonomy=None, k=10, offset=0):
+        """Rank jobs based on match score; returns jobs offset to offset + k
+        
+        Every job is scored first (match_score) and the scores go into one
+        array for top-k selection. Only the jobs on the returned page get the
+        full calculate_advanced_match_score result and a copied result dict.
+        """
+        if taxonomy is None:
+            taxonomy = SKILL_TAXONOMY.current()
         ranked_jobs = []
         
-        for job in jobs:
-            # Extract skills from job requirements and description
-            job_skills = job.get('requirements', [])
-            if isinstance(job_skills, str):
-                job_skills = [job_skills]
-                
-            job_description = job.get('description', '')
-            
-            # Calculate match score
+        # Extract skills from job requirements and score all fuzzy pairs in one batch
+        job_requirement_lists = [self.job_requirements(job) for job in jobs]
+        requirement_indexes = [
+            JobRequirementIndex(job_skills, job.get('description', ''), taxonomy)
+            for job, job_skills in zip(jobs, job_requirement_lists)
+        ]
+        similarity = self.build_similarity_matrix([resume_skills], job_requirement_lists, taxonomy)
+        resume_index = ResumeSkillIndex(resume_skills or [], taxonomy)
+        similarity_columns = similarity.columns(resume_index.lower)
+        
+        # TF-IDF scores for every job in one batch, when enabled
+        semantic_row = [None] * len(jobs)
+        vectorizer = SEMANTIC_MODEL.current()
+        if vectorizer is not None:
+            job_vectors = semantic_vectors(vectorizer, [job.get('description', '') for job in jobs])
+            semantic_row = semantic_scores(vectorizer, [resume_skills], job_vectors)[0]
+        
+        # Calculate match scores
+        scores = np.fromiter(
+            (self.match_score(resume_index, requirement_index, similarity, similarity_columns, semantic_score)
+             for requirement_index, semantic_score in zip(requirement_indexes, semantic_row)),
+            dtype=np.float64, count=len(jobs)
+        )
+        
+        for job_index in top_k_indices(scores, k, offset):
+            job = jobs[job_index]
             match_result = self.calculate_advanced_match_score(
-                resume_skills, job_skills, job_description
+                resume_skills, job_requirement_lists[job_index], job.get('description', ''), taxonomy, similarity,
+                requirement_indexes[job_index], semantic_row[job_index], resume_index
             )
             
             # Add match info to job
@@ -348,158 +1697,675 @@ class JobMatcher:
             
             ranked_jobs.append(job_with_score)
         
-        # Sort by match score (descending)
-        ranked_jobs.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        return ranked_jobs[:10]  # Return top 10
+        return ranked_jobs
 
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension"""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def extract_text_from_pdf(file_path):
-    """Extract text from PDF file"""
+@PDF_BACKENDS.register('pymupdf', requires=('pymupdf',))
+def pymupdf_pages(source):
+    """Page texts of a PDF file path or binary stream, through PyMuPDF"""
+    import pymupdf
+    
+    if isinstance(source, (str, os.PathLike)):
+        document = pymupdf.open(source)
+    else:
+        document = pymupdf.open(stream=source.read(), filetype='pdf')
+    with document:
+        for page in document:
+            yield page.get_text()
+
+@PDF_BACKENDS.register('pypdf', requires=('pypdf',))
+def pypdf_pages(source):
+    """Page texts of a PDF file path or binary stream, through pypdf"""
+    import pypdf
+    
+    for page in pypdf.PdfReader(source).pages:
+        yield page.extract_text()
+
+@PDF_BACKENDS.register('pypdf2', requires=('PyPDF2',))
+def pypdf2_pages(source):
+    """Page texts of a PDF file path or binary stream, through PyPDF2"""
+    import PyPDF2
+    
+    for page in PyPDF2.PdfReader(source).pages:
+        yield page.extract_text()
+
+# PyPDF2 is in requirements.txt, so without any backend installed its import
+# error is what gets reported
+PDF_BACKEND = (PDF_BACKENDS.first_installed() or 'pypdf2') if app.config['PDF_BACKEND'] == 'auto' \
+    else app.config['PDF_BACKEND']
+
+def iter_pdf_pages(source, max_pages=None, max_chars=None):
+    """Text of each page of a PDF file path or binary stream, one page at a time
+    
+    Stops after ``max_pages`` pages or ``max_chars`` characters (PDF_MAX_PAGES
+    and PDF_MAX_CHARS by default, 0 for no limit). The page that reaches the
+    character cap is cut off there, and later pages are never parsed.
+    """
+    if max_pages is None:
+        max_pages = app.config['PDF_MAX_PAGES']
+    if max_chars is None:
+        max_chars = app.config['PDF_MAX_CHARS']
+    
+    pages = PDF_BACKENDS.get(PDF_BACKEND)(source)
+    chars = 0
+    try:
+        for number, text in enumerate(pages, 1):
+            if max_chars and chars + len(text) >= max_chars:
+                yield text[:max_chars - chars]
+                return
+            chars += len(text)
+            yield text
+            if number == max_pages:
+                return
+    finally:
+        pages.close()
+
+@EXTRACTORS.register('pdf', requires=PDF_BACKENDS.requires(PDF_BACKEND))
+def extract_text_from_pdf(source):
+    """Extract text from a PDF file path or binary stream, up to PDF_MAX_PAGES
+    pages and PDF_MAX_CHARS characters"""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text
+        # Joined once, rather than copying the text so far for every page
+        return ''.join(iter_pdf_pages(source))
     except Exception as e:
-        print(f"Error reading PDF: {e}")
+        logger.warning('Error reading PDF: %s', e)
         return ""
 
-def extract_text_from_docx(file_path):
-    """Extract text from DOCX file"""
+@EXTRACTORS.register('docx')
+def extract_text_from_docx(source):
+    """Extract text from a DOCX file path or binary stream, one paragraph per line
+    
+    Paragraphs in tables, text boxes and content controls are included where
+    they appear in the document.
+    """
     try:
-        doc = docx.Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        return ''.join(iter_docx_paragraphs(source))
     except Exception as e:
-        print(f"Error reading DOCX: {e}")
+        logger.warning('Error reading DOCX: %s', e)
         return ""
 
-def extract_text_from_file(file_path):
-    """Extract text from uploaded file based on extension"""
-    if file_path.lower().endswith('.pdf'):
-        return extract_text_from_pdf(file_path)
-    elif file_path.lower().endswith('.docx'):
-        return extract_text_from_docx(file_path)
-    elif file_path.lower().endswith('.txt'):
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DOCX_BODY = WORD_NAMESPACE + 'body'
+DOCX_PARAGRAPH = WORD_NAMESPACE + 'p'
+DOCX_RUN = WORD_NAMESPACE + 'r'
+# What each run child adds to the paragraph text, as python-docx reads it
+DOCX_RUN_TEXT = {WORD_NAMESPACE + 'tab': '\t', WORD_NAMESPACE + 'br': '\n', WORD_NAMESPACE + 'cr': '\n'}
+DOCX_TEXT = WORD_NAMESPACE + 't'
+# Alternative content a reader shows only when it can't show mc:Choice, e.g.
+# a VML copy of a text box
+DOCX_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+def docx_main_part(archive):
+    """Name of the main document part in a DOCX zip, normally word/document.xml"""
+    try:
+        relationships = ElementTree.fromstring(archive.read('_rels/.rels'))
+    except KeyError:
+        return 'word/document.xml'
+    for relationship in relationships:
+        if relationship.get('Type', '').endswith('/officeDocument'):
+            return relationship.get('Target', '').lstrip('/')
+    return 'word/document.xml'
+
+def iter_docx_paragraphs(source):
+    """Text of each paragraph of a DOCX file path or binary stream, plus a newline
+    
+    The document XML is decompressed and parsed as a stream with iterparse;
+    every top-level paragraph or table is discarded once it has been read, so
+    memory stays flat however long the document is. A text box's paragraphs
+    come before the paragraph that anchors it.
+    """
+    with zipfile.ZipFile(source) as archive, archive.open(docx_main_part(archive)) as document:
+        tags = []  # open elements, innermost last
+        paragraphs = []  # text of each open paragraph; text boxes nest them
+        skipping = 0
+        body = None
+        
+        for event, element in ElementTree.iterparse(document, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                tags.append(tag)
+                if tag == DOCX_FALLBACK:
+                    skipping += 1
+                elif skipping:
+                    continue
+                elif tag == DOCX_PARAGRAPH:
+                    paragraphs.append([])
+                elif tag == DOCX_BODY:
+                    body = element
+                continue
+            
+            tags.pop()
+            if tag == DOCX_FALLBACK:
+                skipping -= 1
+            elif skipping:
+                continue
+            elif tag == DOCX_PARAGRAPH:
+                yield ''.join(paragraphs.pop()) + '\n'
+            elif paragraphs and tags[-1] == DOCX_RUN:
+                if tag == DOCX_TEXT:
+                    paragraphs[-1].append(element.text or '')
+                elif tag in DOCX_RUN_TEXT:
+                    paragraphs[-1].append(DOCX_RUN_TEXT[tag])
+            
+            if body is not None and tags and tags[-1] == DOCX_BODY:
+                body.clear()
+
+@EXTRACTORS.register('txt')
+def extract_text_from_txt(source):
+    """Extract text from a UTF-8 TXT file path or binary stream"""
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8') as file:
                 return file.read()
-        except Exception as e:
-            print(f"Error reading TXT: {e}")
-            return ""
+        # Same newline handling as reading the file in text mode
+        return source.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    except Exception as e:
+        logger.warning('Error reading TXT: %s', e)
+        return ""
+
+def extract_text_from_file(source, filename=None):
+    """Extract text from a file path or binary stream based on extension
+    
+    Streams (e.g. an uploaded file's ``stream``) need ``filename`` to pick the
+    format; paths use their own name.
+    """
+    extension = file_extension(filename or os.fspath(source))
+    if extension in EXTRACTORS:
+        return EXTRACTORS.get(extension)(source)
     return ""
 
-def extract_skills_and_keywords(text):
-    """Extract ONLY technical skills and keywords from text"""
-    
-    # TECHNICAL SKILLS ONLY - excluding soft skills and business skills
-    technical_skills = [
-        # Programming Languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'csharp', 'php', 'ruby', 'go', 'rust',
-        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'jsx', 'tsx', 'perl',
-        'dart', 'julia', 'erlang', 'haskell', 'assembly', 'vb.net', 'objective-c',
-        
-        # Frameworks and Libraries
-        'react', 'angular', 'vue', 'nodejs', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
-        'bootstrap', 'tailwind', 'jquery', 'redux', 'vuex', 'tensorflow', 'pytorch', 'keras',
-        'pandas', 'numpy', 'matplotlib', 'scikit-learn', 'sklearn', 'opencv', 'fastapi', 'nest',
-        'nextjs', 'next.js', 'nuxt', 'ember', 'backbone', 'meteor', 'gatsby', 'svelte',
-        'spring boot', 'hibernate', 'struts', 'asp.net', '.net', 'dotnet', 'mvc', 'wpf',
-        
-        # Databases
-        'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'oracle',
-        'sqlite', 'dynamodb', 'firebase', 'supabase', 'mariadb', 'neo4j', 'influxdb', 'couchdb',
-        'sql server', 'mssql', 'nosql', 'graphql',
-        
-        # Cloud and DevOps
-        'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'gitlab', 'github',
-        'terraform', 'ansible', 'vagrant', 'chef', 'puppet', 'nginx', 'apache', 'linux',
-        'ubuntu', 'centos', 'debian', 'bash', 'powershell', 'ci/cd', 'devops', 'microservices',
-        'serverless', 'lambda', 'cloudformation', 'helm', 'istio', 'prometheus', 'grafana',
-        
-        # Data Science and AI
-        'machine learning', 'deep learning', 'artificial intelligence', 'data science',
-        'data analysis', 'data analytics', 'big data', 'hadoop', 'spark', 'kafka', 'tableau', 'power bi',
-        'excel', 'statistics', 'regression', 'classification', 'clustering', 'nlp',
-        'computer vision', 'neural networks', 'ai', 'ml', 'data mining', 'etl',
-        'jupyter', 'anaconda', 'r studio', 'sas', 'spss',
-        
-        # Mobile Development
-        'ios', 'android', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova',
-        'mobile development', 'app development', 'swift ui', 'kotlin multiplatform',
-        
-        # Testing and Quality Assurance
-        'testing', 'unit testing', 'integration testing', 'automation testing', 'selenium', 'jest', 'pytest',
-        'junit', 'mocha', 'cypress', 'testng', 'cucumber', 'postman', 'qa', 'quality assurance',
-        'tdd', 'bdd', 'test driven development',
-        
-        # Version Control and Development Tools
-        'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'version control',
-        'jira', 'confluence', 'trello',
-        
-        # Security (Technical)
-        'cybersecurity', 'information security', 'penetration testing', 'ethical hacking',
-        'encryption', 'ssl', 'oauth', 'jwt', 'authentication', 'authorization',
-        
-        # Web Development
-        'web development', 'frontend', 'backend', 'full stack', 'rest api', 'api development',
-        'soap', 'json', 'xml', 'ajax', 'websockets', 'graphql', 'grpc',
-        
-        # Design and Development Tools (Technical)
-        'figma', 'sketch', 'adobe xd', 'photoshop', 'illustrator', 'wireframing', 'prototyping',
-        
-        # Development Methodologies (Technical)
-        'agile', 'scrum', 'kanban', 'waterfall', 'agile methodologies', 'sprint planning',
-        
-        # Operating Systems and Servers
-        'windows', 'macos', 'unix', 'freebsd', 'windows server', 'iis',
-        
-        # Networking and Infrastructure
-        'tcp/ip', 'http', 'https', 'dns', 'load balancing', 'cdn', 'vpc', 'vpn'
-    ]
+def file_extension(filename):
+    """Lowercased extension of a file name, or '' if it has none"""
+    name = filename.lower()
+    return name.rsplit('.', 1)[-1] if '.' in name else ''
+
+def extract_resume_text_and_skills(source, filename, taxonomy, stage=None):
+    """(text, skills) of one resume file path or binary stream
+    
+    PDF pages are scanned for skills as each one is extracted, so skill
+    extraction keeps pace with a long PDF instead of starting after it. Skills
+    are only extracted when there is text. ``stage`` is a context manager
+    factory timing the extract_text and extract_skills stages (default:
+    trace_stage).
+    """
+    stage = stage or trace_stage
+    extension = file_extension(filename or os.fspath(source))
+    
+    if extension not in EXTRACTORS or EXTRACTORS.get(extension) is not extract_text_from_pdf:
+        with stage('extract_text'):
+            text = extract_text_from_file(source, filename)
+        if not text.strip():
+            return text, []
+        with stage('extract_skills'):
+            return text, extract_skills_and_keywords(text, taxonomy)
+    
+    scanner = SkillScanner(taxonomy)
+    try:
+        pages = iter_pdf_pages(source)
+        while True:
+            with stage('extract_text'):
+                page = next(pages, None)
+            if page is None:
+                break
+            with stage('extract_skills'):
+                scanner.feed(page)
+    except Exception as e:
+        logger.warning('Error reading PDF: %s', e)
+        return "", []
+    
+    text = scanner.text()
+    if not text.strip():
+        return text, []
+    with stage('extract_skills'):
+        return text, scanner.skills()
+
+class SkillMatcher:
+    """Find vocabulary skills in text with one compiled regex pass.
+
+    The vocabulary is compiled into a single trie-shaped alternation wrapped in
+    a lookahead, so ``finditer`` visits every start position once and reports
+    the longest skill bounded by ``\\b`` on both sides. Shorter skills that
+    are prefixes of that match (e.g. ``spring`` inside ``spring boot``) are
+    checked against the same word-boundary rule afterwards, which keeps the
+    result identical to running one ``re.search`` per skill.
+    """
+
+    _word_boundary = re.compile(r'\b')
+
+    def __init__(self, skills):
+        self.skills = tuple(sorted(set(skill.lower() for skill in skills), key=len, reverse=True))
+
+        # Vocabulary skills that are proper prefixes of each skill
+        skill_set = set(self.skills)
+        self._prefixes = {
+            skill: tuple(skill[:i] for i in range(len(skill) - 1, 0, -1) if skill[:i] in skill_set)
+            for skill in self.skills
+        }
+
+        self._pattern = re.compile(r'(?=\b(' + self._trie_pattern(self.skills) + r')\b)')
+
+    @classmethod
+    def _trie_pattern(cls, words):
+        """Build a regex alternation that factors common prefixes of ``words``"""
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = True
+        return cls._node_pattern(trie)
+
+    @classmethod
+    def _node_pattern(cls, node):
+        branches = [re.escape(char) + cls._node_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # Greedy optional: try the longer skill first, fall back to this one
+            pattern = '(?:' + pattern + ')?'
+        return pattern
+
+    def find(self, text_lower):
+        """Return the set of skills found in already-lowercased text"""
+        found = set()
+        self.find_between(text_lower, found)
+        return found
+
+    def find_between(self, text_lower, found, start=0, stop=None):
+        """Add the skills starting at positions ``start`` to ``stop`` of
+        already-lowercased text to ``found``
+
+        The characters around that range still count for word boundaries.
+        """
+        boundary = self._word_boundary
+
+        for match in self._pattern.finditer(text_lower, start):
+            match_start = match.start()
+            if stop is not None and match_start >= stop:
+                break
+            skill = match.group(1)
+            found.add(skill)
+            for prefix in self._prefixes[skill]:
+                if prefix not in found and boundary.match(text_lower, match_start + len(prefix)):
+                    found.add(prefix)
+
+class SkillTaxonomy:
+    """Immutable, precompiled view of one version of the skill taxonomy file.
+
+    The file lists skills by category; each entry is either a plain name or an
+    object with ``name``, optional ``aliases`` and an optional ``validation``
+    rule that names one of the file's ``validation_rules``. The rule only
+    applies to the name; aliases are accepted wherever they appear.
+
+    Every canonical skill gets an integer ID (its position in ``skill_names``)
+    and every name or alias maps to that ID, so variants like ``nodejs`` and
+    ``node.js`` compare equal with a plain set intersection.
+
+    ``version`` is the file's own label, for logs and /health. Everything
+    cached per taxonomy (parsed resumes and job descriptions, the candidate
+    pool's skills and bitsets) is keyed by ``fingerprint`` instead, which also
+    hashes the contents, so an edit that doesn't bump ``version`` still
+    invalidates them.
+    """
+
+    def __init__(self, data, source_path=None, file_signature=None):
+        self.version = str(data.get('version', 'unversioned'))
+        digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+        self.fingerprint = f'{self.version}+{digest[:16]}'
+        self.source_path = source_path
+        self.file_signature = file_signature
+
+        rules = {name: tuple(rule.get('patterns', []))
+                 for name, rule in data.get('validation_rules', {}).items()}
+
+        skill_names = []
+        term_ids = {}
+        categories = {}
+        aliases = {}
+        validators = {}
+
+        for category, entries in data.get('categories', {}).items():
+            for entry in entries:
+                if isinstance(entry, str):
+                    entry = {'name': entry}
+
+                name = entry['name'].lower().strip()
+                skill_aliases = tuple(alias.lower().strip() for alias in entry.get('aliases', []))
+
+                skill_id = term_ids.get(name)
+                if skill_id is None:
+                    skill_id = len(skill_names)
+                    skill_names.append(name)
+                categories.setdefault(name, category)
+                aliases[name] = skill_aliases
+
+                rule_name = entry.get('validation')
+                if rule_name and rule_name not in rules:
+                    raise ValueError(f"Unknown validation rule '{rule_name}' for skill '{name}'")
+
+                for term in (name,) + skill_aliases:
+                    term_ids.setdefault(term, skill_id)
+                if rule_name:
+                    validators[name] = tuple(
+                        re.compile(pattern.replace('{skill}', re.escape(name)))
+                        for pattern in rules[rule_name]
+                    )
+
+        if not skill_names:
+            raise ValueError('Skill taxonomy does not contain any skills')
+
+        self.skill_names = tuple(skill_names)
+        self.term_ids = MappingProxyType(term_ids)
+        self.categories = MappingProxyType(categories)
+        self.aliases = MappingProxyType(aliases)
+        self.validators = MappingProxyType(validators)
+        self.matcher = SkillMatcher(term_ids)
+
+    def canonical_id(self, skill):
+        """Return the canonical skill ID for a name or alias, or None for free text"""
+        return self.term_ids.get(skill.lower().strip())
+
+    def skill_ids(self, skills):
+        """Map a list of skill strings to the set of canonical IDs they cover"""
+        term_ids = self.term_ids
+        return {term_ids[key] for key in (skill.lower().strip() for skill in skills) if key in term_ids}
+
+    @classmethod
+    def from_file(cls, path):
+        """Load and compile the taxonomy stored at ``path``"""
+        stat = os.stat(path)
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data, source_path=path, file_signature=(stat.st_mtime_ns, stat.st_size))
+
+class SkillTaxonomyStore:
+    """Hold the current SkillTaxonomy and hot-swap it when the file changes.
+
+    Each worker process builds the taxonomy once. ``current()`` re-checks the
+    file at most every ``reload_interval`` seconds and, if it changed, compiles
+    the new version off to the side before swapping the reference in a single
+    assignment. Request handlers fetch the taxonomy once and pass it along, so
+    an in-flight request keeps the version it started with.
+    """
+
+    def __init__(self, path, reload_interval=5.0):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._taxonomy = SkillTaxonomy.from_file(path)
+        self._rejected_signature = None
+        self._last_check = time.monotonic()
+
+    def current(self):
+        """Return the current taxonomy, reloading it first if the file changed"""
+        taxonomy = self._taxonomy
+
+        if self.reload_interval <= 0 or time.monotonic() - self._last_check < self.reload_interval:
+            return taxonomy
+
+        # Another thread is already checking; keep serving the current version
+        if not self._lock.acquire(blocking=False):
+            return taxonomy
+
+        try:
+            self._last_check = time.monotonic()
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+
+            if signature not in (taxonomy.file_signature, self._rejected_signature):
+                try:
+                    self._taxonomy = SkillTaxonomy.from_file(self.path)
+                    logger.info('Loaded skill taxonomy version %s', self._taxonomy.version)
+                except (KeyError, ValueError, re.error) as e:
+                    self._rejected_signature = signature
+                    logger.error('Error loading skill taxonomy, keeping version %s: %s', taxonomy.version, e)
+        except OSError as e:
+            logger.error('Error checking skill taxonomy: %s', e)
+        finally:
+            self._lock.release()
+
+        return self._taxonomy
+
+SKILL_TAXONOMY = SkillTaxonomyStore(
+    app.config['SKILL_TAXONOMY_PATH'],
+    reload_interval=app.config['SKILL_TAXONOMY_RELOAD_INTERVAL']
+)
+
+# Keeps skill spellings like c++, c#, node.js and ci/cd-style words intact,
+# without trailing punctuation ("python," -> "python")
+SEMANTIC_TOKEN_PATTERN = r'(?u)\w[\w+#.]*[\w+#]|\w'
+
+class SemanticModel:
+    """TF-IDF vectorizer behind SEMANTIC_SCORING=tfidf.
+
+    The vectorizer is fitted once on a corpus and pickled to ``path``. Each
+    worker loads it on first use and, like SkillTaxonomyStore, re-checks the
+    file at most every ``reload_interval`` seconds. If there is no model file
+    yet, the first use fits one on ``default_semantic_corpus`` and saves it.
+
+    ``current()`` returns None when semantic scoring is in overlap mode or the
+    model can't be used, and callers fall back to the word overlap score.
+    """
+
+    def __init__(self, path, mode='overlap', reload_interval=5.0):
+        if mode not in ('overlap', 'tfidf'):
+            raise ValueError(f'Unknown semantic scoring mode: {mode}')
+
+        self.path = path
+        self.mode = mode
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._vectorizer = None
+        self._signature = None
+        self._rejected_signature = None
+        self._last_check = None
+        self._error = None
+
+    def fit(self, documents):
+        """Fit a new vectorizer on ``documents``, save it and start using it"""
+        try:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+        except ImportError:
+            raise RuntimeError('scikit-learn is required for TF-IDF semantic scoring') from None
+
+        vectorizer = TfidfVectorizer(token_pattern=SEMANTIC_TOKEN_PATTERN, sublinear_tf=True, dtype=np.float32)
+        vectorizer.fit(documents)
+
+        # Write next to the target and rename, so other workers never load half a file
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.tmp', delete=False) as file:
+            pickle.dump(vectorizer, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, self.path)
+
+        stat = os.stat(self.path)
+        self._vectorizer = vectorizer
+        self._signature = (stat.st_mtime_ns, stat.st_size)
+        self._last_check = time.monotonic()
+        self._error = None
+        return vectorizer
+
+    def current(self):
+        """Return the fitted vectorizer, loading, reloading or fitting it first
+        as needed; None means use the word overlap score"""
+        if self.mode != 'tfidf' or not SEMANTIC_BACKEND_AVAILABLE:
+            return None
+
+        vectorizer = self._vectorizer
+        if self._is_fresh():
+            return vectorizer
+
+        # Another thread is already checking; keep serving what we have. The
+        # very first load waits instead, so a batch isn't scored half and half
+        if not self._lock.acquire(blocking=vectorizer is None):
+            return vectorizer
+
+        try:
+            if self._is_fresh():
+                return self._vectorizer
+            self._last_check = time.monotonic()
+
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                logger.info('Fitting semantic model %s', self.path)
+                return self.fit(default_semantic_corpus(SKILL_TAXONOMY.current()))
+
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature not in (self._signature, self._rejected_signature):
+                try:
+                    with open(self.path, 'rb') as file:
+                        self._vectorizer = pickle.load(file)
+                except Exception:
+                    self._rejected_signature = signature
+                    raise
+                self._signature = signature
+                self._error = None
+                logger.info('Loaded semantic model %s (%d terms)', self.path, len(self._vectorizer.vocabulary_))
+        except Exception as e:
+            # Keep the previous model, or use word overlap if there never was one
+            self._error = str(e)
+            logger.error('Error loading semantic model %s: %s', self.path, e)
+        finally:
+            self._lock.release()
+
+        return self._vectorizer
+
+    def _is_fresh(self):
+        return self._last_check is not None and time.monotonic() - self._last_check < self.reload_interval
+
+    def stats(self):
+        return {
+            'mode': self.mode,
+            'available': SEMANTIC_BACKEND_AVAILABLE,
+            'loaded': self._vectorizer is not None,
+            'vocabulary_size': len(self._vectorizer.vocabulary_) if self._vectorizer is not None else 0,
+            'error': self._error
+        }
+
+def default_semantic_corpus(taxonomy):
+    """Documents to fit the semantic model on when no corpus was given: one
+    per taxonomy skill (name and aliases) plus the sample job postings"""
+    documents = [' '.join((name,) + taxonomy.aliases.get(name, ())) for name in taxonomy.skill_names]
+    for job in LinkedInJobScraper().get_mock_jobs():
+        documents.append(job.get('description', ''))
+        documents.append(' '.join(job.get('requirements', [])))
+    return documents
+
+def semantic_vectors(vectorizer, documents):
+    """TF-IDF vectors of many documents as one sparse matrix"""
+    if not documents:
+        from scipy.sparse import csr_matrix
+        return csr_matrix((0, len(vectorizer.vocabulary_)), dtype=vectorizer.dtype)
+    return vectorizer.transform(documents)
+
+def semantic_scores(vectorizer, resume_skill_lists, job_vectors):
+    """Semantic scores (0-100) of every resume against every job vector
+    
+    All resumes are transformed in one batch and every cosine similarity comes
+    from one sparse matrix product. A resume is represented by its skills, the
+    same text the word overlap score compares.
+    """
+    if not len(resume_skill_lists) or not job_vectors.shape[0]:
+        return np.zeros((len(resume_skill_lists), job_vectors.shape[0]))
+    
+    from sklearn.metrics.pairwise import cosine_similarity
+    
+    resume_vectors = semantic_vectors(vectorizer, [' '.join(skills) for skills in resume_skill_lists])
+    return cosine_similarity(resume_vectors, job_vectors) * 100
+
+SEMANTIC_MODEL = SemanticModel(app.config['SEMANTIC_MODEL_PATH'], app.config['SEMANTIC_SCORING'])
+
+def extract_skill_ids(text, taxonomy=None):
+    """Extract the canonical IDs of the technical skills mentioned in text"""
+    
+    if taxonomy is None:
+        taxonomy = SKILL_TAXONOMY.current()
     
     # Convert text to lowercase for matching
     text_lower = text.lower()
     
-    # Extract only predefined skills found in the text
-    found_skills = []
+    # Extract only predefined skills found in the text (single pass)
+    found_ids = set()
     
-    # Check for exact skill matches with better precision
-    # Sort by length (longest first) to match compound skills first
-    sorted_skills = sorted(technical_skills, key=len, reverse=True)
+    for term in taxonomy.matcher.find(text_lower):
+        # Additional validation for common false positives, e.g. database
+        # names must be mentioned explicitly as a skill
+        validators = taxonomy.validators.get(term)
+        if validators is None or any(pattern.search(text_lower) for pattern in validators):
+            found_ids.add(taxonomy.term_ids[term])
     
-    for skill in sorted_skills:
-        skill_lower = skill.lower()
-        import re
+    return found_ids
+
+class SkillScanner:
+    """Skill extraction for text that arrives in chunks, such as PDF pages.
+
+    Each chunk is searched as soon as it is fed. Only positions followed by at
+    least the longest skill are searched, and the characters after them are
+    kept for the next chunk, so a skill split across two chunks is still
+    found. ``skill_ids()`` gives the same result as extract_skill_ids on
+    ``text()``, the chunks joined together; validation rules are checked
+    against all of it.
+    """
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        self._matcher = taxonomy.matcher
+        self._lookahead = max((len(skill) for skill in self._matcher.skills), default=0)
+        self._buffer = ''
+        self._start = 0
+        self._terms = set()
+        self._chunks = []
+
+    def feed(self, text):
+        self._chunks.append(text)
+        self._buffer += text.lower()
         
-        # Use strict word boundary matching
-        pattern = r'\b' + re.escape(skill_lower) + r'\b'
+        # A match starting before stop can't change with more text
+        stop = len(self._buffer) - self._lookahead
+        if stop > self._start:
+            self._matcher.find_between(self._buffer, self._terms, self._start, stop)
+            # Keep the character before stop for the word boundary there
+            self._buffer = self._buffer[stop - 1:]
+            self._start = 1
+
+    def skill_ids(self):
+        self._matcher.find_between(self._buffer, self._terms, self._start)
+        self._start = len(self._buffer)
         
-        if re.search(pattern, text_lower):
-            # Additional validation for common false positives
-            if skill_lower in ['mongodb', 'mysql', 'postgresql', 'oracle', 'redis', 'cassandra']:
-                # Be extra strict for database names - check for explicit mentions
-                db_patterns = [
-                    r'\b' + re.escape(skill_lower) + r'(?:\s+database|\s+db|\s*,|\s*\.|\s*;|\s*\n|\s*$)',
-                    r'(?:database|db|nosql|sql).*?' + re.escape(skill_lower),
-                    r'\b' + re.escape(skill_lower) + r'\s+(?:experience|skills?|knowledge|proficiency)'
-                ]
-                if any(re.search(pattern, text_lower) for pattern in db_patterns):
-                    found_skills.append(skill)
-            else:
-                found_skills.append(skill)
+        text_lower = None
+        found_ids = set()
+        for term in self._terms:
+            validators = self.taxonomy.validators.get(term)
+            if validators is not None:
+                if text_lower is None:
+                    text_lower = self.text().lower()
+                if not any(pattern.search(text_lower) for pattern in validators):
+                    continue
+            found_ids.add(self.taxonomy.term_ids[term])
+        
+        return found_ids
+
+    def text(self):
+        return ''.join(self._chunks)
+
+    def skills(self):
+        """Canonical skill names, as extract_skills_and_keywords returns them"""
+        return [self.taxonomy.skill_names[skill_id] for skill_id in sorted(self.skill_ids())]
+
+def extract_skills_and_keywords(text, taxonomy=None):
+    """Extract ONLY technical skills and keywords from text, as canonical skill names"""
     
-    # Remove duplicates and return
-    return list(set(found_skills))
+    if taxonomy is None:
+        taxonomy = SKILL_TAXONOMY.current()
+    
+    return [taxonomy.skill_names[skill_id] for skill_id in sorted(extract_skill_ids(text, taxonomy))]
 
 def calculate_match_score(resume_skills, job_skills):
     """Calculate match percentage between resume and job description"""
@@ -533,14 +2399,1500 @@ def calculate_match_score(resume_skills, job_skills):
     # Calculate percentage
     score = (match_count / total_required) * 100
     
-    return {
-        'score': round(score, 2),
-        'matched_skills': [skill for skill in resume_skills if skill.lower() in matches],
-        'missing_skills': [skill for skill in job_skills if skill.lower() in (job_set - resume_set)],
-        'additional_skills': [skill for skill in resume_skills if skill.lower() in (resume_set - job_set)],
-        'total_required': total_required,
-        'total_matched': match_count
-    }
+    return {
+        'score': round(score, 2),
+        'matched_skills': [skill for skill in resume_skills if skill.lower() in matches],
+        'missing_skills': [skill for skill in job_skills if skill.lower() in (job_set - resume_set)],
+        'additional_skills': [skill for skill in resume_skills if skill.lower() in (resume_set - job_set)],
+        'total_required': total_required,
+        'total_matched': match_count
+    }
+
+class LRUCache:
+    """Small thread-safe in-process LRU cache with hit/miss counters"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+class ResumeCache:
+    """Two-tier cache of parsed resumes.
+
+    Entries are keyed by the SHA-256 of the file bytes plus the taxonomy
+    fingerprint, and hold the extracted text, the name found in it and the skill
+    list. The first tier is an in-process LRUCache. The optional second tier
+    is a SQLite file shared by every gunicorn worker on the machine, trimmed
+    to ``db_max_bytes`` by evicting the least recently used rows.
+    """
+
+    def __init__(self, max_entries, db_path=None, db_max_bytes=256 * 1024 * 1024):
+        self.memory = LRUCache(max_entries)
+        self.db_path = db_path or None
+        self.db_max_bytes = db_max_bytes
+        self.disk_hits = 0
+        self.disk_errors = 0
+
+        if self.db_path:
+            with self._connect() as connection:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS resume_cache ('
+                    'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)'
+                )
+                connection.execute('CREATE INDEX IF NOT EXISTS resume_cache_accessed ON resume_cache (accessed_at)')
+
+    @staticmethod
+    def key(content_hash, taxonomy_fingerprint):
+        return f'{content_hash}:{taxonomy_fingerprint}'
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across forks and threads
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None or not self.db_path:
+            return value
+
+        try:
+            with self._connect() as connection:
+                row = connection.execute('SELECT value FROM resume_cache WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute('UPDATE resume_cache SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        except sqlite3.Error as e:
+            self.disk_errors += 1
+            logger.error('Error reading resume cache: %s', e)
+            return None
+
+        value = json.loads(row[0])
+        self.disk_hits += 1
+        self.memory.put(key, value)
+        return value
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if not self.db_path:
+            return
+
+        encoded = json.dumps(value)
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO resume_cache (key, value, size, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, encoded, len(encoded), time.time())
+                )
+                total_size = connection.execute('SELECT COALESCE(SUM(size), 0) FROM resume_cache').fetchone()[0]
+                if total_size > self.db_max_bytes:
+                    self._evict(connection, total_size - self.db_max_bytes)
+        except sqlite3.Error as e:
+            self.disk_errors += 1
+            logger.error('Error writing resume cache: %s', e)
+
+    def _evict(self, connection, excess_bytes):
+        """Delete least recently used rows until ``excess_bytes`` are freed"""
+        freed = 0
+        stale_keys = []
+        for key, size in connection.execute('SELECT key, size FROM resume_cache ORDER BY accessed_at'):
+            stale_keys.append((key,))
+            freed += size
+            if freed >= excess_bytes:
+                break
+        connection.executemany('DELETE FROM resume_cache WHERE key = ?', stale_keys)
+
+    def stats(self):
+        memory = self.memory.stats()
+        return {
+            'memory_entries': memory['entries'],
+            'memory_hits': memory['hits'],
+            'disk_hits': self.disk_hits,
+            'misses': memory['misses'] - self.disk_hits,
+            'disk_enabled': bool(self.db_path),
+            'disk_errors': self.disk_errors
+        }
+
+RESUME_CACHE = ResumeCache(
+    app.config['RESUME_CACHE_SIZE'],
+    db_path=app.config['RESUME_CACHE_DB'],
+    db_max_bytes=int(app.config['RESUME_CACHE_DB_MAX_MB'] * 1024 * 1024)
+)
+
+ParsedJobDescription = namedtuple('ParsedJobDescription', ['skills', 'requirement_index'])
+
+JOB_DESCRIPTION_CACHE = LRUCache(app.config['JOB_DESCRIPTION_CACHE_SIZE'])
+
+def content_hash(data):
+    """SHA-256 of an uploaded file's bytes; identifies a resume across uploads"""
+    return hashlib.sha256(data).hexdigest()
+
+def parse_job_description(job_description, taxonomy):
+    """Extract a job description's skills and requirement index, memoized
+    
+    The cache key is a hash of the lowercased, whitespace-collapsed text plus
+    the taxonomy fingerprint, so pasting the same JD again (even with different
+    spacing or casing) skips extraction entirely.
+    """
+    normalized = ' '.join(job_description.lower().split())
+    cache_key = f'{hashlib.sha256(normalized.encode("utf-8")).hexdigest()}:{taxonomy.fingerprint}'
+    
+    parsed = JOB_DESCRIPTION_CACHE.get(cache_key)
+    if parsed is None:
+        with trace_stage('extract_skills'):
+            job_skills = extract_skills_and_keywords(job_description, taxonomy)
+            parsed = ParsedJobDescription(
+                skills=tuple(job_skills),
+                requirement_index=JobRequirementIndex(job_skills, job_description, taxonomy)
+            )
+        JOB_DESCRIPTION_CACHE.put(cache_key, parsed)
+    
+    return parsed
+
+class CandidateStore:
+    """Persistent pool of candidates, with an inverted index.
+
+    Each candidate row (keyed by the resume's content hash) keeps the
+    canonical skills from extract_skills_and_keywords plus display metadata.
+    ``candidate_postings`` is the inverted index: a WITHOUT ROWID table
+    clustered on (term, candidate_id), so each term's posting list is one
+    sorted range on disk. Terms are ``skill:<name>`` for every skill and
+    ``word:<word>`` for every word of the skill names, which is what the
+    semantic part of calculate_advanced_match_score compares.
+
+    With the 'bitset' search backend each process instead keeps every
+    candidate in a SkillBitsetMatrix and scores the whole pool with
+    popcounts. Each write stamps its rows with the next store ``revision``
+    while holding SQLite's write lock, so a search only reads rows with a
+    revision newer than the last one it synced.
+
+    Both backends score the semantic part as word overlap, since that is what
+    the index can answer; SEMANTIC_SCORING=tfidf applies to the batch endpoints.
+    """
+
+    def __init__(self, db_path, search_backend='postings'):
+        if search_backend not in ('postings', 'bitset'):
+            raise ValueError(f"Unknown candidate search backend '{search_backend}'")
+
+        self.db_path = db_path or None
+        self.search_backend = search_backend
+        self.errors = 0
+        self._bitsets = None
+        self._bitset_lock = threading.Lock()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self.db_path)
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across forks and threads
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        if not self._schema_ready:
+            # Created on first use, so importing the module opens no database
+            with self._schema_lock:
+                if not self._schema_ready:
+                    with connection:
+                        self._create_schema(connection)
+                    self._schema_ready = True
+        return connection
+
+    @staticmethod
+    def _create_schema(connection):
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS candidates ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, content_hash TEXT NOT NULL UNIQUE, filename TEXT NOT NULL, '
+            'candidate_name TEXT NOT NULL, skills TEXT NOT NULL, taxonomy_version TEXT NOT NULL, '
+            'resume_preview TEXT NOT NULL, added_at REAL NOT NULL, last_seen_at REAL NOT NULL)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS candidate_postings ('
+            'term TEXT NOT NULL, candidate_id INTEGER NOT NULL, PRIMARY KEY (term, candidate_id)) WITHOUT ROWID'
+        )
+        # Pools created before revisions existed get them when first opened
+        columns = {row[1] for row in connection.execute('PRAGMA table_info(candidates)')}
+        if 'revision' not in columns:
+            connection.execute('ALTER TABLE candidates ADD COLUMN revision INTEGER NOT NULL DEFAULT 0')
+        connection.execute('CREATE INDEX IF NOT EXISTS candidates_revision ON candidates (revision)')
+        connection.execute('CREATE TABLE IF NOT EXISTS candidate_store_meta (revision INTEGER NOT NULL)')
+        connection.execute(
+            'INSERT INTO candidate_store_meta (revision) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM candidate_store_meta)'
+        )
+
+    @staticmethod
+    def terms(skills):
+        """Posting terms for a canonical skill list"""
+        words = set(' '.join(skills).lower().split())
+        return [f'skill:{skill}' for skill in skills] + [f'word:{word}' for word in words]
+
+    def add(self, resumes, taxonomy_version):
+        """Insert or refresh parsed resumes (dicts with content_hash, filename,
+        candidate_name, resume_skills and resume_text)
+
+        A resume already in the pool is only re-indexed when it was indexed
+        with a different taxonomy, i.e. ``taxonomy_version`` is not the
+        fingerprint it was stored with.
+        """
+        if not self.db_path:
+            return
+
+        now = time.time()
+        try:
+            with self._connect() as connection:
+                # Bumping the revision first takes the write lock for the whole batch
+                connection.execute('UPDATE candidate_store_meta SET revision = revision + 1')
+                revision = connection.execute('SELECT revision FROM candidate_store_meta').fetchone()[0]
+
+                for resume in resumes:
+                    row = connection.execute(
+                        'SELECT id, taxonomy_version FROM candidates WHERE content_hash = ?', (resume['content_hash'],)
+                    ).fetchone()
+
+                    if row is not None and row[1] == taxonomy_version:
+                        connection.execute('UPDATE candidates SET last_seen_at = ? WHERE id = ?', (now, row[0]))
+                        continue
+
+                    resume_text = resume['resume_text']
+                    values = (
+                        resume['filename'], resume['candidate_name'], json.dumps(resume['resume_skills']),
+                        taxonomy_version, resume_text[:300] + '...' if len(resume_text) > 300 else resume_text,
+                        now, revision
+                    )
+
+                    if row is None:
+                        candidate_id = connection.execute(
+                            'INSERT INTO candidates (filename, candidate_name, skills, taxonomy_version, resume_preview, '
+                            'last_seen_at, revision, added_at, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                            values + (now, resume['content_hash'])
+                        ).lastrowid
+                    else:
+                        candidate_id = row[0]
+                        connection.execute(
+                            'UPDATE candidates SET filename = ?, candidate_name = ?, skills = ?, taxonomy_version = ?, '
+                            'resume_preview = ?, last_seen_at = ?, revision = ? WHERE id = ?',
+                            values + (candidate_id,)
+                        )
+                        connection.execute('DELETE FROM candidate_postings WHERE candidate_id = ?', (candidate_id,))
+
+                    connection.executemany(
+                        'INSERT OR IGNORE INTO candidate_postings (term, candidate_id) VALUES (?, ?)',
+                        [(term, candidate_id) for term in self.terms(resume['resume_skills'])]
+                    )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.error('Error writing candidate store: %s', e)
+
+    def count(self):
+        with self._connect() as connection:
+            return connection.execute('SELECT COUNT(*) FROM candidates').fetchone()[0]
+
+    def postings(self, connection, terms):
+        """Sorted candidate ID array for each term"""
+        postings = {term: [] for term in terms}
+        for start in range(0, len(terms), 500):
+            chunk = terms[start:start + 500]
+            rows = connection.execute(
+                f'SELECT term, candidate_id FROM candidate_postings WHERE term IN ({",".join("?" * len(chunk))}) '
+                'ORDER BY term, candidate_id', chunk
+            )
+            for term, candidate_id in rows:
+                postings[term].append(candidate_id)
+        return {term: np.array(ids, dtype=np.int64) for term, ids in postings.items()}
+
+    def search(self, job_description, parsed_job_description, taxonomy, limit=20):
+        """Rank the pool for a job description
+
+        Scores match calculate_advanced_match_score against the JD's skills.
+        Candidates that share no skill or skill-name word with the JD score
+        zero and are not ranked. Only the top ``limit`` rows are loaded and
+        rebuilt in full.
+
+        Returns (ranked candidates, number of candidates considered).
+        """
+        with self._connect() as connection:
+            if self.search_backend == 'bitset':
+                top, considered = self._rank_bitsets(connection, job_description, parsed_job_description, taxonomy, limit)
+            else:
+                top, considered = self._rank_postings(connection, job_description, parsed_job_description, taxonomy, limit)
+
+            if not top:
+                return [], considered
+
+            rows = {
+                row[0]: row for row in connection.execute(
+                    f'SELECT id, filename, candidate_name, skills, resume_preview, added_at FROM candidates '
+                    f'WHERE id IN ({",".join("?" * len(top))})', top
+                )
+            }
+
+        job_skills = list(parsed_job_description.skills)
+        requirement_index = parsed_job_description.requirement_index
+        matcher = JobMatcher()
+        ranked = []
+        for candidate_id in top:
+            _, filename, candidate_name, skills, resume_preview, added_at = rows[candidate_id]
+            resume_skills = json.loads(skills)
+            match_result = matcher.calculate_advanced_match_score(
+                resume_skills, job_skills, job_description, taxonomy, requirement_index=requirement_index
+            )
+            ranked.append({
+                'candidate_id': candidate_id,
+                'filename': filename,
+                'candidate_name': candidate_name,
+                'match_score': match_result['total_score'],
+                'exact_match_score': match_result['exact_score'],
+                'fuzzy_match_score': match_result['fuzzy_score'],
+                'semantic_match_score': match_result['semantic_score'],
+                'matched_skills': match_result['matched_skills'],
+                'missing_skills': match_result['missing_skills'],
+                'total_required': match_result['total_required'],
+                'total_matched': match_result['total_matched'],
+                'all_resume_skills': resume_skills[:15],  # Limit for display
+                'resume_preview': resume_preview,
+                'added_at': datetime.fromtimestamp(added_at).isoformat()
+            })
+
+        return ranked, considered
+
+    def _rank_postings(self, connection, job_description, parsed_job_description, taxonomy, limit):
+        """Top candidate IDs by walking posting lists
+
+        The exact and fuzzy parts count candidates per skill posting list (JD
+        skills are canonical, so fuzzy equals exact) and the semantic part
+        counts them per description-word posting list.
+        """
+        job_skills = parsed_job_description.skills
+        requirement_index = parsed_job_description.requirement_index
+
+        # Every name the taxonomy maps to a JD skill's ID counts as that skill
+        names_by_id = {}
+        for term, skill_id in taxonomy.term_ids.items():
+            names_by_id.setdefault(skill_id, []).append(term)
+        skill_terms = [[f'skill:{name}' for name in names_by_id.get(key, [key])]
+                       for key in dict.fromkeys(requirement_index.keys)]
+        word_terms = [f'word:{word}' for word in requirement_index.words] if job_description else []
+
+        postings = self.postings(connection, sorted({term for terms in skill_terms for term in terms} | set(word_terms)))
+
+        skill_lists = [np.unique(np.concatenate([postings[term] for term in terms])) for terms in skill_terms]
+        word_lists = [postings[term] for term in word_terms]
+
+        considered = np.unique(np.concatenate(skill_lists + word_lists + [np.empty(0, dtype=np.int64)]))
+        if len(considered) == 0:
+            return [], 0
+
+        # Per-candidate counts of matched skills and shared description words
+        skill_hits = np.zeros(len(considered), dtype=np.int64)
+        for ids in skill_lists:
+            skill_hits[np.searchsorted(considered, ids)] += 1
+        word_hits = np.zeros(len(considered), dtype=np.int64)
+        for ids in word_lists:
+            word_hits[np.searchsorted(considered, ids)] += 1
+
+        exact_scores = (skill_hits / len(requirement_index.key_set)) * 100 if job_skills else np.zeros(len(considered))
+        semantic_scores = (word_hits / len(requirement_index.words)) * 100 if word_terms else np.zeros(len(considered))
+        total_scores = (exact_scores * 0.5) + (exact_scores * 0.3) + (semantic_scores * 0.2)
+
+        return [int(considered[position]) for position in top_k_indices(total_scores, limit)], len(considered)
+
+    def _rank_bitsets(self, connection, job_description, parsed_job_description, taxonomy, limit):
+        """Top candidate IDs by scoring every candidate's bitsets at once"""
+        bitsets, candidate_ids, id_order = self._sync_bitsets(connection, taxonomy)
+        job_skills = parsed_job_description.skills
+        requirement_index = parsed_job_description.requirement_index
+
+        exact_scores = bitsets.exact_scores(job_skills)
+        if job_description and requirement_index.words:
+            semantic_scores = (bitsets.word_counts(requirement_index.words) / len(requirement_index.words)) * 100
+        else:
+            semantic_scores = np.zeros(bitsets.rows)
+        total_scores = (exact_scores * 0.5) + (exact_scores * 0.3) + (semantic_scores * 0.2)
+
+        # Rank in candidate ID order so ties break like the postings backend
+        total_scores = total_scores[id_order]
+        considered = int(np.count_nonzero(total_scores))
+
+        top = top_k_indices(total_scores, min(limit, considered))
+        return [int(candidate_ids[id_order[position]]) for position in top], considered
+
+    def _sync_bitsets(self, connection, taxonomy):
+        """Bring this process's SkillBitsetMatrix up to date
+
+        Returns the matrix, its row -> candidate ID array and the rows in
+        candidate ID order.
+        """
+        with self._bitset_lock:
+            state = self._bitsets
+            if state is None or state['matrix'].taxonomy.fingerprint != taxonomy.fingerprint:
+                state = {'matrix': SkillBitsetMatrix(taxonomy), 'rows': {}, 'ids': [], 'revision': -1,
+                         'id_array': np.empty(0, dtype=np.int64), 'id_order': np.empty(0, dtype=np.intp)}
+
+            matrix, rows = state['matrix'], state['rows']
+            revision = connection.execute('SELECT revision FROM candidate_store_meta').fetchone()[0]
+            if revision == state['revision']:
+                self._bitsets = state
+                return matrix, state['id_array'], state['id_order']
+
+            changed = sorted(connection.execute(
+                'SELECT id, skills, revision FROM candidates WHERE revision > ?', (state['revision'],)
+            ))
+
+            updated = [(rows[candidate_id], json.loads(skills)) for candidate_id, skills, _ in changed if candidate_id in rows]
+            added = [(candidate_id, json.loads(skills)) for candidate_id, skills, _ in changed if candidate_id not in rows]
+
+            matrix.set_rows([row for row, _ in updated], [skills for _, skills in updated])
+            first = matrix.append([skills for _, skills in added])
+            for offset, (candidate_id, _) in enumerate(added):
+                rows[candidate_id] = first + offset
+                state['ids'].append(candidate_id)
+
+            state['revision'] = revision
+            state['id_array'] = np.array(state['ids'], dtype=np.int64)
+            state['id_order'] = np.argsort(state['id_array'], kind='stable')
+            self._bitsets = state
+            return matrix, state['id_array'], state['id_order']
+
+    def preload(self, taxonomy):
+        """Load the bitset backend's matrix now rather than on the first search"""
+        if self.enabled and self.search_backend == 'bitset':
+            with self._connect() as connection:
+                self._sync_bitsets(connection, taxonomy)
+
+    def stats(self):
+        if not self.db_path:
+            return {'enabled': False}
+        try:
+            return {'enabled': True, 'candidates': self.count(), 'errors': self.errors}
+        except sqlite3.Error:
+            return {'enabled': True, 'candidates': None, 'errors': self.errors}
+
+CANDIDATE_STORE = CandidateStore(app.config['CANDIDATE_STORE_DB'], app.config['CANDIDATE_SEARCH_BACKEND'])
+
+def parse_pool_worker(connection):
+    """Body of a ResumeParsePool process: run one (func, args) at a time and
+    send back (result, error)"""
+    while True:
+        try:
+            func, args = connection.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            outcome = (func(*args), None)
+        except Exception as e:
+            outcome = (None, e)
+        try:
+            connection.send(outcome)
+        except Exception as e:
+            # The result or exception couldn't be pickled
+            connection.send((None, RuntimeError(f'{type(e).__name__}: {e}')))
+
+class ResumeParsePool:
+    """Bounded set of processes that parse uploaded resumes in parallel.
+
+    The processes are started lazily per worker process and shared by all of
+    its request and batch job threads. Each process runs one task at a time,
+    handed out in submission order by a dispatcher thread, so every task has
+    its own deadline: ``timeout`` seconds after it started. A task that misses
+    it is reported as timed out and only the process running it is killed and
+    replaced; other callers' tasks carry on. ``run`` returns outcomes in
+    submission order and ``run_iter`` yields them as they complete, optionally
+    keeping only a few of a caller's tasks submitted at a time.
+
+    Processes are started from the dispatcher thread, and forking a process
+    that runs other threads can leave the child with locks they held. So they
+    are forked from a single-threaded forkserver that has already imported
+    this module (spawned where there is no forkserver) rather than from here.
+
+    With ``processes`` 0 tasks run one by one on a helper thread of the
+    caller. A task that times out there is reported but can't be stopped: its
+    thread is abandoned and finishes in the background.
+    """
+
+    def __init__(self, processes, timeout, start_method=None):
+        self.processes = processes
+        self.timeout = timeout
+        self.start_method = start_method or (
+            'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        )
+        self._context = multiprocessing.get_context(self.start_method)
+        if self.start_method == 'forkserver':
+            self._context.set_forkserver_preload([__name__])
+        self._lock = threading.Lock()
+        self._started_pid = None
+        self._pending = deque()  # (func, args, done) waiting for a free process
+        self._counts = Counter()
+
+    def _ensure_started(self):
+        # Called with the lock held; processes belong to the process that started them
+        if self._started_pid == os.getpid():
+            return
+        self._started_pid = os.getpid()
+        self._pending = deque()
+        self._wakeup_reader, self._wakeup_writer = multiprocessing.Pipe(duplex=False)
+        self._wakeup_sent = False
+        threading.Thread(target=self._dispatch, daemon=True).start()
+
+    def _submit(self, tasks):
+        if not tasks:
+            return 0
+        with self._lock:
+            self._ensure_started()
+            self._pending.extend(tasks)
+            if not self._wakeup_sent:
+                self._wakeup_sent = True
+                self._wakeup_writer.send_bytes(b'')
+        return len(tasks)
+
+    def run(self, func, arg_list):
+        """Call func(*args) for each args tuple; return (result, error) pairs in order"""
+        outcomes = [None] * len(arg_list)
+        for position, result, error in self.run_iter(func, arg_list):
+            outcomes[position] = (result, error)
+        return outcomes
+
+    def run_iter(self, func, arg_list, limit=None):
+        """Submit func(*args) for each args tuple and return an iterator of
+        (position, result, error) in completion order
+        
+        ``arg_list`` may be any iterable. Without ``limit`` all of it is
+        submitted right away. With it, only the first ``limit`` tasks are, and
+        the next args are taken from ``arg_list`` as each one completes, so a
+        generator that reads them (like an archive's members) stays at most
+        ``limit`` tasks ahead of the pool.
+        """
+        if self.processes <= 0:
+            return self._run_inline(func, arg_list)
+
+        completed = queue.Queue()
+        tasks = (
+            (func, args, lambda result, error, position=position: completed.put((position, result, error)))
+            for position, args in enumerate(arg_list)
+        )
+        in_flight = self._submit(list(islice(tasks, limit) if limit else tasks))
+        return self._collect(tasks, completed, in_flight)
+
+    def _collect(self, tasks, completed, in_flight):
+        # The dispatcher reports every task exactly once: a result, an error or a timeout
+        while in_flight:
+            outcome = completed.get()
+            in_flight += self._submit(list(islice(tasks, 1))) - 1
+            yield outcome
+
+    def _run_inline(self, func, arg_list):
+        for position, args in enumerate(arg_list):
+            outcome = []
+
+            def run_task(args=args, outcome=outcome):
+                try:
+                    outcome.append((func(*args), None))
+                except Exception as e:
+                    outcome.append((None, e))
+
+            worker = threading.Thread(target=run_task, daemon=True)
+            worker.start()
+            worker.join(self.timeout if self.timeout > 0 else None)
+            if outcome:
+                yield (position,) + outcome[0]
+            else:
+                self._counts['timed_out'] += 1
+                yield position, None, self._timeout_error()
+
+    def _timeout_error(self):
+        return TimeoutError(f'Timed out after {self.timeout:g}s while parsing')
+
+    def _start_process(self):
+        connection, child_connection = self._context.Pipe()
+        process = self._context.Process(target=parse_pool_worker, args=(child_connection,), daemon=True)
+        process.start()
+        child_connection.close()
+        self._counts['started'] += 1
+        return process, connection
+
+    @staticmethod
+    def _stop_process(process, connection):
+        process.kill()
+        process.join()
+        connection.close()
+
+    def _dispatch(self):
+        idle = []  # (process, connection)
+        busy = {}  # connection -> (process, done, deadline or None)
+
+        while True:
+            # Hand waiting tasks to free processes, starting new ones up to the limit
+            while True:
+                with self._lock:
+                    if not self._pending or (not idle and len(busy) >= self.processes):
+                        break
+                    func, args, done = self._pending.popleft()
+                fresh = not idle
+                try:
+                    process, connection = self._start_process() if fresh else idle.pop()
+                except Exception as e:
+                    done(None, e)
+                    continue
+                try:
+                    connection.send((func, args))
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    # Nothing was written; the process is still free
+                    idle.append((process, connection))
+                    done(None, e)
+                    continue
+                except Exception as e:
+                    self._stop_process(process, connection)
+                    if fresh:
+                        done(None, e)
+                    else:
+                        # The process died while idle; retry on a fresh one
+                        with self._lock:
+                            self._pending.appendleft((func, args, done))
+                    continue
+                deadline = time.monotonic() + self.timeout if self.timeout > 0 else None
+                busy[connection] = (process, done, deadline)
+
+            deadlines = [deadline for _, _, deadline in busy.values() if deadline is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            ready = multiprocessing.connection.wait([self._wakeup_reader] + list(busy), wait_for)
+
+            for connection in ready:
+                if connection is self._wakeup_reader:
+                    with self._lock:
+                        while self._wakeup_reader.poll():
+                            self._wakeup_reader.recv_bytes()
+                        self._wakeup_sent = False
+                    continue
+
+                process, done, _ = busy.pop(connection)
+                try:
+                    result, error = connection.recv()
+                except (EOFError, OSError):
+                    self._counts['crashed'] += 1
+                    self._stop_process(process, connection)
+                    done(None, RuntimeError('The parser process exited unexpectedly'))
+                    continue
+                idle.append((process, connection))
+                done(result, error)
+
+            # Only the process running a late task is replaced
+            now = time.monotonic()
+            for connection, (process, done, deadline) in list(busy.items()):
+                if deadline is not None and deadline <= now:
+                    del busy[connection]
+                    self._counts['timed_out'] += 1
+                    logger.warning('Parse task timed out after %gs; replacing its process', self.timeout)
+                    self._stop_process(process, connection)
+                    done(None, self._timeout_error())
+
+    def stats(self):
+        return dict(self._counts, processes=self.processes, timeout=self.timeout, start_method=self.start_method)
+
+RESUME_PARSE_POOL = ResumeParsePool(app.config['PARSE_POOL_WORKERS'], app.config['PARSE_TIMEOUT'])
+
+def parse_resume(data, filename):
+    """Extract text, skills and candidate name from one resume's bytes
+    
+    Runs inside the parse pool, so it only takes and returns picklable values;
+    ``timings`` are the seconds spent per stage, for the request's trace.
+    """
+    trace = RequestTrace()
+    taxonomy = SKILL_TAXONOMY.current()
+    resume_text, resume_skills = extract_resume_text_and_skills(io.BytesIO(data), filename, taxonomy, trace.stage)
+    
+    if not resume_text.strip():
+        return None
+    
+    return {
+        'resume_text': resume_text,
+        'resume_skills': resume_skills,
+        'candidate_name': find_candidate_name(resume_text),
+        'taxonomy_fingerprint': taxonomy.fingerprint,
+        'timings': dict(trace.stages)
+    }
+
+def parse_resume_cached(data, filename, taxonomy):
+    """Parse one resume on the request thread, going through RESUME_CACHE
+    
+    Returns the parsed resume dict, or None if no text could be extracted.
+    """
+    resume_hash = content_hash(data)
+    cache_key = ResumeCache.key(resume_hash, taxonomy.fingerprint)
+    parsed = RESUME_CACHE.get(cache_key)
+    
+    if parsed is None:
+        resume_text, resume_skills = extract_resume_text_and_skills(io.BytesIO(data), filename, taxonomy)
+        if not resume_text.strip():
+            return None
+        
+        parsed = {
+            'resume_text': resume_text,
+            'resume_skills': resume_skills,
+            'candidate_name': find_candidate_name(resume_text)
+        }
+        RESUME_CACHE.put(cache_key, parsed)
+    
+    resume = uploaded_resume(filename, parsed, resume_hash)
+    retain_candidates([resume], taxonomy)
+    
+    return resume
+
+def read_uploaded_resumes(files):
+    """Read the bytes of a batch of uploaded resumes, without touching disk
+    
+    Returns (uploads, errors): (index, original filename, secure filename, bytes)
+    for every file that can be parsed, and {index: message} for the rest.
+    """
+    errors = {}
+    uploads = []
+    
+    for index, file in enumerate(files):
+        if file.filename == '':
+            continue
+        
+        if not allowed_file(file.filename):
+            errors[index] = f'{file.filename}: Invalid file type'
+            continue
+        
+        # Read straight from the upload stream; parse workers get the bytes
+        try:
+            data = read_upload(file)
+        except Exception as e:
+            errors[index] = f'{file.filename}: {str(e)}'
+            continue
+        
+        uploads.append((index, file.filename, secure_filename(file.filename), data))
+    
+    return uploads, errors
+
+def format_size(size):
+    """A byte count for error messages: '16 MB', '1.5 MB', '64 KB' or '16 bytes'"""
+    for unit, scale in (('MB', 1024 * 1024), ('KB', 1024)):
+        if size >= scale:
+            return f'{round(size / scale, 1):g} {unit}'
+    return f'{size} bytes'
+
+class ArchiveRejected(Exception):
+    """An uploaded archive can't be read, or breaks one of the ARCHIVE_* limits"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+def read_archive_resumes(stream, errors):
+    """Read the resumes in an uploaded ZIP or tar (optionally gzip, bzip2 or xz
+    compressed) archive, one member at a time and without touching disk
+    
+    Returns an iterator of uploads like read_uploaded_resumes', in archive
+    order, that only reads a member when the next one is asked for; members
+    that are skipped or fail go into ``errors`` as {index: message} along the
+    way. Directories, links and hidden or __MACOSX entries are skipped. A
+    member over ARCHIVE_MAX_MEMBER_SIZE, or a ZIP member compressed more than
+    ARCHIVE_MAX_RATIO times, is a file error: no more of it is decompressed
+    than the limit. Raises ArchiveRejected right away for an unreadable
+    archive or a ZIP listing more than ARCHIVE_MAX_MEMBERS files, and from the
+    iterator when the archive as a whole goes over a limit while it is read.
+    """
+    config = app.config
+    members = iter_archive_members(stream)
+    
+    def read_members():
+        total_size = 0
+        for index, (name, read, compressed_size) in enumerate(members):
+            basename = name.replace('\\', '/').rsplit('/', 1)[-1]
+            if not allowed_file(basename):
+                errors[index] = f'{name}: Invalid file type'
+                continue
+            
+            try:
+                with trace_stage('save'):
+                    data = read(config['ARCHIVE_MAX_MEMBER_SIZE'] + 1)
+            except Exception as e:
+                errors[index] = f'{name}: {str(e)}'
+                continue
+            
+            total_size += len(data)
+            if total_size > config['ARCHIVE_MAX_TOTAL_SIZE']:
+                raise ArchiveRejected(
+                    f"Archive expands to more than {format_size(config['ARCHIVE_MAX_TOTAL_SIZE'])}", 413
+                )
+            if len(data) > config['ARCHIVE_MAX_MEMBER_SIZE']:
+                errors[index] = f"{name}: Larger than {format_size(config['ARCHIVE_MAX_MEMBER_SIZE'])} uncompressed"
+                continue
+            if compressed_size is not None and len(data) > config['ARCHIVE_MAX_RATIO'] * max(compressed_size, 1024):
+                errors[index] = f'{name}: Compressed too much to be a resume'
+                continue
+            
+            trace = current_trace()
+            if trace is not None:
+                trace.bytes_read += len(data)
+                trace.resumes += 1
+            yield index, name, secure_filename(basename), data
+    
+    return read_members()
+
+def iter_archive_members(stream):
+    """An iterator of (name, read, compressed size or None) for each file in a
+    ZIP or tar archive stream, in archive order; ``read(limit)`` decompresses
+    at most ``limit`` bytes of the member and must be called before the next one
+    
+    The archive is opened, and a ZIP's member count checked, before this
+    returns. Every file counts against ARCHIVE_MAX_MEMBERS, skipped or not, so
+    an archive of junk entries can't make the request do unbounded work. ZIP
+    members report their own compressed size. A tarball is read
+    sequentially; it is rejected once what it expanded to exceeds
+    ARCHIVE_MAX_RATIO times the compressed bytes read so far.
+    """
+    max_members = app.config['ARCHIVE_MAX_MEMBERS']
+    
+    def skipped(name):
+        parts = name.replace('\\', '/').split('/')
+        return parts[0] == '__MACOSX' or parts[-1].startswith('.')
+    
+    def too_many_members():
+        return ArchiveRejected(f'Archive has more than {max_members} files', 413)
+    
+    if zipfile.is_zipfile(stream):
+        stream.seek(0)
+        try:
+            archive = zipfile.ZipFile(stream)
+        except zipfile.BadZipFile as e:
+            raise ArchiveRejected(f'Could not read archive: {e}')
+        # The central directory lists every entry up front
+        files = [info for info in archive.infolist() if not info.is_dir()]
+        if len(files) > max_members:
+            archive.close()
+            raise too_many_members()
+        
+        def zip_members():
+            try:
+                with archive:
+                    for info in files:
+                        if skipped(info.filename):
+                            continue
+                        def read(limit, info=info):
+                            with archive.open(info) as member:
+                                return member.read(limit)
+                        yield info.filename, read, info.compress_size
+            except zipfile.BadZipFile as e:
+                raise ArchiveRejected(f'Could not read archive: {e}')
+        
+        return zip_members()
+    
+    stream.seek(0)
+    try:
+        archive = tarfile.open(fileobj=stream, mode='r|*')
+    except (tarfile.TarError, EOFError, OSError):
+        raise ArchiveRejected('Not a ZIP or tar archive')
+    
+    def tar_members():
+        expanded = 0
+        members = 0
+        try:
+            with archive:
+                for info in archive:
+                    if info.isdir():
+                        continue
+                    members += 1
+                    if members > max_members:
+                        raise too_many_members()
+                    if not info.isfile() or skipped(info.name):
+                        continue
+                    expanded += info.size
+                    if expanded > 1024 * 1024 and expanded > app.config['ARCHIVE_MAX_RATIO'] * stream.tell():
+                        raise ArchiveRejected('Archive is compressed too much to hold resumes', 413)
+                    yield info.name, archive.extractfile(info).read, None
+        except (tarfile.TarError, EOFError, OSError) as e:
+            raise ArchiveRejected(f'Could not read archive: {e}')
+    
+    return tar_members()
+
+def read_upload(file):
+    """All bytes of an uploaded file, counted in the current trace"""
+    with trace_stage('save'):
+        data = file.stream.read()
+    
+    trace = current_trace()
+    if trace is not None:
+        trace.bytes_read += len(data)
+        trace.resumes += 1
+    
+    return data
+
+def iter_parsed_resumes(uploads, taxonomy, max_in_flight=None):
+    """Start parsing uploads from read_uploaded_resumes and return an iterator of
+    (index, resume, error) as each one finishes
+    
+    Cache misses are submitted to the parse pool before this returns, so the
+    caller can do other work (like scraping jobs) while they parse. Cached
+    resumes come out first; exactly one of resume and error is None.
+    
+    With ``max_in_flight``, ``uploads`` (e.g. from read_archive_resumes) is
+    read lazily instead: only that many misses are read ahead of the parse
+    pool, and cached resumes come out as they are reached.
+    """
+    # Resumes seen before (same bytes, same taxonomy) come from the cache
+    hits = deque()
+    misses = []
+    
+    def miss_args():
+        for index, original_filename, filename, data in uploads:
+            resume_hash = content_hash(data)
+            cached = RESUME_CACHE.get(ResumeCache.key(resume_hash, taxonomy.fingerprint))
+            if cached is not None:
+                hits.append((index, filename, resume_hash, cached))
+            else:
+                misses.append((index, original_filename, filename, resume_hash))
+                yield data, filename
+    
+    arg_list = miss_args() if max_in_flight else list(miss_args())
+    outcomes = RESUME_PARSE_POOL.run_iter(parse_resume, arg_list, max_in_flight)
+    
+    return _iter_parse_outcomes(hits, misses, outcomes, taxonomy)
+
+def _iter_parse_outcomes(hits, misses, outcomes, taxonomy):
+    # With CANDIDATE_STORE_RETAIN_UPLOADS, everything parsed is added to the
+    # candidate pool once the batch is done
+    resumes = []
+    trace = current_trace()
+    
+    def cached_resumes():
+        # Hits read so far; reading more uploads happens while outcomes are pulled
+        while hits:
+            index, filename, resume_hash, parsed = hits.popleft()
+            resumes.append(uploaded_resume(filename, parsed, resume_hash))
+            yield index, resumes[-1], None
+    
+    yield from cached_resumes()
+    
+    for position, result, error in outcomes:
+        yield from cached_resumes()
+        index, original_filename, filename, resume_hash = misses[position]
+        
+        if error is not None:
+            yield index, None, f'{original_filename}: {str(error)}'
+            continue
+        
+        if result is None:
+            yield index, None, f'{filename}: Could not extract text'
+            continue
+        
+        if trace is not None:
+            trace.add(result['timings'])
+        
+        # The pool worker may have been on a different taxonomy
+        resume_skills = result['resume_skills']
+        if result['taxonomy_fingerprint'] != taxonomy.fingerprint:
+            with trace_stage('extract_skills'):
+                resume_skills = extract_skills_and_keywords(result['resume_text'], taxonomy)
+        
+        parsed = {
+            'resume_text': result['resume_text'],
+            'resume_skills': resume_skills,
+            'candidate_name': result['candidate_name']
+        }
+        RESUME_CACHE.put(ResumeCache.key(resume_hash, taxonomy.fingerprint), parsed)
+        
+        resumes.append(uploaded_resume(filename, parsed, resume_hash))
+        yield index, resumes[-1], None
+    
+    yield from cached_resumes()
+    retain_candidates(resumes, taxonomy)
+
+def uploaded_resume(filename, parsed, resume_hash):
+    """The resume dict the batch endpoints work with, from a cached parse"""
+    return {
+        'filename': filename,
+        'content_hash': resume_hash,
+        'candidate_name': parsed['candidate_name'] or candidate_name_from_filename(filename),
+        'resume_skills': parsed['resume_skills'],
+        'resume_text': parsed['resume_text']
+    }
+
+def retain_candidates(resumes, taxonomy):
+    """Add parsed uploads to the candidate pool, if the pool keeps uploads"""
+    if resumes and app.config['CANDIDATE_STORE_RETAIN_UPLOADS']:
+        CANDIDATE_STORE.add(resumes, taxonomy.fingerprint)
+
+def parse_uploaded_resumes(files, taxonomy):
+    """Parse a batch of uploaded resumes on the parse pool, without touching disk
+    
+    Returns (resumes, errors): the parsed resumes in upload order, and error
+    messages for files that were skipped or failed, also in upload order.
+    """
+    uploads, errors = read_uploaded_resumes(files)
+    
+    parsed = {}
+    for index, resume, error in iter_parsed_resumes(uploads, taxonomy):
+        if error is not None:
+            errors[index] = error
+        else:
+            parsed[index] = resume
+    
+    resumes = [parsed[index] for index in sorted(parsed)]
+    
+    return resumes, [errors[index] for index in sorted(errors)]
+
+BatchEvent = namedtuple('BatchEvent', ['event', 'data', 'status'], defaults=(200,))
+
+STREAM_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream'
+}
+
+def streaming_mode():
+    """'ndjson' or 'sse' if the client asked for a streamed response, else None
+    
+    Opt in with ``?stream=ndjson`` / ``?stream=sse`` or an Accept header of
+    application/x-ndjson / text/event-stream.
+    """
+    mode = request.args.get('stream', '').lower()
+    if mode in STREAM_MIMETYPES:
+        return mode
+    
+    best = request.accept_mimetypes.best_match(['application/json'] + list(STREAM_MIMETYPES.values()))
+    for mode, mimetype in STREAM_MIMETYPES.items():
+        if best == mimetype:
+            return mode
+    return None
+
+Page = namedtuple('Page', ['k', 'offset'], defaults=(None, 0))
+
+def read_page(default_k=None, prefix=''):
+    """(Page, error) from the ``k`` and ``offset`` query or form parameters
+    
+    k=None returns the whole ranking. prefix selects a second pair of
+    parameters, e.g. ``jobs_k``/``jobs_offset``.
+    """
+    k = request.values.get(f'{prefix}k', default_k, type=int)
+    offset = request.values.get(f'{prefix}offset', 0, type=int)
+    
+    if k is not None and k < 1:
+        return None, f'{prefix}k must be at least 1'
+    if offset < 0:
+        return None, f'{prefix}offset must not be negative'
+    return Page(k, offset), None
+
+def respond_with_events(events, mode):
+    """Turn a batch endpoint's BatchEvents into a response
+    
+    Without a streaming mode only the last event matters: its data and status
+    are the plain JSON response. Streamed, every event is sent as soon as it is
+    produced, as one NDJSON line ({"event": ..., "data": ...}) or one SSE frame.
+    """
+    if mode is None:
+        for event in events:
+            final = event
+        return jsonify(final.data), final.status
+    
+    def generate():
+        for event in events:
+            payload = current_app.json.dumps(event.data)
+            if mode == 'sse':
+                yield f'event: {event.event}\ndata: {payload}\n\n'
+            else:
+                yield current_app.json.dumps({'event': event.event, 'data': event.data}) + '\n'
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype=STREAM_MIMETYPES[mode],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+class BatchJobLost(Exception):
+    """The job was claimed by another worker after this one stopped heartbeating"""
+
+class BatchJobQueue:
+    """SQLite-backed queue and result store for asynchronous batch screening.
+
+    A submitted job keeps its uploaded files until it finishes, one event row
+    per scored candidate or failed file, and the final response body, so any
+    worker process can report progress and results survive restarts. Running
+    jobs heartbeat; a job whose worker stopped heartbeating for ``stale_after``
+    seconds is claimed again from scratch, up to ``max_attempts`` times.
+    """
+
+    def __init__(self, db_path, stale_after=120, max_attempts=3, retention_seconds=7 * 24 * 3600):
+        self.db_path = db_path
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across forks and threads
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        if not self._schema_ready:
+            # Created on first use, so importing the module opens no database
+            with self._schema_lock:
+                if not self._schema_ready:
+                    with connection:
+                        self._create_schema(connection)
+                    self._schema_ready = True
+        return connection
+
+    @staticmethod
+    def _create_schema(connection):
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS batch_jobs ('
+            'id TEXT PRIMARY KEY, kind TEXT NOT NULL, params TEXT NOT NULL, status TEXT NOT NULL, '
+            'total INTEGER NOT NULL, processed INTEGER NOT NULL DEFAULT 0, attempts INTEGER NOT NULL DEFAULT 0, '
+            'created_at REAL NOT NULL, started_at REAL, finished_at REAL, heartbeat_at REAL, '
+            'result TEXT, result_status INTEGER)'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS batch_jobs_status ON batch_jobs (status, created_at)')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS batch_job_files ('
+            'job_id TEXT NOT NULL, position INTEGER NOT NULL, filename TEXT NOT NULL, data BLOB NOT NULL, '
+            'PRIMARY KEY (job_id, position))'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS batch_job_events ('
+            'job_id TEXT NOT NULL, seq INTEGER NOT NULL, event TEXT NOT NULL, data TEXT NOT NULL, '
+            'PRIMARY KEY (job_id, seq))'
+        )
+
+    def submit(self, kind, params, uploads, errors):
+        """Queue a job for uploads/errors from read_uploaded_resumes; returns its ID"""
+        job_id = uuid.uuid4().hex
+        params = dict(params, errors=sorted(errors.items()))
+
+        with self._connect() as connection:
+            connection.execute(
+                'INSERT INTO batch_jobs (id, kind, params, status, total, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, kind, json.dumps(params), 'queued', len(uploads) + len(errors), time.time())
+            )
+            connection.executemany(
+                'INSERT INTO batch_job_files (job_id, position, filename, data) VALUES (?, ?, ?, ?)',
+                [(job_id, index, original_filename, data) for index, original_filename, _, data in uploads]
+            )
+
+        return job_id
+
+    def claim(self):
+        """Take the oldest runnable job, or None
+
+        Returns a dict with the job's id, kind, params, attempt and uploads in
+        the shape read_uploaded_resumes produces.
+        """
+        now = time.time()
+        stale_before = now - self.stale_after
+
+        with self._connect() as connection:
+            # Jobs whose worker died too many times are given up on
+            connection.execute(
+                'UPDATE batch_jobs SET status = ?, finished_at = ?, result = ?, result_status = 500 '
+                'WHERE status = ? AND heartbeat_at < ? AND attempts >= ?',
+                ('failed', now, json.dumps({'error': 'Batch job stopped responding too many times'}),
+                 'running', stale_before, self.max_attempts)
+            )
+            rows = connection.execute(
+                'SELECT id, kind, params, attempts FROM batch_jobs '
+                'WHERE status = ? OR (status = ? AND heartbeat_at < ?) ORDER BY created_at LIMIT 5',
+                ('queued', 'running', stale_before)
+            ).fetchall()
+
+        for job_id, kind, params, attempts in rows:
+            with self._connect() as connection:
+                # Only one worker wins the update for a given attempt
+                claimed = connection.execute(
+                    'UPDATE batch_jobs SET status = ?, attempts = ?, processed = 0, started_at = ?, heartbeat_at = ? '
+                    'WHERE id = ? AND attempts = ? AND (status = ? OR (status = ? AND heartbeat_at < ?))',
+                    ('running', attempts + 1, now, now, job_id, attempts, 'queued', 'running', stale_before)
+                ).rowcount
+                if not claimed:
+                    continue
+                connection.execute('DELETE FROM batch_job_events WHERE job_id = ?', (job_id,))
+                files = connection.execute(
+                    'SELECT position, filename, data FROM batch_job_files WHERE job_id = ? ORDER BY position', (job_id,)
+                ).fetchall()
+
+            return {
+                'id': job_id,
+                'kind': kind,
+                'params': json.loads(params),
+                'attempt': attempts + 1,
+                'uploads': [(position, filename, secure_filename(filename), data) for position, filename, data in files]
+            }
+
+        return None
+
+    def heartbeat(self, running):
+        """Mark (job_id, attempt) pairs as still running"""
+        if not running:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                'UPDATE batch_jobs SET heartbeat_at = ? WHERE id = ? AND attempts = ? AND status = ?',
+                [(time.time(), job_id, attempt, 'running') for job_id, attempt in running]
+            )
+
+    def add_event(self, job_id, attempt, event):
+        """Record a 'candidate' or 'file_error' BatchEvent for a running job"""
+        with self._connect() as connection:
+            updated = connection.execute(
+                'UPDATE batch_jobs SET processed = processed + 1, heartbeat_at = ? '
+                'WHERE id = ? AND attempts = ? AND status = ?',
+                (time.time(), job_id, attempt, 'running')
+            ).rowcount
+            if not updated:
+                raise BatchJobLost(job_id)
+            seq = connection.execute('SELECT processed FROM batch_jobs WHERE id = ?', (job_id,)).fetchone()[0]
+            connection.execute(
+                'INSERT INTO batch_job_events (job_id, seq, event, data) VALUES (?, ?, ?, ?)',
+                (job_id, seq, event.event, json.dumps(event.data))
+            )
+
+    def finish(self, job_id, attempt, event):
+        """Store the final BatchEvent of a job; its uploaded files are no longer needed"""
+        with self._connect() as connection:
+            updated = connection.execute(
+                'UPDATE batch_jobs SET status = ?, finished_at = ?, result = ?, result_status = ? '
+                'WHERE id = ? AND attempts = ? AND status = ?',
+                ('completed' if event.status == 200 else 'failed', time.time(), json.dumps(event.data),
+                 event.status, job_id, attempt, 'running')
+            ).rowcount
+            if not updated:
+                raise BatchJobLost(job_id)
+            connection.execute('DELETE FROM batch_job_files WHERE job_id = ?', (job_id,))
+
+    def status(self, job_id, since=0):
+        """Progress of a job plus its events after ``since``, or None if unknown"""
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT kind, status, total, processed, created_at, started_at, finished_at '
+                'FROM batch_jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            events = connection.execute(
+                'SELECT seq, event, data FROM batch_job_events WHERE job_id = ? AND seq > ? ORDER BY seq',
+                (job_id, since)
+            ).fetchall()
+
+        kind, status, total, processed, created_at, started_at, finished_at = row
+        timestamp = lambda value: datetime.fromtimestamp(value).isoformat() if value else None
+
+        return {
+            'job_id': job_id,
+            'kind': kind,
+            'status': status,
+            'total': total,
+            'processed': processed,
+            'created_at': timestamp(created_at),
+            'started_at': timestamp(started_at),
+            'finished_at': timestamp(finished_at),
+            'candidates': [json.loads(data) for _, event, data in events if event == 'candidate'],
+            'errors': [json.loads(data)['error'] for _, event, data in events if event == 'file_error'],
+            'next_since': events[-1][0] if events else since
+        }
+
+    def result(self, job_id):
+        """(status, body, http status) of a job's final event; body is None until it finishes"""
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT status, result, result_status FROM batch_jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, result, result_status = row
+        return status, json.loads(result) if result is not None else None, result_status
+
+    def purge(self):
+        """Delete finished jobs older than the retention period"""
+        with self._connect() as connection:
+            expired = connection.execute(
+                'SELECT id FROM batch_jobs WHERE finished_at < ?', (time.time() - self.retention_seconds,)
+            ).fetchall()
+            connection.executemany('DELETE FROM batch_job_events WHERE job_id = ?', expired)
+            connection.executemany('DELETE FROM batch_job_files WHERE job_id = ?', expired)
+            connection.executemany('DELETE FROM batch_jobs WHERE id = ?', expired)
+
+BATCH_JOBS = BatchJobQueue(
+    app.config['BATCH_JOB_DB'],
+    app.config['BATCH_JOB_STALE_AFTER'],
+    app.config['BATCH_JOB_MAX_ATTEMPTS'],
+    app.config['BATCH_JOB_RETENTION_HOURS'] * 3600
+)
+
+class BatchJobWorkers:
+    """Background threads that run queued batch jobs in this process.
+
+    Started on first use of the batch job endpoints, so every gunicorn worker
+    that serves them helps drain the shared queue. Parsing inside a job still
+    goes through the parse pool, so one thread per process is usually enough.
+    """
+
+    def __init__(self, job_queue, threads, poll_interval=1.0, purge_interval=3600):
+        self.job_queue = job_queue
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.purge_interval = purge_interval
+        self._running = {}
+        self._started_pid = None
+        self._last_purge = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    def ensure_started(self):
+        with self._lock:
+            # Threads don't survive a fork, so a forked worker starts its own
+            if self._started_pid == os.getpid() or self.threads <= 0:
+                return
+            self._started_pid = os.getpid()
+            self._running = {}
+            for _ in range(self.threads):
+                threading.Thread(target=self._work, daemon=True).start()
+            threading.Thread(target=self._heartbeat, daemon=True).start()
+
+    def notify(self):
+        """Wake an idle thread for a newly submitted job"""
+        self._wakeup.set()
+
+    def _work(self):
+        while True:
+            try:
+                job = self.job_queue.claim()
+            except sqlite3.Error as e:
+                logger.error('Error claiming batch job: %s', e)
+                job = None
+
+            if job is None:
+                self._purge_if_due()
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._running[job['id']] = job['attempt']
+            try:
+                run_batch_job(job, self.job_queue)
+            except BatchJobLost:
+                logger.warning('Batch job %s was taken over by another worker', job['id'])
+            except Exception as e:
+                logger.exception('Error running batch job %s: %s', job['id'], e)
+                try:
+                    self.job_queue.finish(job['id'], job['attempt'], BatchEvent(
+                        'error', {'error': f'Error processing batch job: {str(e)}'}, 500
+                    ))
+                except (BatchJobLost, sqlite3.Error):
+                    pass
+            finally:
+                self._running.pop(job['id'], None)
+
+    def _heartbeat(self):
+        while True:
+            time.sleep(max(self.job_queue.stale_after / 4, 0.1))
+            try:
+                self.job_queue.heartbeat(list(self._running.items()))
+            except sqlite3.Error as e:
+                logger.error('Error updating batch job heartbeat: %s', e)
+
+    def _purge_if_due(self):
+        if time.time() - self._last_purge < self.purge_interval:
+            return
+        self._last_purge = time.time()
+        try:
+            self.job_queue.purge()
+        except sqlite3.Error as e:
+            logger.error('Error purging batch jobs: %s', e)
+
+BATCH_JOB_WORKERS = BatchJobWorkers(BATCH_JOBS, app.config['BATCH_JOB_THREADS'])
+
+BATCH_JOB_KINDS = ('upload-multiple', 'analyze-multiple-with-linkedin')
+
+def run_batch_job(job, job_queue):
+    """Run a claimed job through the same event generators as the batch endpoints
+    
+    Its stages are recorded in /metrics under the endpoint ``batch-job <kind>``.
+    """
+    trace = RequestTrace()
+    status = 500
+    try:
+        with tracing(trace):
+            status = _run_batch_job(job, job_queue)
+    finally:
+        METRICS.record_request(f"batch-job {job['kind']}", status, trace)
+
+def _run_batch_job(job, job_queue):
+    taxonomy = SKILL_TAXONOMY.current()
+    params = job['params']
+    errors = dict(params['errors'])
+    page = Page(*params.get('page', Page()))
+
+    if job['kind'] == 'upload-multiple':
+        job_description = params['job_description']
+        events = rank_uploaded_candidates(
+            job['uploads'], errors, job_description, parse_job_description(job_description, taxonomy), taxonomy, page
+        )
+    else:
+        events = rank_candidates_for_linkedin_jobs(
+            job['uploads'], errors, taxonomy, page, Page(*params.get('job_page', Page(10)))
+        )
+
+    for event in events:
+        if event.event in ('candidate', 'file_error'):
+            job_queue.add_event(job['id'], job['attempt'], event)
+        else:
+            job_queue.finish(job['id'], job['attempt'], event)
+            return event.status
+
+@app.before_request
+def start_job_refresher():
+    """Keep the LinkedIn job cache refreshing from the web workers, when
+    LINKEDIN_REFRESH_IN_WORKERS is on; one worker per host scrapes at a time"""
+    if app.config['LINKEDIN_REFRESH_IN_WORKERS']:
+        JOB_REFRESHER.ensure_started()
+
+@app.before_request
+def start_request_trace():
+    """Trace the request's stages; receiving and spooling its uploads is the save stage"""
+    trace = _TRACE.trace = RequestTrace()
+    if request.mimetype == 'multipart/form-data':
+        with trace.stage('save'):
+            request.files
+
+@app.after_request
+def record_request_metrics(response):
+    """Record the request in /metrics; a streamed one once its body has been sent"""
+    trace = current_trace()
+    if trace is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        status = response.status_code
+        if response.is_streamed:
+            response.call_on_close(lambda: METRICS.record_request(endpoint, status, trace))
+        else:
+            METRICS.record_request(endpoint, status, trace)
+    return response
+
+@app.teardown_request
+def end_request_trace(error=None):
+    _TRACE.trace = None
 
 @app.route('/')
 def index():
@@ -564,31 +3916,27 @@ def upload_file():
         return jsonify({'error': 'Job description is required'}), 400
     
     if file and allowed_file(file.filename):
-        # Save the file
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
         
         try:
-            # Extract text from resume
-            resume_text = extract_text_from_file(file_path)
+            # Extract text and skills straight from the upload stream (cached by
+            # content hash), and the job skills with the same taxonomy version
+            taxonomy = SKILL_TAXONOMY.current()
+            resume = parse_resume_cached(read_upload(file), filename, taxonomy)
             
-            if not resume_text.strip():
+            if resume is None:
                 return jsonify({'error': 'Could not extract text from resume'}), 400
             
-            # Extract skills from resume and job description
-            resume_skills = extract_skills_and_keywords(resume_text)
-            job_skills = extract_skills_and_keywords(job_description)
+            resume_text = resume['resume_text']
+            resume_skills = resume['resume_skills']
+            job_skills = list(parse_job_description(job_description, taxonomy).skills)
             
-            # Debug: Print extracted skills
-            print(f"DEBUG - Resume skills found: {resume_skills}")
-            print(f"DEBUG - Job skills found: {job_skills}")
+            logger.debug('Resume skills found: %s', resume_skills)
+            logger.debug('Job skills found: %s', job_skills)
             
             # Calculate match score
-            match_result = calculate_match_score(resume_skills, job_skills)
-            
-            # Clean up uploaded file
-            os.remove(file_path)
+            with trace_stage('score'):
+                match_result = calculate_match_score(resume_skills, job_skills)
             
             # Return results with all skills info for preview
             return jsonify({
@@ -612,9 +3960,6 @@ def upload_file():
             })
             
         except Exception as e:
-            # Clean up file on error
-            if os.path.exists(file_path):
-                os.remove(file_path)
             return jsonify({'error': f'Error processing file: {str(e)}'}), 500
     
     return jsonify({'error': 'Invalid file type. Please upload PDF, DOCX, or TXT files.'}), 400
@@ -622,7 +3967,29 @@ def upload_file():
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy'})
+    return jsonify({
+        'status': 'healthy',
+        'taxonomy_version': SKILL_TAXONOMY.current().version,
+        'resume_cache': RESUME_CACHE.stats(),
+        'job_description_cache': JOB_DESCRIPTION_CACHE.stats(),
+        'candidate_store': CANDIDATE_STORE.stats(),
+        'semantic_model': SEMANTIC_MODEL.stats(),
+        'linkedin_jobs': JOB_CACHE.stats(),
+        'linkedin_refresher': JOB_REFRESHER.status(),
+        'browser_pool': BROWSER_POOL.stats(),
+        'parse_pool': RESUME_PARSE_POOL.stats(),
+        'plugins': {
+            'extractors': EXTRACTORS.stats(),
+            'scrapers': SCRAPERS.stats(),
+            'pdf_backends': PDF_BACKENDS.stats(),
+            'pdf_backend': PDF_BACKEND
+        }
+    })
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus histograms of request latency, per-stage time, upload bytes and resume counts"""
+    return Response(METRICS.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 @app.route('/analyze-jobs', methods=['POST'])
 def analyze_jobs():
@@ -636,36 +4003,36 @@ def analyze_jobs():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
     
+    # Top 10 jobs unless the client pages through the ranking
+    page, page_error = read_page(default_k=10)
+    if page_error:
+        return jsonify({'error': page_error}), 400
+    
     if file and allowed_file(file.filename):
-        # Save the file
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
         
         try:
-            # Extract text from resume
-            resume_text = extract_text_from_file(file_path)
+            # Extract text and skills straight from the upload stream (cached by content hash)
+            taxonomy = SKILL_TAXONOMY.current()
+            resume = parse_resume_cached(read_upload(file), filename, taxonomy)
             
-            if not resume_text.strip():
+            if resume is None:
                 return jsonify({'error': 'Could not extract text from resume'}), 400
             
-            # Extract skills from resume
-            resume_skills = extract_skills_and_keywords(resume_text)
+            resume_text = resume['resume_text']
+            resume_skills = resume['resume_skills']
             
-            print(f"DEBUG - Resume skills found: {resume_skills}")
+            logger.debug('Resume skills found: %s', resume_skills)
             
-            # Scrape LinkedIn job postings
-            scraper = LinkedInJobScraper()
-            jobs = scraper.scrape_linkedin_posts(TRUSTED_LINKEDIN_PROFILES)
+            # LinkedIn job postings, as last scraped in the background
+            jobs = cached_linkedin_jobs()
             
-            print(f"DEBUG - Found {len(jobs)} jobs")
+            logger.debug('Found %d jobs', len(jobs))
             
             # Match and rank jobs
             matcher = JobMatcher()
-            ranked_jobs = matcher.rank_jobs(resume_skills, jobs)
-            
-            # Clean up uploaded file
-            os.remove(file_path)
+            with trace_stage('score'):
+                ranked_jobs = matcher.rank_jobs(resume_skills, jobs, taxonomy, *page)
             
             # Return results
             return jsonify({
@@ -675,13 +4042,12 @@ def analyze_jobs():
                 'total_resume_skills': len(resume_skills),
                 'total_jobs_found': len(jobs),
                 'top_matched_jobs': ranked_jobs,
+                'k': page.k,
+                'offset': page.offset,
                 'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
             })
             
         except Exception as e:
-            # Clean up file on error
-            if os.path.exists(file_path):
-                os.remove(file_path)
             return jsonify({'error': f'Error processing request: {str(e)}'}), 500
     
     return jsonify({'error': 'Invalid file type. Please upload PDF, DOCX, or TXT files.'}), 400
@@ -700,7 +4066,11 @@ def get_sample_jobs():
 
 @app.route('/upload-multiple', methods=['POST'])
 def upload_multiple_resumes():
-    """Handle multiple resume uploads and rank candidates by match score"""
+    """Handle multiple resume uploads and rank candidates by match score
+    
+    Streams each candidate as it is scored when the client opts in (see
+    streaming_mode); the plain JSON response is the final ranking.
+    """
     
     # Check if files are uploaded
     if 'resumes' not in request.files:
@@ -715,97 +4085,209 @@ def upload_multiple_resumes():
     if not job_description.strip():
         return jsonify({'error': 'Job description is required'}), 400
     
-    # Extract skills from job description once
-    job_skills = extract_skills_and_keywords(job_description)
+    # All candidates unless the client pages through the ranking
+    page, page_error = read_page()
+    if page_error:
+        return jsonify({'error': page_error}), 400
+    
+    # Use one taxonomy version for the whole batch
+    taxonomy = SKILL_TAXONOMY.current()
+    
+    # Extract skills from job description once (memoized across requests)
+    parsed_job_description = parse_job_description(job_description, taxonomy)
+    job_skills = list(parsed_job_description.skills)
     
     if not job_skills:
         return jsonify({'error': 'No technical skills found in job description'}), 400
     
-    candidates = []
-    errors = []
+    uploads, errors = read_uploaded_resumes(files)
     
-    # Process each resume
-    for file in files:
-        if file.filename == '':
+    mode = streaming_mode()
+    return respond_with_events(
+        rank_uploaded_candidates(uploads, errors, job_description, parsed_job_description, taxonomy, page,
+                                 stream=mode is not None),
+        mode
+    )
+
+@app.route('/upload-archive', methods=['POST'])
+def upload_archive():
+    """Rank the resumes in a ZIP or tar(.gz) archive, exactly as /upload-multiple
+    ranks the same files uploaded one by one
+    
+    The archive may be up to ARCHIVE_MAX_SIZE instead of MAX_CONTENT_LENGTH.
+    Streams like /upload-multiple when the client opts in.
+    """
+    if 'archive' not in request.files:
+        return jsonify({'error': 'No archive uploaded'}), 400
+    
+    file = request.files['archive']
+    job_description = request.form.get('job_description', '')
+    
+    if file.filename == '':
+        return jsonify({'error': 'No file selected'}), 400
+    
+    if not job_description.strip():
+        return jsonify({'error': 'Job description is required'}), 400
+    
+    page, page_error = read_page()
+    if page_error:
+        return jsonify({'error': page_error}), 400
+    
+    taxonomy = SKILL_TAXONOMY.current()
+    parsed_job_description = parse_job_description(job_description, taxonomy)
+    
+    if not parsed_job_description.skills:
+        return jsonify({'error': 'No technical skills found in job description'}), 400
+    
+    errors = {}
+    try:
+        uploads = read_archive_resumes(file.stream, errors)
+    except ArchiveRejected as e:
+        return jsonify({'error': str(e)}), e.status
+    
+    # Members are read as the parse pool frees up; enough stay queued to keep
+    # every parse process busy while the next one is decompressed
+    max_in_flight = 2 * max(1, RESUME_PARSE_POOL.processes)
+    
+    mode = streaming_mode()
+    return respond_with_events(
+        archive_events(rank_uploaded_candidates(uploads, errors, job_description, parsed_job_description, taxonomy,
+                                                page, stream=mode is not None, max_in_flight=max_in_flight)),
+        mode
+    )
+
+def archive_events(events):
+    """Pass BatchEvents through, ending with an error event if the archive turns
+    out to break a limit while its members are read"""
+    try:
+        yield from events
+    except ArchiveRejected as e:
+        yield BatchEvent('error', {'error': str(e)}, e.status)
+
+def rank_uploaded_candidates(uploads, errors, job_description, parsed_job_description, taxonomy, page=Page(),
+                             stream=True, max_in_flight=None):
+    """BatchEvents for /upload-multiple: each candidate as soon as it is scored,
+    then one page of the ranking
+    
+    With stream=False no candidate events are produced. Every resume is parsed
+    first and then all of them are scored in one batch, with a single TF-IDF
+    transform and sparse product. ``uploads`` may be read lazily (see
+    iter_parsed_resumes); errors it adds to ``errors`` are reported as they
+    appear.
+    """
+    job_skills = list(parsed_job_description.skills)
+    reported = set()
+    
+    def new_errors():
+        for index in sorted(errors.keys() - reported):
+            reported.add(index)
+            yield BatchEvent('file_error', {'error': errors[index]})
+    
+    yield from new_errors()
+    
+    candidates = {}
+    resumes = {}
+    matcher = JobMatcher()
+    
+    # With TF-IDF semantic scoring the job description is vectorized once
+    vectorizer = SEMANTIC_MODEL.current()
+    with trace_stage('score'):
+        job_vector = semantic_vectors(vectorizer, [job_description]) if vectorizer is not None else None
+    
+    # Score each resume as the parse pool finishes it
+    for index, resume, error in iter_parsed_resumes(uploads, taxonomy, max_in_flight):
+        if error is not None:
+            errors[index] = error
+        # Along with any archive members skipped while this one was parsing
+        yield from new_errors()
+        if resume is None:
             continue
         
-        if not allowed_file(file.filename):
-            errors.append(f'{file.filename}: Invalid file type')
+        if not stream:
+            resumes[index] = resume
             continue
         
-        try:
-            # Save the file temporarily
-            filename = secure_filename(file.filename)
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
-            
-            # Extract text from resume
-            resume_text = extract_text_from_file(file_path)
-            
-            if not resume_text.strip():
-                errors.append(f'{filename}: Could not extract text')
-                os.remove(file_path)
-                continue
-            
-            # Extract skills from resume
-            resume_skills = extract_skills_and_keywords(resume_text)
-            
-            # Calculate match score using advanced matching
-            matcher = JobMatcher()
-            match_result = matcher.calculate_advanced_match_score(
-                resume_skills, job_skills, job_description
+        with trace_stage('score'):
+            semantic_score = None
+            if vectorizer is not None:
+                semantic_score = semantic_scores(vectorizer, [resume['resume_skills']], job_vector)[0, 0]
+            candidates[index] = scored_candidate(
+                matcher, resume, job_skills, job_description, parsed_job_description, taxonomy, semantic_score
             )
-            
-            # Extract candidate name from resume (simple extraction)
-            candidate_name = extract_candidate_name(resume_text, filename)
-            
-            # Store candidate data
-            candidate_data = {
-                'filename': filename,
-                'candidate_name': candidate_name,
-                'match_score': match_result['total_score'],
-                'exact_match_score': match_result['exact_score'],
-                'fuzzy_match_score': match_result['fuzzy_score'],
-                'semantic_match_score': match_result['semantic_score'],
-                'matched_skills': match_result['matched_skills'],
-                'missing_skills': match_result['missing_skills'],
-                'total_required': match_result['total_required'],
-                'total_matched': match_result['total_matched'],
-                'all_resume_skills': resume_skills[:15],  # Limit for display
-                'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
-            }
-            
-            candidates.append(candidate_data)
-            
-            # Clean up the file
-            os.remove(file_path)
-            
-        except Exception as e:
-            errors.append(f'{file.filename}: {str(e)}')
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            continue
+        yield BatchEvent('candidate', candidates[index])
+    
+    yield from new_errors()
+    
+    if resumes:
+        with trace_stage('score'):
+            order = sorted(resumes)
+            semantic_column = [None] * len(order)
+            if vectorizer is not None:
+                semantic_column = semantic_scores(
+                    vectorizer, [resumes[index]['resume_skills'] for index in order], job_vector
+                )[:, 0]
+            for index, semantic_score in zip(order, semantic_column):
+                candidates[index] = scored_candidate(
+                    matcher, resumes[index], job_skills, job_description, parsed_job_description, taxonomy,
+                    semantic_score
+                )
+    
+    errors = [errors[index] for index in sorted(errors)]
     
     if not candidates:
-        return jsonify({
+        yield BatchEvent('error', {
             'error': 'No valid resumes could be processed',
             'errors': errors
-        }), 400
+        }, 400)
+        return
     
-    # Sort candidates by match score (descending)
-    candidates.sort(key=lambda x: x['match_score'], reverse=True)
+    # Rank candidates by match score (descending), ties in upload order; only
+    # the requested page is selected and sorted
+    candidates = [candidates[index] for index in sorted(candidates)]
+    with trace_stage('score'):
+        scores = np.array([candidate['match_score'] for candidate in candidates], dtype=np.float64)
+        ranked = [candidates[index] for index in top_k_indices(scores, *page)]
     
     # Return results
-    return jsonify({
+    yield BatchEvent('result', {
         'success': True,
         'total_processed': len(candidates),
         'job_skills': job_skills,
-        'candidates': candidates,
+        'candidates': ranked,
+        'k': page.k,
+        'offset': page.offset,
         'errors': errors if errors else None
     })
 
-def extract_candidate_name(resume_text, filename):
-    """Extract candidate name from resume text"""
+def scored_candidate(matcher, resume, job_skills, job_description, parsed_job_description, taxonomy,
+                     semantic_score=None):
+    """A resume's entry in the /upload-multiple ranking"""
+    resume_skills = resume['resume_skills']
+    resume_text = resume['resume_text']
+    
+    # Calculate match score using advanced matching
+    match_result = matcher.calculate_advanced_match_score(
+        resume_skills, job_skills, job_description, taxonomy,
+        requirement_index=parsed_job_description.requirement_index, semantic_score=semantic_score
+    )
+    
+    return {
+        'filename': resume['filename'],
+        'candidate_name': resume['candidate_name'],
+        'match_score': match_result['total_score'],
+        'exact_match_score': match_result['exact_score'],
+        'fuzzy_match_score': match_result['fuzzy_score'],
+        'semantic_match_score': match_result['semantic_score'],
+        'matched_skills': match_result['matched_skills'],
+        'missing_skills': match_result['missing_skills'],
+        'total_required': match_result['total_required'],
+        'total_matched': match_result['total_matched'],
+        'all_resume_skills': resume_skills[:15],  # Limit for display
+        'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
+    }
+
+def find_candidate_name(resume_text):
+    """Find a candidate name in the first lines of resume text, or None"""
     lines = resume_text.split('\n')
     
     # Try to find name in first few lines
@@ -830,12 +4312,27 @@ def extract_candidate_name(resume_text, filename):
             if all(word.replace('-', '').replace("'", '').isalpha() for word in words):
                 return line
     
-    # Fallback to filename without extension
+    return None
+
+def extract_candidate_name(resume_text, filename):
+    """Extract candidate name from resume text"""
+    candidate_name = find_candidate_name(resume_text)
+    if candidate_name:
+        return candidate_name
+    
+    return candidate_name_from_filename(filename)
+
+def candidate_name_from_filename(filename):
+    """Fallback candidate name: the filename without extension"""
     return filename.rsplit('.', 1)[0].replace('_', ' ').replace('-', ' ').title()
 
 @app.route('/analyze-multiple-with-linkedin', methods=['POST'])
 def analyze_multiple_with_linkedin():
-    """Analyze multiple resumes against LinkedIn job postings and rank both"""
+    """Analyze multiple resumes against LinkedIn job postings and rank both
+    
+    Streams each candidate with their best jobs when the client opts in (see
+    streaming_mode); the plain JSON response is the final ranking.
+    """
     
     # Check if files are uploaded
     if 'resumes' not in request.files:
@@ -846,193 +4343,469 @@ def analyze_multiple_with_linkedin():
     if not files or len(files) == 0:
         return jsonify({'error': 'No files selected'}), 400
     
-    # Process each resume and extract skills
-    candidates = []
-    errors = []
+    # k/offset page the candidate lists (all by default), jobs_k/jobs_offset
+    # the job-centric view (top 10 by default)
+    candidate_page, page_error = read_page()
+    if page_error:
+        return jsonify({'error': page_error}), 400
     
-    for file in files:
-        if file.filename == '':
-            continue
-        
-        if not allowed_file(file.filename):
-            errors.append(f'{file.filename}: Invalid file type')
-            continue
-        
-        try:
-            # Save the file temporarily
-            filename = secure_filename(file.filename)
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
-            
-            # Extract text from resume
-            resume_text = extract_text_from_file(file_path)
-            
-            if not resume_text.strip():
-                errors.append(f'{filename}: Could not extract text')
-                os.remove(file_path)
-                continue
-            
-            # Extract skills from resume
-            resume_skills = extract_skills_and_keywords(resume_text)
-            
-            # Extract candidate name
-            candidate_name = extract_candidate_name(resume_text, filename)
-            
-            # Store candidate data
-            candidate_data = {
-                'filename': filename,
-                'candidate_name': candidate_name,
-                'resume_skills': resume_skills,
-                'resume_text': resume_text,
-                'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
-            }
-            
-            candidates.append(candidate_data)
-            
-            # Clean up the file
-            os.remove(file_path)
-            
-        except Exception as e:
-            errors.append(f'{file.filename}: {str(e)}')
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            continue
+    job_page, page_error = read_page(default_k=10, prefix='jobs_')
+    if page_error:
+        return jsonify({'error': page_error}), 400
     
-    if not candidates:
+    # Parse each resume and extract skills with one taxonomy version
+    taxonomy = SKILL_TAXONOMY.current()
+    uploads, errors = read_uploaded_resumes(files)
+    
+    if not uploads:
         return jsonify({
             'error': 'No valid resumes could be processed',
-            'errors': errors
+            'errors': [errors[index] for index in sorted(errors)]
         }), 400
     
+    mode = streaming_mode()
+    return respond_with_events(
+        rank_candidates_for_linkedin_jobs(uploads, errors, taxonomy, candidate_page, job_page, stream=mode is not None),
+        mode
+    )
+
+def rank_candidates_for_linkedin_jobs(uploads, errors, taxonomy, candidate_page=Page(), job_page=Page(10),
+                                      stream=True):
+    """BatchEvents for /analyze-multiple-with-linkedin: each candidate with their
+    best jobs as soon as they are scored, then one page of both rankings
+    
+    With stream=False no candidate events are produced. Every resume is parsed
+    first and the whole candidate x job matrix is scored in one batch by
+    JobMatcher.score_matrix.
+    """
+    for index in sorted(errors):
+        yield BatchEvent('file_error', {'error': errors[index]})
+    
+    # Resumes parse on the pool while the jobs are prepared
+    parsed_resumes = iter_parsed_resumes(uploads, taxonomy)
+    
     try:
-        # Scrape LinkedIn job postings
-        print(f"DEBUG - Scraping LinkedIn jobs...")
-        scraper = LinkedInJobScraper()
-        jobs = scraper.scrape_linkedin_posts(TRUSTED_LINKEDIN_PROFILES)
-        print(f"DEBUG - Found {len(jobs)} jobs")
+        # LinkedIn job postings, as last scraped in the background
+        jobs = cached_linkedin_jobs()
+        logger.debug('Found %d jobs', len(jobs))
         
-        # Initialize matcher
+        # Initialize matcher; each resume is scored against every job once, and
+        # both views below are derived from those rows. Streamed, each resume is
+        # scored as soon as it is parsed
         matcher = JobMatcher()
+        if stream:
+            with trace_stage('score'):
+                prepared_jobs = matcher.prepare_jobs(jobs, taxonomy)
         
-        # For each job, rank all candidates
-        jobs_with_candidates = []
+        candidates = {}
+        score_rows = {}
         
-        for job in jobs:
-            job_skills = job.get('requirements', [])
-            if isinstance(job_skills, str):
-                job_skills = [job_skills]
-            
-            job_description = job.get('description', '')
-            
-            # Rank all candidates for this job
-            ranked_candidates = []
+        for index, resume, error in parsed_resumes:
+            if error is not None:
+                errors[index] = error
+                yield BatchEvent('file_error', {'error': error})
+                continue
             
-            for candidate in candidates:
-                match_result = matcher.calculate_advanced_match_score(
-                    candidate['resume_skills'], 
-                    job_skills, 
-                    job_description
-                )
-                
-                candidate_result = {
-                    'candidate_name': candidate['candidate_name'],
-                    'filename': candidate['filename'],
-                    'match_score': match_result['total_score'],
-                    'exact_match_score': match_result['exact_score'],
-                    'fuzzy_match_score': match_result['fuzzy_score'],
-                    'semantic_match_score': match_result['semantic_score'],
-                    'matched_skills': match_result['matched_skills'],
-                    'missing_skills': match_result['missing_skills'],
-                    'total_required': match_result['total_required'],
-                    'total_matched': match_result['total_matched']
-                }
-                
-                ranked_candidates.append(candidate_result)
+            resume_text = resume['resume_text']
             
-            # Sort candidates by match score for this job
-            ranked_candidates.sort(key=lambda x: x['match_score'], reverse=True)
+            # Store candidate data
+            candidates[index] = {
+                'filename': resume['filename'],
+                'candidate_name': resume['candidate_name'],
+                'resume_skills': resume['resume_skills'],
+                'resume_text': resume_text,
+                'resume_preview': resume_text[:300] + '...' if len(resume_text) > 300 else resume_text
+            }
+            if not stream:
+                continue
             
-            # Add to job
-            job_with_candidates = job.copy()
-            job_with_candidates['candidates'] = ranked_candidates
-            job_with_candidates['top_candidate'] = ranked_candidates[0] if ranked_candidates else None
+            with trace_stage('score'):
+                score_rows[index] = matcher.score_resume(resume['resume_skills'], prepared_jobs)
             
-            jobs_with_candidates.append(job_with_candidates)
+            yield BatchEvent('candidate', candidate_with_ranked_jobs(
+                candidates[index], jobs, MatchScoreMatrix.from_rows([score_rows[index]], len(jobs)), 0
+            ))
         
-        # Sort jobs by the best match score (top candidate)
-        jobs_with_candidates.sort(
-            key=lambda x: x['top_candidate']['match_score'] if x['top_candidate'] else 0, 
-            reverse=True
-        )
+        errors = [errors[index] for index in sorted(errors)]
         
-        # Also create a candidate-centric view: for each candidate, show their best jobs
-        candidate_job_matches = []
+        if not candidates:
+            yield BatchEvent('error', {
+                'error': 'No valid resumes could be processed',
+                'errors': errors
+            }, 400)
+            return
         
-        for candidate in candidates:
-            candidate_jobs = []
+        with trace_stage('score'):
+            order = sorted(candidates)
+            candidates = [candidates[index] for index in order]
+            if stream:
+                score_matrix = MatchScoreMatrix.from_rows([score_rows[index] for index in order], len(jobs))
+            else:
+                score_matrix = matcher.score_matrix(
+                    [candidate['resume_skills'] for candidate in candidates], jobs, taxonomy
+                )
+            scores = score_matrix.scores
             
-            for job in jobs:
-                job_skills = job.get('requirements', [])
-                if isinstance(job_skills, str):
-                    job_skills = [job_skills]
-                
-                job_description = job.get('description', '')
+            # For each job, rank the candidates. Only the jobs and candidates on the
+            # requested pages are materialized
+            jobs_with_candidates = []
+            best_candidate_scores = scores.max(axis=0)
+            
+            for job_index in top_k_indices(best_candidate_scores, *job_page):
+                ranked_candidates = [
+                    candidate_job_result(candidates[candidate_index], score_matrix.result(candidate_index, job_index))
+                    for candidate_index in top_k_indices(scores[:, job_index], *candidate_page)
+                ]
                 
-                match_result = matcher.calculate_advanced_match_score(
-                    candidate['resume_skills'], 
-                    job_skills, 
-                    job_description
-                )
+                # The top candidate is the best one overall, whichever page was asked for
+                if candidate_page.offset or not ranked_candidates:
+                    top_candidate_index = top_k_indices(scores[:, job_index], 1)[0]
+                    top_candidate = candidate_job_result(
+                        candidates[top_candidate_index], score_matrix.result(top_candidate_index, job_index)
+                    )
+                else:
+                    top_candidate = ranked_candidates[0]
                 
-                job_result = job.copy()
-                job_result['match_score'] = match_result['total_score']
-                job_result['exact_match_score'] = match_result['exact_score']
-                job_result['fuzzy_match_score'] = match_result['fuzzy_score']
-                job_result['semantic_match_score'] = match_result['semantic_score']
-                job_result['matched_skills'] = match_result['matched_skills']
-                job_result['missing_skills'] = match_result['missing_skills']
-                job_result['total_required'] = match_result['total_required']
-                job_result['total_matched'] = match_result['total_matched']
+                # Add to job
+                job_with_candidates = jobs[job_index].copy()
+                job_with_candidates['candidates'] = ranked_candidates
+                job_with_candidates['top_candidate'] = top_candidate
                 
-                candidate_jobs.append(job_result)
+                jobs_with_candidates.append(job_with_candidates)
             
-            # Sort jobs for this candidate
-            candidate_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+            # Also create a candidate-centric view: for each candidate, show their best jobs
+            best_job_scores = scores.max(axis=1) if jobs else np.zeros(len(candidates))
+            candidate_job_matches = [
+                candidate_with_ranked_jobs(candidates[candidate_index], jobs, score_matrix, candidate_index)
+                for candidate_index in top_k_indices(best_job_scores, *candidate_page)
+            ]
             
-            candidate_match = {
-                'candidate_name': candidate['candidate_name'],
-                'filename': candidate['filename'],
-                'resume_skills': candidate['resume_skills'][:15],
-                'resume_preview': candidate['resume_preview'],
-                'top_jobs': candidate_jobs[:5],  # Top 5 jobs for this candidate
-                'average_match_score': sum(j['match_score'] for j in candidate_jobs) / len(candidate_jobs) if candidate_jobs else 0,
-                'best_match_score': candidate_jobs[0]['match_score'] if candidate_jobs else 0
-            }
-            
-            candidate_job_matches.append(candidate_match)
-        
-        # Sort candidates by their best match score
-        candidate_job_matches.sort(key=lambda x: x['best_match_score'], reverse=True)
+            best_candidate_index = top_k_indices(best_job_scores, 1)[0]
+            best_job_index = top_k_indices(best_candidate_scores, 1)[0] if jobs else None
         
         # Return comprehensive results
-        return jsonify({
+        yield BatchEvent('result', {
             'success': True,
             'total_candidates': len(candidates),
             'total_jobs': len(jobs),
-            'jobs_with_ranked_candidates': jobs_with_candidates[:10],  # Top 10 jobs with ranked candidates
+            'jobs_with_ranked_candidates': jobs_with_candidates,  # Top 10 jobs with ranked candidates
             'candidates_with_ranked_jobs': candidate_job_matches,  # All candidates with their best jobs
+            'k': candidate_page.k,
+            'offset': candidate_page.offset,
+            'jobs_k': job_page.k,
+            'jobs_offset': job_page.offset,
             'errors': errors if errors else None,
             'summary': {
                 'best_overall_match': {
-                    'candidate': candidate_job_matches[0]['candidate_name'] if candidate_job_matches else None,
-                    'job': jobs_with_candidates[0]['title'] if jobs_with_candidates else None,
-                    'score': jobs_with_candidates[0]['top_candidate']['match_score'] if jobs_with_candidates and jobs_with_candidates[0]['top_candidate'] else 0
+                    'candidate': candidates[best_candidate_index]['candidate_name'],
+                    'job': jobs[best_job_index]['title'] if jobs else None,
+                    'score': float(best_candidate_scores[best_job_index]) if jobs else 0
                 }
             }
         })
         
     except Exception as e:
-        return jsonify({'error': f'Error processing LinkedIn jobs: {str(e)}'}), 500
+        yield BatchEvent('error', {'error': f'Error processing LinkedIn jobs: {str(e)}'}, 500)
+
+def candidate_job_result(candidate, match_result):
+    """A candidate's entry in one job's ranked candidate list"""
+    return {
+        'candidate_name': candidate['candidate_name'],
+        'filename': candidate['filename'],
+        'match_score': match_result['total_score'],
+        'exact_match_score': match_result['exact_score'],
+        'fuzzy_match_score': match_result['fuzzy_score'],
+        'semantic_match_score': match_result['semantic_score'],
+        'matched_skills': match_result['matched_skills'],
+        'missing_skills': match_result['missing_skills'],
+        'total_required': match_result['total_required'],
+        'total_matched': match_result['total_matched']
+    }
+
+def candidate_with_ranked_jobs(candidate, jobs, score_matrix, row):
+    """A candidate's entry in the candidate-centric view: their top 5 jobs"""
+    candidate_jobs = []
+    
+    for job_index in top_k_indices(score_matrix.scores[row], 5):
+        match_result = score_matrix.result(row, job_index)
+        
+        job_result = jobs[job_index].copy()
+        job_result['match_score'] = match_result['total_score']
+        job_result['exact_match_score'] = match_result['exact_score']
+        job_result['fuzzy_match_score'] = match_result['fuzzy_score']
+        job_result['semantic_match_score'] = match_result['semantic_score']
+        job_result['matched_skills'] = match_result['matched_skills']
+        job_result['missing_skills'] = match_result['missing_skills']
+        job_result['total_required'] = match_result['total_required']
+        job_result['total_matched'] = match_result['total_matched']
+        
+        candidate_jobs.append(job_result)
+    
+    return {
+        'candidate_name': candidate['candidate_name'],
+        'filename': candidate['filename'],
+        'resume_skills': candidate['resume_skills'][:15],
+        'resume_preview': candidate['resume_preview'],
+        'top_jobs': candidate_jobs,
+        'average_match_score': float(score_matrix.scores[row].mean()) if jobs else 0,
+        'best_match_score': float(score_matrix.scores[row].max()) if jobs else 0
+    }
+
+@app.route('/batch-jobs', methods=['POST'])
+def submit_batch_job():
+    """Queue a batch screening job and return its ID right away
+
+    Takes the same form as /upload-multiple. With kind=analyze-multiple-with-linkedin
+    the resumes are matched against LinkedIn jobs instead (no job description).
+    Poll GET /batch-jobs/<job_id> for progress and /batch-jobs/<job_id>/result
+    for the final ranking.
+    """
+    kind = request.form.get('kind', 'upload-multiple')
+    if kind not in BATCH_JOB_KINDS:
+        return jsonify({'error': f'Unknown batch job kind: {kind}'}), 400
+
+    # Check if files are uploaded
+    if 'resumes' not in request.files:
+        return jsonify({'error': 'No resume files uploaded'}), 400
+
+    files = request.files.getlist('resumes')
+
+    if not files or len(files) == 0:
+        return jsonify({'error': 'No files selected'}), 400
+
+    # Pagination applies to the final result, as on the synchronous endpoints
+    page, page_error = read_page()
+    if page_error:
+        return jsonify({'error': page_error}), 400
+
+    params = {'page': list(page)}
+    if kind == 'analyze-multiple-with-linkedin':
+        job_page, page_error = read_page(default_k=10, prefix='jobs_')
+        if page_error:
+            return jsonify({'error': page_error}), 400
+
+        params['job_page'] = list(job_page)
+
+    if kind == 'upload-multiple':
+        job_description = request.form.get('job_description', '')
+
+        if not job_description.strip():
+            return jsonify({'error': 'Job description is required'}), 400
+
+        if not parse_job_description(job_description, SKILL_TAXONOMY.current()).skills:
+            return jsonify({'error': 'No technical skills found in job description'}), 400
+
+        params['job_description'] = job_description
+
+    uploads, errors = read_uploaded_resumes(files)
+
+    if not uploads:
+        return jsonify({
+            'error': 'No valid resumes could be processed',
+            'errors': [errors[index] for index in sorted(errors)]
+        }), 400
+
+    job_id = BATCH_JOBS.submit(kind, params, uploads, errors)
+    BATCH_JOB_WORKERS.ensure_started()
+    BATCH_JOB_WORKERS.notify()
+
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued',
+        'total': len(uploads) + len(errors),
+        'status_url': url_for('batch_job_status', job_id=job_id),
+        'result_url': url_for('batch_job_result', job_id=job_id)
+    }), 202
+
+@app.route('/batch-jobs/<job_id>')
+def batch_job_status(job_id):
+    """Progress of a batch job and the candidates scored so far
+
+    Pass ?since=<next_since from the previous poll> to only get new candidates.
+    """
+    # Polling also makes sure this process is draining the queue after a restart
+    BATCH_JOB_WORKERS.ensure_started()
+
+    job = BATCH_JOBS.status(job_id, since=request.args.get('since', 0, type=int))
+    if job is None:
+        return jsonify({'error': 'Batch job not found'}), 404
+
+    job['result_url'] = url_for('batch_job_result', job_id=job_id)
+    return jsonify(job)
+
+@app.route('/batch-jobs/<job_id>/result')
+def batch_job_result(job_id):
+    """Final ranking of a batch job: the body /upload-multiple (or
+    /analyze-multiple-with-linkedin) would have returned, or 202 while it runs"""
+    BATCH_JOB_WORKERS.ensure_started()
+
+    result = BATCH_JOBS.result(job_id)
+    if result is None:
+        return jsonify({'error': 'Batch job not found'}), 404
+
+    status, body, result_status = result
+    if body is None:
+        return jsonify({
+            'job_id': job_id,
+            'status': status,
+            'status_url': url_for('batch_job_status', job_id=job_id)
+        }), 202
+
+    return jsonify(body), result_status
+
+@app.route('/candidates', methods=['POST'])
+def add_candidates():
+    """Parse resumes and add them to the candidate pool without screening them"""
+    if not CANDIDATE_STORE.enabled:
+        return jsonify({'error': 'Candidate store is disabled'}), 503
+
+    if 'resumes' not in request.files:
+        return jsonify({'error': 'No resume files uploaded'}), 400
+
+    files = request.files.getlist('resumes')
+
+    if not files or len(files) == 0:
+        return jsonify({'error': 'No files selected'}), 400
+
+    taxonomy = SKILL_TAXONOMY.current()
+    resumes, errors = parse_uploaded_resumes(files, taxonomy)
+    CANDIDATE_STORE.add(resumes, taxonomy.fingerprint)
+
+    return jsonify({
+        'success': bool(resumes),
+        'indexed': len(resumes),
+        'total_candidates': CANDIDATE_STORE.count(),
+        'errors': errors if errors else None
+    }), 200 if resumes else 400
+
+@app.route('/candidates/search', methods=['POST'])
+def search_candidates():
+    """Rank every candidate in the pool for a job description"""
+    if not CANDIDATE_STORE.enabled:
+        return jsonify({'error': 'Candidate store is disabled'}), 503
+
+    job_description = request.form.get('job_description', '')
+    limit = request.form.get('limit', 20, type=int)
+
+    if not job_description.strip():
+        return jsonify({'error': 'Job description is required'}), 400
+
+    if limit < 1:
+        return jsonify({'error': 'limit must be at least 1'}), 400
+
+    taxonomy = SKILL_TAXONOMY.current()
+    parsed_job_description = parse_job_description(job_description, taxonomy)
+
+    if not parsed_job_description.skills:
+        return jsonify({'error': 'No technical skills found in job description'}), 400
+
+    with trace_stage('score'):
+        candidates, considered = CANDIDATE_STORE.search(job_description, parsed_job_description, taxonomy, limit)
+
+    return jsonify({
+        'success': True,
+        'total_candidates': CANDIDATE_STORE.count(),
+        'candidates_considered': considered,
+        'job_skills': list(parsed_job_description.skills),
+        'candidates': candidates
+    })
+
+@app.cli.command('fit-semantic-model')
+@click.argument('paths', nargs=-1, type=click.Path(exists=True))
+def fit_semantic_model(paths):
+    """Fit the TF-IDF semantic model and save it to SEMANTIC_MODEL_PATH
+
+    PATHS are resumes and job descriptions (PDF, DOCX or TXT files, or
+    directories of them) fitted along with the default corpus. Running web
+    workers pick up the new model within a few seconds.
+    """
+    documents = default_semantic_corpus(SKILL_TAXONOMY.current())
+
+    for path in paths:
+        file_paths = [path]
+        if os.path.isdir(path):
+            file_paths = sorted(
+                os.path.join(directory, name)
+                for directory, _, names in os.walk(path) for name in names if allowed_file(name)
+            )
+        for file_path in file_paths:
+            text = extract_text_from_file(file_path)
+            if text.strip():
+                documents.append(text)
+
+    vectorizer = SEMANTIC_MODEL.fit(documents)
+    click.echo(f'Fitted semantic model on {len(documents)} documents '
+               f'({len(vectorizer.vocabulary_)} terms): {SEMANTIC_MODEL.path}')
+
+@app.cli.command('refresh-linkedin-jobs')
+@click.option('--fixtures', type=click.Path(exists=True, file_okay=False),
+              help='Read saved activity pages (<profile-slug>.html) from this directory instead of a browser.')
+@click.option('--force', is_flag=True, help='Scrape every profile, even those refreshed recently.')
+@click.option('--watch', is_flag=True, help='Keep refreshing profiles as they become due, until stopped.')
+def refresh_linkedin_jobs(fixtures, force, watch):
+    """Scrape the trusted LinkedIn profiles into the job cache now, and with
+    --watch keep them fresh"""
+    refresher = JOB_REFRESHER
+    if fixtures:
+        refresher = LinkedInJobRefresher(
+            JOB_CACHE, TRUSTED_LINKEDIN_PROFILES, app.config['LINKEDIN_REFRESH_INTERVAL'],
+            app.config['LINKEDIN_MAX_POSTS_PER_PROFILE'], fixtures, lock_path=JOB_REFRESHER.lock_path
+        )
+
+    if watch and refresher.refresh_interval <= 0:
+        raise click.UsageError('LINKEDIN_REFRESH_INTERVAL is 0, so no profile would ever be due')
+
+    for profile_url, result in refresher.refresh(force=force).items():
+        click.echo(f'{profile_url}: {result if isinstance(result, str) else f"{result} new jobs"}')
+    click.echo(f'{JOB_CACHE.stats()["jobs"]} jobs cached')
+
+    # The one process that scrapes; web workers only read the cache
+    if watch:
+        if not refresher.holds_lock():
+            click.echo('Another process is refreshing; waiting to take over')
+        refresher.run_forever()
+
+def create_app(preload=True):
+    """Return the application with its shared state built up front
+
+    With ``preload`` this loads the skill taxonomy and its compiled matcher,
+    the semantic model (TF-IDF mode), the candidate pool's bitsets (bitset
+    backend) and every extractor's and scraper's dependencies, then moves all
+    of it out of reach of the garbage collector with gc.freeze(). Under
+    ``gunicorn --preload 'app:create_app()'`` that happens once in the master
+    process, and the forked workers share it copy-on-write instead of each
+    building their own; collections in a worker no longer touch the frozen
+    objects, which would copy their pages.
+
+    Threads and process pools are not started here. Each worker starts its own
+    on first use.
+    """
+    if preload:
+        taxonomy = SKILL_TAXONOMY.current()
+        SEMANTIC_MODEL.current()
+        try:
+            CANDIDATE_STORE.preload(taxonomy)
+        except sqlite3.Error as e:
+            logger.error('Error preloading candidate pool: %s', e)
+        for name, error in {**EXTRACTORS.preload(), **SCRAPERS.preload()}.items():
+            logger.warning('Error preloading %s: %s', name, error)
+
+        gc.collect()
+        gc.freeze()
+
+    # Web workers only read the job cache, so something else has to fill it
+    try:
+        refresher = JOB_REFRESHER.status()
+    except sqlite3.Error as e:
+        logger.error('Error reading LinkedIn job cache: %s', e)
+    else:
+        if refresher['state'] in ('never', 'stale') and not refresher['in_workers']:
+            logger.warning('No process is refreshing LinkedIn jobs (last refresh: %s); run `flask --app app '
+                           'refresh-linkedin-jobs --watch` or set LINKEDIN_REFRESH_IN_WORKERS=1',
+                           refresher['last_refresh'] or 'never')
+
+    return app
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""Benchmark for ranking resumes uploaded as one archive.
+
+Uploads the same synthetic resumes (PDF, DOCX and TXT) to /upload-multiple
+as separate multipart files, and to /upload-archive as a ZIP and as a
+tar.gz, and times each request. Then times how quickly a ZIP bomb member, a
+tar.gz bomb and an archive of 100,000 skipped entries are turned away. The
+rankings and the archive guards are checked in tests/test_archive_upload.py.
+
+Usage:
+    python benchmarks/bench_archive.py [--resumes 300] [--words 400]
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_suite import app  # noqa: E402
+from corpus import job_description_text, resume_files, tar_gz_bytes, zip_bytes  # noqa: E402
+
+
+def post_archive(client, data, filename, job_description):
+    start = time.perf_counter()
+    response = client.post('/upload-archive', data={
+        'archive': (io.BytesIO(data), filename), 'job_description': job_description
+    })
+    return time.perf_counter() - start, response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=300)
+    parser.add_argument('--words', type=int, default=400)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = list(app.SKILL_TAXONOMY.current().skill_names)
+    job_description = job_description_text(rng, vocabulary, 200, 0.1)
+    files = resume_files(rng, vocabulary, args.resumes, args.words, 0.1)
+    members = [(f'resumes/{filename}', data) for filename, data, _ in files]
+    client = app.app.test_client()
+
+    start = time.perf_counter()
+    client.post('/upload-multiple', data={
+        'resumes': [(io.BytesIO(data), filename) for filename, data, _ in files],
+        'job_description': job_description
+    })
+    multiple_s = time.perf_counter() - start
+    size = sum(len(data) for _, data in members)
+    print(f'{args.resumes} resumes, {size / (1024 * 1024):.1f} MB')
+    print(f'  /upload-multiple          : {multiple_s * 1000:8.1f} ms')
+
+    for label, data, filename in (('ZIP', zip_bytes(members + [('__MACOSX/._resume_0.pdf', b'x')]), 'resumes.zip'),
+                                  ('tar.gz', tar_gz_bytes(members), 'resumes.tar.gz')):
+        seconds, response = post_archive(client, data, filename, job_description)
+        print(f'  /upload-archive, {label:8s} : {seconds * 1000:8.1f} ms ({len(data) / (1024 * 1024):.1f} MB)')
+
+    # Rejections: 256 MB of zeros deflates to about 250 KB
+    small = [('jane.txt', b'Jane Doe\nSkills: Python, Django, AWS, SQL\n')]
+    bomb = zip_bytes(small + [('bomb.txt', bytes(256 * 1024 * 1024))])
+    seconds, response = post_archive(client, bomb, 'bomb.zip', job_description)
+    body = response.get_json()
+    print(f'  ZIP bomb member           : {seconds * 1000:8.1f} ms, {response.status_code} {body.get("errors")}')
+
+    seconds, response = post_archive(client, tar_gz_bytes(small + [('bomb.txt', bytes(256 * 1024 * 1024))]),
+                                     'bomb.tar.gz', job_description)
+    print(f'  tar.gz bomb               : {seconds * 1000:8.1f} ms, {response.status_code} {response.get_json()}')
+
+    junk = zip_bytes([(f'junk/{i}.exe', b'') for i in range(100000)], zipfile.ZIP_STORED)
+    seconds, response = post_archive(client, junk, 'junk.zip', job_description)
+    print(f'  100,000 .exe entries      : {seconds * 1000:8.1f} ms, {response.status_code} {response.get_json()}')
+
+
+if __name__ == '__main__':
+    main()
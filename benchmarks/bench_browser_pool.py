@@ -0,0 +1,66 @@
+"""Benchmark for scraping LinkedIn profiles through the browser session pool.
+
+Uses the stub driver from tests/stub_driver.py in place of Chrome: it serves
+synthetic activity pages and sleeps to stand in for browser startup and page
+loads. Scrapes the trusted profiles for a few refresh runs the old way (a
+fresh browser per run, one profile after another) and through a warm
+BrowserPool that scrapes profiles in parallel. tests/test_browser_pool.py
+checks that both produce the same jobs.
+
+Usage:
+    python benchmarks/bench_browser_pool.py [--startup 1.0] [--page 0.2] [--runs 3] [--size 4]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from stub_driver import StubDriver, activity_page  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--startup', type=float, default=1.0, help='seconds to start a browser')
+    parser.add_argument('--page', type=float, default=0.2, help='seconds to load a page')
+    parser.add_argument('--runs', type=int, default=3, help='refresh runs')
+    parser.add_argument('--size', type=int, default=4, help='pool size')
+    parser.add_argument('--posts', type=int, default=10, help='posts per profile page')
+    args = parser.parse_args()
+
+    profile_urls = app.TRUSTED_LINKEDIN_PROFILES
+    pages = {f'{profile_url}/recent-activity/': activity_page(range(1, args.posts + 1)) for profile_url in profile_urls}
+
+    def driver_factory():
+        return StubDriver(pages, args.startup, args.page)
+
+    timings = {}
+    for name, pool, keep_warm in (
+        ('fresh browser, serial', app.BrowserPool(driver_factory, size=1), False),
+        ('warm pool, parallel', app.BrowserPool(driver_factory, size=args.size), True),
+    ):
+        scraper = app.LinkedInJobScraper(browser_pool=pool)
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            for _, _, _, error in scraper.scrape_profiles(profile_urls, args.posts):
+                if error is not None:
+                    print(f'{name}: {error}')
+            if not keep_warm:
+                pool.close_idle(0)
+        timings[name] = time.perf_counter() - start
+        pool.close_idle(0)
+        print(f'{name}: {pool.stats()}')
+
+    print(f'{len(profile_urls)} profiles x {args.runs} runs '
+          f'(browser startup {args.startup:.1f} s, page load {args.page:.1f} s)')
+    for name, seconds in timings.items():
+        print(f'  {name:22s}: {seconds:6.2f} s')
+    print(f'  speedup               : {timings["fresh browser, serial"] / timings["warm pool, parallel"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
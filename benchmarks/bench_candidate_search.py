@@ -0,0 +1,83 @@
+"""Benchmark for ranking the persistent candidate pool against a job description.
+
+Fills a temporary CandidateStore with synthetic candidates, then ranks it
+for a few job descriptions with both search backends (posting lists and
+in-memory skill bitsets) and by scoring every candidate with
+calculate_advanced_match_score. That all three agree is checked in
+tests/test_candidate_store.py.
+
+Usage:
+    python benchmarks/bench_candidate_search.py [--candidates 20000] [--limit 50]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from corpus import SAMPLE_JOB_DESCRIPTIONS, candidate_resumes  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--candidates', type=int, default=20000)
+    parser.add_argument('--max-skills', type=int, default=25)
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+    matcher = app.JobMatcher()
+
+    resumes = candidate_resumes(rng, vocabulary, args.candidates, args.max_skills)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'candidates.db')
+        store = app.CandidateStore(db_path)
+        bitset_store = app.CandidateStore(db_path, search_backend='bitset')
+
+        start = time.perf_counter()
+        store.add(resumes, taxonomy.fingerprint)
+        print(f'{args.candidates} candidates indexed in {time.perf_counter() - start:.2f} s')
+
+        # The bitset backend loads the pool into memory on its first search
+        start = time.perf_counter()
+        bitset_store.search('python', app.parse_job_description('python', taxonomy), taxonomy, 1)
+        print(f'bitsets loaded in {time.perf_counter() - start:.2f} s')
+
+        for job_description in SAMPLE_JOB_DESCRIPTIONS:
+            parsed = app.parse_job_description(job_description, taxonomy)
+            job_skills = list(parsed.skills)
+
+            start = time.perf_counter()
+            _, considered = store.search(job_description, parsed, taxonomy, args.limit)
+            search_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            bitset_store.search(job_description, parsed, taxonomy, args.limit)
+            bitset_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for resume in resumes:
+                matcher.calculate_advanced_match_score(
+                    resume['resume_skills'], job_skills, job_description, taxonomy,
+                    requirement_index=parsed.requirement_index
+                )
+            scan_s = time.perf_counter() - start
+
+            print(f'  {len(job_skills)} JD skills, {considered} candidates on posting lists')
+            print(f'    posting lists : {search_s * 1000:8.1f} ms  ({scan_s / search_s:.1f}x)')
+            print(f'    skill bitsets : {bitset_s * 1000:8.1f} ms  ({scan_s / bitset_s:.1f}x)')
+            print(f'    full scan     : {scan_s * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
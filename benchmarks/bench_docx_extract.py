@@ -0,0 +1,77 @@
+"""Benchmark for DOCX text extraction: streamed XML against python-docx.
+
+Generates synthetic DOCX resumes with python-docx, from a few hundred to
+tens of thousands of paragraphs. Times extract_text_from_docx, which
+streams word/document.xml out of the zip with iterparse, against the old
+path: a python-docx document model and ``text +=`` per paragraph. Also
+reports the peak memory traced by tracemalloc. python-docx keeps its lxml
+tree outside the Python allocator, so its figure is a lower bound. That
+both return the same text, and that the streamed extractor also reads
+tables and text boxes, is checked in tests/test_docx_extract.py.
+
+Usage:
+    python benchmarks/bench_docx_extract.py [--paragraphs 300,3000,30000] [--repeat 3]
+"""
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_suite import app  # noqa: E402
+from corpus import docx_bytes, resume_text  # noqa: E402
+
+
+def old_extract(data):
+    import docx
+
+    text = ""
+    for paragraph in docx.Document(io.BytesIO(data)).paragraphs:
+        text += paragraph.text + "\n"
+    return text
+
+
+def new_extract(data):
+    return app.extract_text_from_docx(io.BytesIO(data))
+
+
+def measure(extract, data, repeat):
+    """(median seconds, peak traced MB)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(data)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    extract(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', default='300,3000,30000', help='comma-separated paragraph counts')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocabulary = list(app.SKILL_TAXONOMY.current().skill_names)
+
+    for paragraphs in (int(count) for count in args.paragraphs.split(',')):
+        text = resume_text(rng, vocabulary, paragraphs * 12, 0.1)
+        data = docx_bytes(text)
+        old_s, old_mb = measure(old_extract, data, args.repeat)
+        new_s, new_mb = measure(new_extract, data, args.repeat)
+        print(f'{len(text.splitlines())} paragraphs ({len(data) / 1024:.0f} KB): python-docx {old_s * 1000:8.1f} ms, '
+              f'peak {old_mb:6.1f} MB | streamed {new_s * 1000:8.1f} ms, peak {new_mb:6.1f} MB '
+              f'({old_s / new_s:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark for serving LinkedIn jobs from the job cache.
+
+Writes synthetic activity pages for the trusted profiles as saved HTML
+fixtures, then times a first (full) refresh through LinkedInJobRefresher, an
+incremental refresh after one new post per profile, and the cache read that
+request handlers do. What the cache stores is checked in
+tests/test_linkedin_scraper.py. No browser is launched; the time a live scrape spends waiting on pages is
+not included.
+
+Usage:
+    python benchmarks/bench_job_cache.py [--posts 40] [--reads 1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from stub_driver import activity_page  # noqa: E402
+
+
+def write_fixtures(directory, profile_urls, numbers):
+    scraper = app.LinkedInJobScraper(directory)
+    for profile_url in profile_urls:
+        with open(scraper.fixture_path(profile_url), 'w', encoding='utf-8') as file:
+            file.write(activity_page(numbers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--posts', type=int, default=40, help='posts per profile page')
+    parser.add_argument('--reads', type=int, default=1000)
+    args = parser.parse_args()
+
+    profile_urls = app.TRUSTED_LINKEDIN_PROFILES
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = app.JobCache(os.path.join(tmp, 'linkedin_jobs.db'), max_jobs=len(profile_urls) * (args.posts + 1))
+        refresher = app.LinkedInJobRefresher(cache, profile_urls, 3600, args.posts, tmp)
+
+        write_fixtures(tmp, profile_urls, range(1, args.posts + 1))
+        start = time.perf_counter()
+        scraped = refresher.refresh(force=True)
+        full_s = time.perf_counter() - start
+
+        write_fixtures(tmp, profile_urls, range(1, args.posts + 2))
+        start = time.perf_counter()
+        incremental = refresher.refresh(force=True)
+        incremental_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.reads):
+            jobs = cache.jobs()
+        read_s = (time.perf_counter() - start) / args.reads
+
+    print(f'{len(profile_urls)} profiles x {args.posts} posts, {len(jobs)} jobs cached '
+          f'({sum(scraped.values())} + {sum(incremental.values())})')
+    print(f'  full refresh        : {full_s * 1000:8.1f} ms')
+    print(f'  incremental refresh : {incremental_s * 1000:8.1f} ms  (1 new post per profile)')
+    print(f'  request cache read  : {read_s * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
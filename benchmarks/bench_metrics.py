@@ -0,0 +1,113 @@
+"""Benchmark for the cost of request tracing, /metrics and disabled debug logging.
+
+Serves the same TXT /upload and /upload-multiple requests with the tracing
+hooks installed and with them removed, and reports the median latency of
+each. Also times what recording one request costs on its own (with and
+without the shared SQLite table), and a disabled ``logger.debug`` call
+against the ``print`` it replaced. That tracing leaves the responses alone
+and that /metrics counts every traced request is checked in
+tests/test_metrics.py.
+
+Usage:
+    python benchmarks/bench_metrics.py [--requests 300] [--calls 100000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESUMES = (
+    b'Jane Doe\nSkills: Python, Django, Flask, AWS, SQL database, git, docker\n',
+    b'John Smith\nSkills: React, Node.js, JavaScript, MongoDB database, CSS, HTML\n',
+    b'Ana Lima\nSkills: Java, Spring Boot, Kubernetes, PostgreSQL, CI/CD\n',
+)
+JOB_DESCRIPTION = 'Python developer with Django, Flask, AWS, Docker and SQL experience'
+
+TRACING_HOOKS = ('start_request_trace', 'record_request_metrics', 'end_request_trace')
+
+
+def post(client, endpoint):
+    if endpoint == '/upload':
+        data = {'resume': (io.BytesIO(RESUMES[0]), 'resume.txt'), 'job_description': JOB_DESCRIPTION}
+    else:
+        data = {
+            'resumes': [(io.BytesIO(resume), f'resume_{i}.txt') for i, resume in enumerate(RESUMES)],
+            'job_description': JOB_DESCRIPTION
+        }
+    start = time.perf_counter()
+    client.post(endpoint, data=data)
+    return time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def without_tracing(flask_app):
+    """Take the tracing hooks out of the app, as before /metrics existed"""
+    registries = (flask_app.before_request_funcs, flask_app.after_request_funcs, flask_app.teardown_request_funcs)
+    saved = [dict((key, list(funcs)) for key, funcs in registry.items()) for registry in registries]
+    for registry in registries:
+        for funcs in registry.values():
+            funcs[:] = [func for func in funcs if func.__name__ not in TRACING_HOOKS]
+    try:
+        yield
+    finally:
+        for registry, funcs in zip(registries, saved):
+            registry.update(funcs)
+
+
+def time_record(app, db_path, calls):
+    """Seconds to record one traced request"""
+    metrics = app.MetricsStore(db_path)
+    trace = app.RequestTrace()
+    trace.stages.update({'save': 0.001, 'extract_text': 0.002, 'extract_skills': 0.003, 'score': 0.001,
+                         'serialize': 0.0005})
+    trace.bytes_read, trace.resumes = 2048, 3
+    return timeit.timeit(lambda: metrics.record_request('/upload-multiple', 200, trace), number=calls) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=300, help='requests per endpoint and mode')
+    parser.add_argument('--calls', type=int, default=100000, help='calls for the micro-benchmarks')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'uploads'))
+        os.chdir(tmp)
+        os.environ.update(LINKEDIN_REFRESH_INTERVAL='0', PARSE_POOL_WORKERS='0', LOG_LEVEL='INFO')
+        import app
+
+        client = app.app.test_client()
+        print(f'{args.requests} requests per endpoint, median latency')
+        for endpoint in ('/upload', '/upload-multiple'):
+            post(client, endpoint)
+            with without_tracing(app.app):
+                untraced = [post(client, endpoint) for _ in range(args.requests)]
+            traced = [post(client, endpoint) for _ in range(args.requests)]
+
+            untraced_ms = statistics.median(untraced) * 1000
+            traced_ms = statistics.median(traced) * 1000
+            print(f'  {endpoint:17s}: {untraced_ms:6.2f} ms untraced, {traced_ms:6.2f} ms traced '
+                  f'({traced_ms - untraced_ms:+.3f} ms)')
+
+        per_process_us = time_record(app, '', args.calls) * 1e6
+        shared_us = time_record(app, os.path.join(tmp, 'uploads', 'bench_metrics.db'), args.calls) * 1e6
+        print(f'  record one request: {per_process_us:.1f} us per process, {shared_us:.1f} us with METRICS_DB')
+
+        skills = list(app.SKILL_TAXONOMY.current().skill_names)[:40]
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            print_us = timeit.timeit(lambda: print(f'DEBUG - Resume skills found: {skills}'), number=args.calls)
+        debug_us = timeit.timeit(lambda: app.logger.debug('Resume skills found: %s', skills), number=args.calls)
+        print(f'  debug message, 40 skills: print {print_us / args.calls * 1e6:.2f} us, '
+              f'disabled logger.debug {debug_us / args.calls * 1e6:.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark for PDF resume parsing: page streaming, backends and caps.
+
+Generates synthetic PDF resumes of growing page counts and parses each one
+the old way (PyPDF2, ``text +=`` per page, then skill extraction on the
+whole text) and through extract_resume_text_and_skills, which scans every
+page for skills as it is extracted. That runs once per installed backend
+with the caps off, and once with the default PDF_MAX_PAGES /
+PDF_MAX_CHARS. Reports the median time and the peak traced memory. That
+streamed pages give the same text and skills as the whole text, and what
+the caps keep, is checked in tests/test_pdf_extract.py.
+
+Usage:
+    python benchmarks/bench_pdf_extract.py [--pages 5,50,500] [--repeat 3]
+"""
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_suite import app  # noqa: E402
+from corpus import pdf_bytes, resume_text  # noqa: E402
+
+
+def old_parse(data, taxonomy):
+    import PyPDF2
+
+    text = ""
+    for page in PyPDF2.PdfReader(io.BytesIO(data)).pages:
+        text += page.extract_text()
+    return text, app.extract_skills_and_keywords(text, taxonomy)
+
+
+def new_parse(data, taxonomy):
+    return app.extract_resume_text_and_skills(io.BytesIO(data), 'resume.pdf', taxonomy)
+
+
+def measure(parse, data, taxonomy, repeat):
+    """(median seconds, peak traced MB, result)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse(data, taxonomy)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    parse(data, taxonomy)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak / (1024 * 1024), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', default='5,50,500', help='comma-separated page counts')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+    backends = [name for name in app.PDF_BACKENDS.names() if app.PDF_BACKENDS.installed(name)]
+    caps = {'max_pages': app.app.config['PDF_MAX_PAGES'], 'max_chars': app.app.config['PDF_MAX_CHARS']}
+
+    print(f'backends installed: {", ".join(backends)}; default caps {caps["max_pages"]} pages, '
+          f'{caps["max_chars"]} characters')
+    for pages in (int(count) for count in args.pages.split(',')):
+        data = pdf_bytes(resume_text(rng, vocabulary, pages * 50 * 12, 0.1), lines_per_page=50)
+        print(f'{pages} pages ({len(data) / 1024:.0f} KB):')
+
+        old_s, old_mb, _ = measure(old_parse, data, taxonomy, args.repeat)
+        print(f'  {"PyPDF2, text += (old)":28s}: {old_s * 1000:8.1f} ms, peak {old_mb:6.1f} MB')
+
+        runs = [(backend, {'PDF_MAX_PAGES': 0, 'PDF_MAX_CHARS': 0}) for backend in backends]
+        runs.append((app.PDF_BACKEND, {'PDF_MAX_PAGES': caps['max_pages'], 'PDF_MAX_CHARS': caps['max_chars']}))
+        default_backend = app.PDF_BACKEND
+        for backend, config in runs:
+            app.PDF_BACKEND = backend
+            app.app.config.update(config)
+            seconds, peak_mb, (text, skills) = measure(new_parse, data, taxonomy, args.repeat)
+            capped = bool(config['PDF_MAX_PAGES'] or config['PDF_MAX_CHARS'])
+            label = f'{backend}, streamed' + (', capped' if capped else '')
+            print(f'  {label:28s}: {seconds * 1000:8.1f} ms, peak {peak_mb:6.1f} MB, '
+                  f'{len(text)} characters, {len(skills)} skills')
+
+        app.PDF_BACKEND = default_backend
+        app.app.config.update(PDF_MAX_PAGES=caps['max_pages'], PDF_MAX_CHARS=caps['max_chars'])
+
+
+if __name__ == '__main__':
+    main()
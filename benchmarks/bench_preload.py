@@ -0,0 +1,209 @@
+"""Benchmark for per-worker memory with and without preloading the app.
+
+Starts worker processes the two ways gunicorn can:
+
+- separate: every worker imports app and calls create_app() itself (plain
+  ``gunicorn app:create_app()``)
+- preload: one master imports app and calls create_app(), then forks the
+  workers (``gunicorn --preload``); also measured with gc.freeze() undone
+
+Each worker serves TXT, DOCX and batch uploads and runs a full garbage
+collection, like a worker that has been up for a while. Then, with all
+workers still alive, it reads its own memory from /proc/self/smaps_rollup.
+USS is the memory only that worker uses. PSS also counts its share of
+the pages it shares with the master and the other workers, so the PSS of
+all processes adds up to the memory really in use. Linux only.
+
+Usage:
+    python benchmarks/bench_preload.py [--workers 4] [--candidate-pool 5000]
+"""
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESUMES = (
+    b'Jane Doe\nSkills: Python, Django, Flask, AWS, SQL database, git, docker\n',
+    b'John Smith\nSkills: React, Node.js, JavaScript, MongoDB database, CSS, HTML\n',
+    b'Ana Lima\nSkills: Java, Spring Boot, Kubernetes, PostgreSQL, CI/CD\n',
+)
+JOB_DESCRIPTION = 'Python developer with Django, Flask, AWS, Docker and SQL experience'
+
+
+def memory():
+    """(USS, PSS) of this process in MB"""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return (fields['Private_Clean'] + fields['Private_Dirty']) / 1024, fields['Pss'] / 1024
+
+
+def serve_requests(flask_app):
+    import docx
+
+    document = docx.Document()
+    document.add_paragraph('Maria Garcia')
+    document.add_paragraph('Skills: Python, machine learning, pandas, SQL')
+    docx_bytes = io.BytesIO()
+    document.save(docx_bytes)
+
+    client = flask_app.test_client()
+    client.get('/health')
+    for data in RESUMES:
+        client.post('/upload', data={'resume': (io.BytesIO(data), 'resume.txt'), 'job_description': JOB_DESCRIPTION})
+    client.post('/upload', data={
+        'resume': (io.BytesIO(docx_bytes.getvalue()), 'resume.docx'), 'job_description': JOB_DESCRIPTION
+    })
+    client.post('/upload-multiple', data={
+        'resumes': [(io.BytesIO(data), f'resume_{i}.txt') for i, data in enumerate(RESUMES)],
+        'job_description': JOB_DESCRIPTION
+    })
+    client.post('/candidates/search', data={'job_description': JOB_DESCRIPTION})
+
+    import gc
+    gc.collect()
+
+
+def report_and_wait(results, release, role='worker'):
+    """Send this process's memory, then stay alive until every process has reported"""
+    uss, pss = memory()
+    os.write(results, (json.dumps({'role': role, 'uss': uss, 'pss': pss}) + '\n').encode())
+    os.read(release, 1)
+
+
+def run_separate_worker(results, release):
+    import app
+    serve_requests(app.create_app())
+    report_and_wait(results, release)
+
+
+def run_preload_master(workers, results, release, freeze):
+    import app
+    import gc
+    flask_app = app.create_app()
+    if not freeze:
+        gc.unfreeze()
+
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                serve_requests(flask_app)
+                report_and_wait(results, release)
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    report_and_wait(results, release, 'master')
+    for pid in children:
+        os.waitpid(pid, 0)
+
+
+def measure(mode, workers, env):
+    """USS/PSS of every process in ``mode``"""
+    results_read, results_write = os.pipe()
+    release_read, release_write = os.pipe()
+    processes = workers if mode == 'separate' else workers + 1
+    commands = [[sys.executable, __file__, '--child', mode, str(results_write), str(release_read)]]
+    commands *= workers if mode == 'separate' else 1
+    if mode != 'separate':
+        commands[0] += ['--workers', str(workers)]
+
+    children = [
+        subprocess.Popen(command, env=env, cwd=env['BENCH_CWD'], pass_fds=(results_write, release_read),
+                         stdout=subprocess.DEVNULL)
+        for command in commands
+    ]
+    os.close(results_write)
+    os.close(release_read)
+
+    lines = []
+    with os.fdopen(results_read) as reader:
+        while len(lines) < processes:
+            line = reader.readline()
+            if not line:
+                raise RuntimeError(f'a {mode} worker exited before reporting its memory')
+            lines.append(json.loads(line))
+            if len(lines) == processes:
+                os.write(release_write, b'x' * processes)
+    os.close(release_write)
+    for child in children:
+        child.wait()
+    return lines
+
+
+def fill_candidate_pool(db_path, count):
+    import app
+
+    rng = random.Random(42)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+    app.CandidateStore(db_path).add([{
+        'content_hash': f'synthetic-{i}',
+        'filename': f'resume_{i}.txt',
+        'candidate_name': f'Candidate {i}',
+        'resume_skills': rng.sample(vocabulary, rng.randint(0, 25)),
+        'resume_text': ''
+    } for i in range(count)], taxonomy.fingerprint)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--candidate-pool', type=int, default=5000, help='candidates loaded by the bitset backend')
+    parser.add_argument('--child', nargs=3, metavar=('MODE', 'RESULTS_FD', 'RELEASE_FD'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, results, release = args.child[0], int(args.child[1]), int(args.child[2])
+        if mode == 'separate':
+            run_separate_worker(results, release)
+        else:
+            run_preload_master(args.workers, results, release, freeze=mode == 'preload')
+        return
+
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        print('This benchmark needs Linux (/proc/self/smaps_rollup)')
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'uploads'))
+        db_path = os.path.join(tmp, 'uploads', 'candidates.db')
+        os.chdir(tmp)
+        fill_candidate_pool(db_path, args.candidate_pool)
+        env = dict(
+            os.environ, BENCH_CWD=tmp, CANDIDATE_STORE_DB=db_path, CANDIDATE_SEARCH_BACKEND='bitset',
+            LINKEDIN_REFRESH_INTERVAL='0', PARSE_POOL_WORKERS='0', PYTHONDONTWRITEBYTECODE='1'
+        )
+
+        totals = {}
+        print(f'{args.workers} workers, {args.candidate_pool} candidates in the bitset pool')
+        for mode, label in (('separate', 'separate'), ('preload', 'preload'), ('preload-nofreeze', 'preload, no gc.freeze')):
+            processes = measure(mode, args.workers, env)
+            workers = [process for process in processes if process['role'] == 'worker']
+            masters = [process for process in processes if process['role'] == 'master']
+            totals[mode] = sum(process['pss'] for process in processes)
+            master = f', master PSS {masters[0]["pss"]:6.1f} MB' if masters else ''
+            print(f'  {label:22s}: worker USS {statistics.median(w["uss"] for w in workers):6.1f} MB, '
+                  f'worker PSS {statistics.median(w["pss"] for w in workers):6.1f} MB{master}, '
+                  f'total PSS {totals[mode]:6.1f} MB')
+
+    saved = (totals['separate'] - totals['preload']) / args.workers
+    print(f'  memory saved per worker with --preload: {saved:.1f} MB '
+          f'({saved * args.workers / totals["separate"] * 100:.0f}% of the total)')
+
+
+if __name__ == '__main__':
+    main()
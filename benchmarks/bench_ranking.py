@@ -0,0 +1,91 @@
+"""Benchmark for top-k job ranking in JobMatcher.rank_jobs.
+
+Ranks synthetic jobs for one resume the old way (a copied result dict for
+every job, fully sorted, then sliced) and with rank_jobs (match_score for
+every job, top-k selection, then full results and dicts only for the
+returned page). That both return the same page is checked in
+tests/test_job_matcher.py.
+
+Usage:
+    python benchmarks/bench_ranking.py [--jobs 5000] [--k 10] [--offset 0]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from corpus import job_postings  # noqa: E402
+
+
+def rank_jobs_full_sort(matcher, resume_skills, jobs, taxonomy, k, offset):
+    """rank_jobs before top-k selection: copy every job, sort them all, slice"""
+    ranked_jobs = []
+    job_requirement_lists = [matcher.job_requirements(job) for job in jobs]
+    similarity = matcher.build_similarity_matrix([resume_skills], job_requirement_lists, taxonomy)
+
+    for job, job_skills in zip(jobs, job_requirement_lists):
+        match_result = matcher.calculate_advanced_match_score(
+            resume_skills, job_skills, job.get('description', ''), taxonomy, similarity
+        )
+        job_with_score = job.copy()
+        job_with_score.update({
+            'match_score': match_result['total_score'],
+            'exact_match_score': match_result['exact_score'],
+            'fuzzy_match_score': match_result['fuzzy_score'],
+            'semantic_match_score': match_result['semantic_score'],
+            'matched_skills': match_result['matched_skills'],
+            'missing_skills': match_result['missing_skills'],
+            'total_required_skills': match_result['total_required'],
+            'total_matched_skills': match_result['total_matched']
+        })
+        ranked_jobs.append(job_with_score)
+
+    ranked_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+    return ranked_jobs[offset:offset + k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=5000)
+    parser.add_argument('--requirements-per-job', type=int, default=8)
+    parser.add_argument('--skills-per-resume', type=int, default=25)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--offset', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+    matcher = app.JobMatcher()
+
+    resume_skills = rng.sample(vocabulary, args.skills_per_resume)
+    jobs = job_postings(rng, vocabulary, args.jobs, args.requirements_per_job)
+
+    timings = {}
+    for name, rank in (
+        ('full sort', lambda: rank_jobs_full_sort(matcher, resume_skills, jobs, taxonomy, args.k, args.offset)),
+        ('top-k', lambda: matcher.rank_jobs(resume_skills, jobs, taxonomy, args.k, args.offset)),
+    ):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            rank()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+
+    print(f'{args.jobs} jobs, page of {args.k} at offset {args.offset}')
+    for name, seconds in timings.items():
+        print(f'  {name:10s}: {seconds * 1000:8.1f} ms')
+    print(f'  speedup   : {timings["full sort"] / timings["top-k"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark for condition waits while loading LinkedIn activity pages.
+
+Uses a stub driver in place of Chrome whose activity feed renders like
+LinkedIn's: the first posts appear a moment after navigation and each scroll
+to the bottom loads another batch a moment later, until the feed runs out.
+Loads every trusted profile's page with the fixed sleeps the scraper used
+before (3 s, then three scrolls with 2 s each) and with load_activity_page's
+condition waits. What the condition waits load is checked in
+tests/test_scrape_waits.py.
+
+Usage:
+    python benchmarks/bench_scrape_waits.py [--render 0.8] [--scroll-load 0.5] [--batch 5] [--feed 30]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from stub_driver import LazyFeedDriver  # noqa: E402
+
+
+class FixedSleepScraper(app.LinkedInJobScraper):
+    """load_activity_page before condition waits"""
+
+    def load_activity_page(self, profile_url, max_posts_per_profile=10, watermark=None, timing=None):
+        with self.browser_pool.session() as driver:
+            driver.get(f"{profile_url}/recent-activity/")
+            time.sleep(3)
+            for _ in range(3):
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(2)
+            return driver.page_source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--render', type=float, default=0.8, help='seconds until the first posts appear')
+    parser.add_argument('--scroll-load', type=float, default=0.5, help='seconds for a scroll to load more posts')
+    parser.add_argument('--batch', type=int, default=5, help='posts loaded at a time')
+    parser.add_argument('--feed', type=int, default=30, help='posts in the whole feed')
+    parser.add_argument('--posts', type=int, default=10, help='max posts per profile')
+    args = parser.parse_args()
+
+    profile_urls = app.TRUSTED_LINKEDIN_PROFILES
+
+    def driver_factory():
+        return LazyFeedDriver(args.render, args.scroll_load, args.batch, args.feed)
+
+    timings = {}
+    for name, scraper_class in (('fixed sleeps', FixedSleepScraper), ('condition waits', app.LinkedInJobScraper)):
+        # One session per profile so profiles load side by side, as in the refresher
+        scraper = scraper_class(browser_pool=app.BrowserPool(driver_factory, size=len(profile_urls)))
+        start = time.perf_counter()
+        list(scraper.scrape_profiles(profile_urls, args.posts))
+        timings[name] = time.perf_counter() - start
+        scraper.browser_pool.close_idle(0)
+        for profile_url, timing in scraper.timings.items():
+            if timing['first_post'] is not None:
+                print(f'  {profile_url.rsplit("/", 1)[-1]}: first post after {timing["first_post"]:.2f} s, '
+                      f'{timing["posts"]} posts, {timing["scrolls"]} scrolls, {timing["seconds"]:.2f} s')
+
+    print(f'{len(profile_urls)} profiles, {args.posts} posts each (first posts after {args.render:.1f} s, '
+          f'{args.batch} more per scroll after {args.scroll_load:.1f} s)')
+    for name, seconds in timings.items():
+        print(f'  {name:16s}: {seconds:6.2f} s')
+    print(f'  speedup         : {timings["fixed sleeps"] / timings["condition waits"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark for TF-IDF semantic scoring of resume x job pairs.
+
+Fits a SemanticModel on the default corpus, then scores synthetic resumes
+against synthetic job descriptions pair by pair (one transform and one
+cosine similarity per pair) and with semantic_scores (one batch transform and
+one sparse matrix product). The word overlap score that
+SEMANTIC_SCORING=overlap uses is timed for reference. That both TF-IDF paths
+agree is checked in tests/test_semantic.py.
+
+Usage:
+    python benchmarks/bench_semantic.py [--resumes 100] [--jobs 20]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from corpus import job_description_text, skill_lists  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=100)
+    parser.add_argument('--jobs', type=int, default=20)
+    parser.add_argument('--skills-per-resume', type=int, default=25)
+    parser.add_argument('--words-per-job', type=int, default=120)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+
+    resume_skill_lists = skill_lists(rng, vocabulary, args.resumes, args.skills_per_resume)
+    job_descriptions = [job_description_text(rng, vocabulary, args.words_per_job, 0.3) for _ in range(args.jobs)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model = app.SemanticModel(os.path.join(tmp, 'semantic_tfidf.pkl'), mode='tfidf')
+        start = time.perf_counter()
+        vectorizer = model.fit(app.default_semantic_corpus(taxonomy) + job_descriptions)
+        print(f'model fitted in {(time.perf_counter() - start) * 1000:.1f} ms '
+              f'({len(vectorizer.vocabulary_)} terms)')
+
+    pairs = args.resumes * args.jobs
+
+    start = time.perf_counter()
+    np.array([
+        [app.semantic_scores(vectorizer, [skills], app.semantic_vectors(vectorizer, [description]))[0, 0]
+         for description in job_descriptions]
+        for skills in resume_skill_lists
+    ])
+    pairwise_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    app.semantic_scores(vectorizer, resume_skill_lists, app.semantic_vectors(vectorizer, job_descriptions))
+    batched_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for skills in resume_skill_lists:
+        resume_words = set(' '.join(skills).lower().split())
+        for description in job_descriptions:
+            job_words = set(description.lower().split())
+            len(job_words & resume_words) / len(job_words)
+    overlap_s = time.perf_counter() - start
+
+    print(f'{args.resumes} resumes x {args.jobs} jobs = {pairs} pairs')
+    print(f'  tfidf pair by pair : {pairwise_s * 1000:8.1f} ms')
+    print(f'  tfidf batched      : {batched_s * 1000:8.1f} ms  ({pairwise_s / batched_s:.0f}x)')
+    print(f'  word overlap       : {overlap_s * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark for fuzzy requirement matching in JobMatcher.
+
+Scores synthetic candidates against synthetic jobs whose requirements are
+partly free text (so they reach fuzzy matching), once with per-pair
+fuzz.ratio calls and once with a request-wide SkillSimilarityMatrix. That
+both give the same scores is checked in tests/test_job_matcher.py.
+
+Usage:
+    python benchmarks/bench_similarity.py [--resumes 100] [--jobs 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from corpus import requirement_list, skill_lists  # noqa: E402
+
+
+def score_all(matcher, candidates, jobs, taxonomy, similarity):
+    results = []
+    for skills in candidates:
+        for requirements, description in jobs:
+            results.append(matcher.calculate_advanced_match_score(
+                skills, requirements, description, taxonomy, similarity
+            ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--resumes', type=int, default=100)
+    parser.add_argument('--jobs', type=int, default=20)
+    parser.add_argument('--skills-per-resume', type=int, default=25)
+    parser.add_argument('--requirements-per-job', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+    matcher = app.JobMatcher()
+
+    candidates = skill_lists(rng, vocabulary, args.resumes, args.skills_per_resume)
+    jobs = []
+    for _ in range(args.jobs):
+        requirements = requirement_list(rng, vocabulary, args.requirements_per_job, free_text=0.5)
+        jobs.append((requirements, 'We are hiring an engineer with ' + ', '.join(requirements)))
+
+    start = time.perf_counter()
+    score_all(matcher, candidates, jobs, taxonomy, None)
+    pairwise_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    similarity = matcher.build_similarity_matrix(candidates, [reqs for reqs, _ in jobs], taxonomy)
+    build_s = time.perf_counter() - start
+    score_all(matcher, candidates, jobs, taxonomy, similarity)
+    batched_s = time.perf_counter() - start
+
+    rows, cols = similarity.scores.shape
+    print(f'{args.resumes} resumes x {args.jobs} jobs ({rows} free-text requirements x {cols} skills, '
+          f'rapidfuzz={"yes" if app.cdist is not None else "no"})')
+    print(f'  per-pair fuzz.ratio : {pairwise_s * 1000:8.1f} ms')
+    print(f'  similarity matrix   : {batched_s * 1000:8.1f} ms  (matrix build {build_s * 1000:.1f} ms)')
+    print(f'  speedup             : {pairwise_s / batched_s:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
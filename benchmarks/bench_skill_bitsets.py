@@ -0,0 +1,78 @@
+"""Benchmark for exact-match ranking with SkillBitsetMatrix.
+
+Encodes synthetic candidates as skill bitsets and ranks them for synthetic
+jobs by exact score, once with popcount over the whole matrix plus top-k
+selection and once with calculate_advanced_match_score's set intersection
+per candidate. That both give the same scores and order is checked in
+tests/test_candidate_store.py.
+
+Usage:
+    python benchmarks/bench_skill_bitsets.py [--candidates 100000] [--jobs 5] [--k 50]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from corpus import skill_lists  # noqa: E402
+
+
+def exact_scores(candidates, requirements, taxonomy):
+    """Exact scores computed the way calculate_advanced_match_score does"""
+    term_ids = taxonomy.term_ids
+    job_keys = {term_ids.get(req, req) for req in requirements}
+    scores = []
+    for skills in candidates:
+        resume_keys = {term_ids.get(skill, skill) for skill in skills}
+        scores.append((len(resume_keys & job_keys) / len(job_keys)) * 100)
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--candidates', type=int, default=100000)
+    parser.add_argument('--jobs', type=int, default=5)
+    parser.add_argument('--max-skills', type=int, default=25)
+    parser.add_argument('--requirements-per-job', type=int, default=10)
+    parser.add_argument('--k', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+
+    candidates = skill_lists(rng, vocabulary, args.candidates, args.max_skills, min_size=0)
+    jobs = skill_lists(rng, vocabulary, args.jobs, args.requirements_per_job)
+
+    start = time.perf_counter()
+    bitsets = app.SkillBitsetMatrix(taxonomy)
+    bitsets.append(candidates)
+    encode_s = time.perf_counter() - start
+
+    bitset_s = scan_s = 0
+    for requirements in jobs:
+        start = time.perf_counter()
+        bitsets.top_k(requirements, args.k)
+        bitset_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = exact_scores(candidates, requirements, taxonomy)
+        sorted(range(len(candidates)), key=lambda row: scanned[row], reverse=True)[:args.k]
+        scan_s += time.perf_counter() - start
+
+    print(f'{args.candidates} candidates x {args.jobs} jobs, top {args.k} '
+          f'({bitsets.skill_bits.shape[1]} x uint64 per candidate, encoded in {encode_s * 1000:.0f} ms)')
+    print(f'  set intersection per candidate : {scan_s / args.jobs * 1000:8.1f} ms per job')
+    print(f'  bitset popcount + top-k        : {bitset_s / args.jobs * 1000:8.1f} ms per job')
+    print(f'  speedup                        : {scan_s / bitset_s:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Micro-benchmark for skill extraction.
+
+Compares the compiled single-pass ``SkillMatcher`` used by
+``extract_skills_and_keywords`` with the original one-regex-per-skill loop
+(tests/baseline_skills.py) and prints per-resume latency for 2-page and
+20-page synthetic resumes. tests/test_skill_matcher.py checks that both
+find the same skills.
+
+Usage:
+    python benchmarks/bench_skill_matcher.py [--repeat 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import app  # noqa: E402
+from baseline_skills import extract_skills_and_keywords as legacy_extract_skills  # noqa: E402
+
+FILLER_WORDS = (
+    'experience with building and maintaining services using the team '
+    'responsible for database design delivered projects in years of '
+    'worked on applications db production systems skills knowledge'
+).split()
+
+WORDS_PER_PAGE = 500
+
+
+TAXONOMY = app.SKILL_TAXONOMY.current()
+VOCABULARY = sorted(TAXONOMY.term_ids)
+
+
+def make_resume(pages, rng):
+    """Build a synthetic resume with roughly one skill every eight words"""
+    lines = []
+    for _ in range(pages * WORDS_PER_PAGE // 10):
+        words = [rng.choice(VOCABULARY) if rng.random() < 0.125 else rng.choice(FILLER_WORDS)
+                 for _ in range(10)]
+        lines.append(' '.join(words).capitalize() + '.')
+    return '\n'.join(lines)
+
+
+def time_per_call(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    for pages in (2, 20):
+        text = make_resume(pages, rng)
+        current = app.extract_skills_and_keywords(text, TAXONOMY)
+
+        legacy_ms = time_per_call(legacy_extract_skills, text, args.repeat)
+        current_ms = time_per_call(app.extract_skills_and_keywords, text, args.repeat)
+        print(f'{pages:>2}-page resume ({len(text):>6} chars, {len(current):>3} skills): '
+              f'legacy {legacy_ms:7.2f} ms  compiled {current_ms:7.2f} ms  '
+              f'speedup {legacy_ms / current_ms:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
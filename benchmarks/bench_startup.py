@@ -0,0 +1,115 @@
+"""Benchmark for worker cold start: import time, RSS and lazily loaded modules.
+
+Starts fresh interpreters that import app under ``python -X importtime``, then
+serve /health and a TXT /upload, as a new gunicorn worker would. Reports the
+import time, peak RSS, the slowest imports and which heavy optional
+dependencies got loaded. It runs once as is and once importing everything
+app.py used to import at load time, to show what lazy loading saves. Exits
+with status 1 when the lazy worker goes over the import time or RSS budget.
+That it loads no dependency only PDF/DOCX parsing, scraping or TF-IDF
+scoring need is checked in tests/test_app_import.py.
+
+Background LinkedIn scraping is disabled in the measured workers.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--budget-import-ms 600] [--budget-rss-mb 100]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use only; a TXT upload or /health must not pull these in
+LAZY_MODULES = ('selenium', 'bs4', 'PyPDF2', 'docx', 'fuzzywuzzy', 'sklearn', 'scipy')
+
+WORKER = '''
+import io, json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import app
+if {eager!r}:
+    app.EXTRACTORS.preload()
+    app.SCRAPERS.preload()
+    import fuzzywuzzy.fuzz, sklearn.feature_extraction.text, sklearn.metrics.pairwise, scipy.sparse
+import_s = time.perf_counter() - start
+client = app.app.test_client()
+client.get('/health')
+client.post('/upload', data={{
+    'resume': (io.BytesIO(b'Jane Doe\\nSkills: Python, Django, AWS, SQL\\n'), 'resume.txt'),
+    'job_description': 'Python developer with Django and AWS'
+}})
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    'import_s': import_s,
+    'rss_mb': rss / (1024 * 1024 if sys.platform == 'darwin' else 1024),
+    'loaded': [name for name in {lazy!r} if name in sys.modules]
+}}))
+'''
+
+
+def run_worker(eager, cwd):
+    env = dict(os.environ, LINKEDIN_REFRESH_INTERVAL='0', PYTHONDONTWRITEBYTECODE='1')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', WORKER.format(root=ROOT, eager=eager, lazy=LAZY_MODULES)],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    measurement = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # "import time: self [us] | cumulative | imported package"
+    imports = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)', line)
+        if match and len(match.group(3)) <= 3:
+            imports.append((int(match.group(2)), match.group(4)))
+    measurement['top_imports'] = sorted(imports, reverse=True)[:8]
+    return measurement
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-import-ms', type=float, default=600)
+    parser.add_argument('--budget-rss-mb', type=float, default=100)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'uploads'))
+        for name, eager in (('lazy', False), ('eager', True)):
+            runs = [run_worker(eager, tmp) for _ in range(args.runs)]
+            results[name] = {
+                'import_ms': statistics.median(run['import_s'] for run in runs) * 1000,
+                'rss_mb': statistics.median(run['rss_mb'] for run in runs),
+                'loaded': runs[-1]['loaded'],
+                'top_imports': runs[-1]['top_imports']
+            }
+
+    for name, result in results.items():
+        print(f'{name}: import {result["import_ms"]:.0f} ms, peak RSS {result["rss_mb"]:.1f} MB '
+              f'(median of {args.runs}), heavy modules loaded: {", ".join(result["loaded"]) or "none"}')
+        for cumulative_us, module in result['top_imports']:
+            print(f'    {cumulative_us / 1000:8.1f} ms  {module}')
+
+    lazy = results['lazy']
+    failures = []
+    if lazy['import_ms'] > args.budget_import_ms:
+        failures.append(f'import time {lazy["import_ms"]:.0f} ms is over the {args.budget_import_ms:.0f} ms budget')
+    if lazy['rss_mb'] > args.budget_rss_mb:
+        failures.append(f'peak RSS {lazy["rss_mb"]:.1f} MB is over the {args.budget_rss_mb:.0f} MB budget')
+
+    if failures:
+        print('STARTUP BUDGET EXCEEDED: ' + '; '.join(failures))
+        sys.exit(1)
+    print(f'within budget ({args.budget_import_ms:.0f} ms, {args.budget_rss_mb:.0f} MB); '
+          f'lazy loading saves {results["eager"]["import_ms"] - lazy["import_ms"]:.0f} ms and '
+          f'{results["eager"]["rss_mb"] - lazy["rss_mb"]:.1f} MB per worker')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""Benchmark suite covering every hot path, with JSON results for comparing commits.
+
+Generates synthetic resumes (PDF, DOCX and TXT in equal parts) and job
+descriptions of a controlled size and skill density. It times each stage on
+its own: text extraction per format, skill extraction, calculate_match_score,
+JobMatcher.calculate_advanced_match_score and JobMatcher.rank_jobs. It then
+drives every endpoint through the Flask test client with 1, 50 and 500
+resumes. Single-resume endpoints get one request per resume, and batch
+endpoints one request with all of them.
+
+The app runs in a temporary directory with its caches off, so every run
+parses and scores from scratch. LinkedIn endpoints use the mock jobs.
+Results go to --output as JSON. --compare reads an earlier results file and
+exits with status 1 if any timing got slower by more than --tolerance.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1,50,500] [--words 400] [--skill-density 0.1]
+                                     [--output results.json] [--compare baseline.json] [--tolerance 0.25]
+"""
+import argparse
+import atexit
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+# The app keeps its databases under ./uploads and reads its settings at import
+CALLER_CWD = os.getcwd()
+WORKDIR = tempfile.mkdtemp(prefix='ats-bench-')
+atexit.register(shutil.rmtree, WORKDIR, True)
+os.makedirs(os.path.join(WORKDIR, 'uploads'))
+os.chdir(WORKDIR)
+os.environ.update(RESUME_CACHE_SIZE='0', RESUME_CACHE_DB='', JOB_DESCRIPTION_CACHE_SIZE='0',
+                  LINKEDIN_REFRESH_INTERVAL='0', SKILL_TAXONOMY_RELOAD_INTERVAL='0')
+
+import app  # noqa: E402
+from corpus import FORMATS, job_description_text, resume_files  # noqa: E402
+
+def best_time(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_stages(rng, vocabulary, taxonomy, args):
+    """{stage: {'items', 'seconds', 'ms_per_item'}}, best of --repeat"""
+    documents = resume_files(rng, vocabulary, args.stage_docs * len(FORMATS), args.words, args.skill_density)
+    by_format = {extension: [data for name, data, _ in documents if name.endswith(extension)] for extension in FORMATS}
+    texts = [text for _, _, text in documents]
+    job_descriptions = [job_description_text(rng, vocabulary, args.jd_words, args.skill_density)
+                        for _ in range(args.stage_docs)]
+    jobs = [{
+        'title': f'Job {i}',
+        'company': 'Example Corp',
+        'description': job_description,
+        'requirements': rng.sample(vocabulary, 8)
+    } for i, job_description in enumerate(job_descriptions)]
+
+    matcher = app.JobMatcher()
+    resume_skill_lists = [app.extract_skills_and_keywords(text, taxonomy) for text in texts]
+    jd_skill_lists = [app.extract_skills_and_keywords(text, taxonomy) for text in job_descriptions]
+    pairs = [(resume_skills, job) for resume_skills in resume_skill_lists[:args.stage_docs] for job in jobs]
+
+    stages = {
+        'extract_text_from_pdf': (len(by_format['pdf']), lambda: [
+            app.extract_text_from_pdf(io.BytesIO(data)) for data in by_format['pdf']]),
+        'extract_text_from_docx': (len(by_format['docx']), lambda: [
+            app.extract_text_from_docx(io.BytesIO(data)) for data in by_format['docx']]),
+        'extract_text_from_txt': (len(by_format['txt']), lambda: [
+            app.extract_text_from_txt(io.BytesIO(data)) for data in by_format['txt']]),
+        'extract_skills_and_keywords': (len(texts), lambda: [
+            app.extract_skills_and_keywords(text, taxonomy) for text in texts]),
+        'calculate_match_score': (len(resume_skill_lists) * len(jd_skill_lists), lambda: [
+            app.calculate_match_score(resume_skills, job_skills)
+            for resume_skills in resume_skill_lists for job_skills in jd_skill_lists]),
+        'calculate_advanced_match_score': (len(pairs), lambda: [
+            matcher.calculate_advanced_match_score(resume_skills, job['requirements'], job['description'], taxonomy)
+            for resume_skills, job in pairs]),
+        'rank_jobs': (args.stage_docs, lambda: [
+            matcher.rank_jobs(resume_skills, jobs, taxonomy) for resume_skills in resume_skill_lists[:args.stage_docs]]),
+    }
+
+    results = {}
+    for name, (items, function) in stages.items():
+        seconds = best_time(function, args.repeat)
+        results[name] = {'items': items, 'seconds': seconds, 'ms_per_item': seconds / items * 1000}
+    return results
+
+
+def time_endpoints(rng, vocabulary, size, args):
+    """{endpoint: {'requests', 'seconds', 'status'}} for ``size`` resumes"""
+    client = app.app.test_client()
+    job_description = job_description_text(rng, vocabulary, args.jd_words, args.skill_density)
+
+    def uploads():
+        # New resumes for every endpoint, so nothing is parsed twice
+        return [(io.BytesIO(data), name) for name, data, _ in
+                resume_files(rng, vocabulary, size, args.words, args.skill_density)]
+
+    def each(method, path, files=None, **form):
+        statuses = set()
+        for upload in files or [None] * size:
+            data = dict(form, resume=upload) if upload else form
+            statuses.add(client.open(path, method=method, data=data).status_code)
+        return statuses
+
+    def batch_job(files):
+        response = client.post('/batch-jobs', data={'resumes': files, 'job_description': job_description})
+        if response.status_code != 202:
+            return {response.status_code}
+        result_url = response.json['result_url']
+        while True:
+            response = client.get(result_url)
+            if response.status_code != 202:
+                return {response.status_code}
+            time.sleep(0.01)
+
+    # name: (one request per resume, takes resumes, run)
+    endpoints = {
+        'GET /': (True, False, lambda files: each('GET', '/')),
+        'GET /health': (True, False, lambda files: each('GET', '/health')),
+        'GET /get-sample-jobs': (True, False, lambda files: each('GET', '/get-sample-jobs')),
+        'POST /upload': (True, True, lambda files: each(
+            'POST', '/upload', files, job_description=job_description)),
+        'POST /analyze-jobs': (True, True, lambda files: each('POST', '/analyze-jobs', files)),
+        'POST /upload-multiple': (False, True, lambda files: {client.post('/upload-multiple', data={
+            'resumes': files, 'job_description': job_description}).status_code}),
+        'POST /analyze-multiple-with-linkedin': (False, True, lambda files: {client.post(
+            '/analyze-multiple-with-linkedin', data={'resumes': files}).status_code}),
+        'POST /batch-jobs (until done)': (False, True, batch_job),
+        'POST /candidates': (False, True, lambda files: {client.post(
+            '/candidates', data={'resumes': files}).status_code}),
+        'POST /candidates/search': (False, False, lambda files: {client.post(
+            '/candidates/search', data={'job_description': job_description}).status_code}),
+    }
+
+    results = {}
+    for name, (per_resume, takes_resumes, run) in endpoints.items():
+        files = uploads() if takes_resumes else None
+        start = time.perf_counter()
+        statuses = run(files)
+        seconds = time.perf_counter() - start
+        results[name] = {'requests': size if per_resume else 1, 'seconds': seconds, 'status': sorted(statuses)}
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timings(results):
+    """{(section, name, size): seconds} of a results file, for comparing runs"""
+    flat = {('stages', name, ''): stage['ms_per_item'] / 1000 for name, stage in results['stages'].items()}
+    for size, endpoints in results['endpoints'].items():
+        for name, endpoint in endpoints.items():
+            flat[('endpoints', name, size)] = endpoint['seconds']
+    return flat
+
+
+def compare(results, baseline, tolerance, min_seconds=0.001):
+    """Timings more than ``tolerance`` slower than in ``baseline``, ignoring ones under ``min_seconds``"""
+    current, previous = timings(results), timings(baseline)
+    regressions = []
+    for key, seconds in current.items():
+        before = previous.get(key)
+        if before is None or max(seconds, before) < min_seconds:
+            continue
+        if seconds > before * (1 + tolerance):
+            regressions.append((key, before, seconds))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1,50,500', help='resume counts for the endpoint runs')
+    parser.add_argument('--words', type=int, default=400, help='words per resume')
+    parser.add_argument('--jd-words', type=int, default=150, help='words per job description')
+    parser.add_argument('--skill-density', type=float, default=0.1, help='share of words that are skills')
+    parser.add_argument('--stage-docs', type=int, default=30, help='documents per format for the stage timings')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--compare', help='earlier results file to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown against --compare')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taxonomy = app.SKILL_TAXONOMY.current()
+    vocabulary = list(taxonomy.skill_names)
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    results = {
+        'commit': git_commit(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'stages': time_stages(rng, vocabulary, taxonomy, args),
+        'endpoints': {}
+    }
+
+    print(f'{"stage":34s} {"items":>7s} {"ms/item":>10s}')
+    for name, stage in results['stages'].items():
+        print(f'{name:34s} {stage["items"]:7d} {stage["ms_per_item"]:10.3f}')
+
+    for size in sizes:
+        results['endpoints'][str(size)] = time_endpoints(rng, vocabulary, size, args)
+    print(f'\n{"endpoint":38s}' + ''.join(f'{f"{size} resumes":>14s}' for size in sizes))
+    for name in results['endpoints'][str(sizes[0])]:
+        row = []
+        for size in sizes:
+            endpoint = results['endpoints'][str(size)][name]
+            failed = '' if all(status < 400 for status in endpoint['status']) else '!'
+            row.append(f'{endpoint["seconds"] * 1000:12.1f}{failed or "ms":>2s}')
+        print(f'{name:38s}' + ''.join(row))
+
+    if args.output:
+        with open(os.path.join(CALLER_CWD, args.output), 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f'\nresults written to {args.output}')
+
+    if args.compare:
+        with open(os.path.join(CALLER_CWD, args.compare)) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        print(f'\ncompared with {baseline.get("commit") or args.compare}: ', end='')
+        if regressions:
+            print(f'{len(regressions)} timings slower by more than {args.tolerance:.0%}')
+            for (section, name, size), before, after in regressions:
+                where = f'{name} ({size} resumes)' if size else name
+                print(f'  {where}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms')
+            sys.exit(1)
+        print(f'no timing slower by more than {args.tolerance:.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""extract_skills_and_keywords exactly as it was before the compiled skill
+matcher and the skill taxonomy, for parity tests and benchmarks"""
+
+
+def extract_skills_and_keywords(text):
+    """Extract ONLY technical skills and keywords from text"""
+    
+    # TECHNICAL SKILLS ONLY - excluding soft skills and business skills
+    technical_skills = [
+        # Programming Languages
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'csharp', 'php', 'ruby', 'go', 'rust',
+        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css', 'jsx', 'tsx', 'perl',
+        'dart', 'julia', 'erlang', 'haskell', 'assembly', 'vb.net', 'objective-c',
+        
+        # Frameworks and Libraries
+        'react', 'angular', 'vue', 'nodejs', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel',
+        'bootstrap', 'tailwind', 'jquery', 'redux', 'vuex', 'tensorflow', 'pytorch', 'keras',
+        'pandas', 'numpy', 'matplotlib', 'scikit-learn', 'sklearn', 'opencv', 'fastapi', 'nest',
+        'nextjs', 'next.js', 'nuxt', 'ember', 'backbone', 'meteor', 'gatsby', 'svelte',
+        'spring boot', 'hibernate', 'struts', 'asp.net', '.net', 'dotnet', 'mvc', 'wpf',
+        
+        # Databases
+        'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'oracle',
+        'sqlite', 'dynamodb', 'firebase', 'supabase', 'mariadb', 'neo4j', 'influxdb', 'couchdb',
+        'sql server', 'mssql', 'nosql', 'graphql',
+        
+        # Cloud and DevOps
+        'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'gitlab', 'github',
+        'terraform', 'ansible', 'vagrant', 'chef', 'puppet', 'nginx', 'apache', 'linux',
+        'ubuntu', 'centos', 'debian', 'bash', 'powershell', 'ci/cd', 'devops', 'microservices',
+        'serverless', 'lambda', 'cloudformation', 'helm', 'istio', 'prometheus', 'grafana',
+        
+        # Data Science and AI
+        'machine learning', 'deep learning', 'artificial intelligence', 'data science',
+        'data analysis', 'data analytics', 'big data', 'hadoop', 'spark', 'kafka', 'tableau', 'power bi',
+        'excel', 'statistics', 'regression', 'classification', 'clustering', 'nlp',
+        'computer vision', 'neural networks', 'ai', 'ml', 'data mining', 'etl',
+        'jupyter', 'anaconda', 'r studio', 'sas', 'spss',
+        
+        # Mobile Development
+        'ios', 'android', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova',
+        'mobile development', 'app development', 'swift ui', 'kotlin multiplatform',
+        
+        # Testing and Quality Assurance
+        'testing', 'unit testing', 'integration testing', 'automation testing', 'selenium', 'jest', 'pytest',
+        'junit', 'mocha', 'cypress', 'testng', 'cucumber', 'postman', 'qa', 'quality assurance',
+        'tdd', 'bdd', 'test driven development',
+        
+        # Version Control and Development Tools
+        'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'version control',
+        'jira', 'confluence', 'trello',
+        
+        # Security (Technical)
+        'cybersecurity', 'information security', 'penetration testing', 'ethical hacking',
+        'encryption', 'ssl', 'oauth', 'jwt', 'authentication', 'authorization',
+        
+        # Web Development
+        'web development', 'frontend', 'backend', 'full stack', 'rest api', 'api development',
+        'soap', 'json', 'xml', 'ajax', 'websockets', 'graphql', 'grpc',
+        
+        # Design and Development Tools (Technical)
+        'figma', 'sketch', 'adobe xd', 'photoshop', 'illustrator', 'wireframing', 'prototyping',
+        
+        # Development Methodologies (Technical)
+        'agile', 'scrum', 'kanban', 'waterfall', 'agile methodologies', 'sprint planning',
+        
+        # Operating Systems and Servers
+        'windows', 'macos', 'unix', 'freebsd', 'windows server', 'iis',
+        
+        # Networking and Infrastructure
+        'tcp/ip', 'http', 'https', 'dns', 'load balancing', 'cdn', 'vpc', 'vpn'
+    ]
+    
+    # Convert text to lowercase for matching
+    text_lower = text.lower()
+    
+    # Extract only predefined skills found in the text
+    found_skills = []
+    
+    # Check for exact skill matches with better precision
+    # Sort by length (longest first) to match compound skills first
+    sorted_skills = sorted(technical_skills, key=len, reverse=True)
+    
+    for skill in sorted_skills:
+        skill_lower = skill.lower()
+        import re
+        
+        # Use strict word boundary matching
+        pattern = r'\b' + re.escape(skill_lower) + r'\b'
+        
+        if re.search(pattern, text_lower):
+            # Additional validation for common false positives
+            if skill_lower in ['mongodb', 'mysql', 'postgresql', 'oracle', 'redis', 'cassandra']:
+                # Be extra strict for database names - check for explicit mentions
+                db_patterns = [
+                    r'\b' + re.escape(skill_lower) + r'(?:\s+database|\s+db|\s*,|\s*\.|\s*;|\s*\n|\s*$)',
+                    r'(?:database|db|nosql|sql).*?' + re.escape(skill_lower),
+                    r'\b' + re.escape(skill_lower) + r'\s+(?:experience|skills?|knowledge|proficiency)'
+                ]
+                if any(re.search(pattern, text_lower) for pattern in db_patterns):
+                    found_skills.append(skill)
+            else:
+                found_skills.append(skill)
+    
+    # Remove duplicates and return
+    return list(set(found_skills))
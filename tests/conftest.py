@@ -0,0 +1,36 @@
+"""Shared test setup
+
+The app keeps its SQLite files (metrics, job cache, candidate pool, batch
+jobs) under uploads/ by default; the tests point them at a temporary
+directory before the app is imported.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DATA_DIR = tempfile.mkdtemp(prefix='ats-tests-')
+atexit.register(shutil.rmtree, DATA_DIR, True)
+for _name, _filename in (('METRICS_DB', 'metrics.db'), ('JOB_CACHE_DB', 'linkedin_jobs.db'),
+                         ('CANDIDATE_STORE_DB', 'candidates.db'), ('BATCH_JOB_DB', 'batch_jobs.db'),
+                         ('SEMANTIC_MODEL_PATH', 'semantic_tfidf.pkl')):
+    os.environ[_name] = os.path.join(DATA_DIR, _filename)
+os.environ['PARSE_POOL_WORKERS'] = '2'
+os.environ['LOG_LEVEL'] = 'WARNING'
+
+import app as ats  # noqa: E402
+
+
+@pytest.fixture
+def taxonomy():
+    return ats.SKILL_TAXONOMY.current()
+
+
+@pytest.fixture
+def client():
+    return ats.app.test_client()
@@ -0,0 +1,173 @@
+"""Synthetic resumes and job descriptions, shared by the tests and the benchmarks
+
+Text is built from taxonomy skills mixed with filler words at a chosen skill
+density; resumes can be rendered as PDF, DOCX or TXT files.
+"""
+import io
+import tarfile
+import zipfile
+
+FIRST_NAMES = ('Jane', 'John', 'Ana', 'Wei', 'Priya', 'Omar', 'Lena', 'Kofi', 'Maria', 'Ravi')
+LAST_NAMES = ('Doe', 'Smith', 'Lima', 'Chen', 'Patel', 'Haddad', 'Berg', 'Mensah', 'Garcia', 'Kumar')
+FILLER = ('experienced', 'team', 'delivered', 'projects', 'with', 'and', 'using', 'built', 'services',
+          'for', 'customers', 'improved', 'performance', 'led', 'the', 'design', 'of', 'platform',
+          'years', 'in', 'production', 'systems', 'worked', 'on', 'data', 'across', 'multiple')
+FORMATS = ('pdf', 'docx', 'txt')
+# A text box as Word saves it: DrawingML in mc:Choice and a VML copy in mc:Fallback
+TEXT_BOX = '''<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+    xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+    xmlns:v="urn:schemas-microsoft-com:vml">
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps"><w:drawing><wps:wsp><wps:txbx><w:txbxContent>
+      <w:p><w:r><w:t>{text}</w:t></w:r></w:p>
+    </w:txbxContent></wps:txbx></wps:wsp></w:drawing></mc:Choice>
+    <mc:Fallback><w:pict><v:shape><v:textbox><w:txbxContent>
+      <w:p><w:r><w:t>{text}</w:t></w:r></w:p>
+    </w:txbxContent></v:textbox></v:shape></w:pict></mc:Fallback>
+  </mc:AlternateContent>
+</w:r>'''
+SAMPLE_JOB_DESCRIPTIONS = (
+    'Senior Python developer with Django, PostgreSQL, AWS, Docker and machine learning experience. '
+    'You will build data pipelines.',
+    'Frontend engineer: React, TypeScript, CSS and HTML. Web development and REST API design.',
+    'Java Spring Boot microservices on Kubernetes with CI/CD.',
+)
+# Appended to skill names to make free-text requirements that only fuzzy matching can place
+REQUIREMENT_SUFFIXES = ('3', '5', ' dev', ' framework', 'js', ' programming', ' stack', 's')
+
+
+def synthetic_text(rng, vocabulary, words, skill_density, heading):
+    """``words`` words, a ``skill_density`` share of them taxonomy skills, 12 to a line"""
+    tokens = [rng.choice(vocabulary) if rng.random() < skill_density else rng.choice(FILLER) for _ in range(words)]
+    lines = [heading] + [' '.join(tokens[i:i + 12]) for i in range(0, len(tokens), 12)]
+    return '\n'.join(lines) + '\n'
+
+
+def resume_text(rng, vocabulary, words, skill_density):
+    name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    skills = ', '.join(rng.sample(vocabulary, 8))
+    return f'{name}\nSkills: {skills}\n' + synthetic_text(rng, vocabulary, words, skill_density, 'Experience')
+
+
+def job_description_text(rng, vocabulary, words, skill_density):
+    return synthetic_text(rng, vocabulary, words, skill_density, 'We are hiring an engineer. Requirements:')
+
+
+def skill_lists(rng, vocabulary, count, size, min_size=None):
+    """``count`` lists of ``size`` distinct skills, or of ``min_size`` to ``size`` skills"""
+    return [rng.sample(vocabulary, size if min_size is None else rng.randint(min_size, size)) for _ in range(count)]
+
+
+def requirement_list(rng, vocabulary, size, free_text=0.0):
+    """``size`` job requirements, a ``free_text`` share of them variants of skill names"""
+    return [skill + rng.choice(REQUIREMENT_SUFFIXES) if rng.random() < free_text else skill
+            for skill in rng.sample(vocabulary, size)]
+
+
+def job_postings(rng, vocabulary, count, size, free_text=0.0):
+    """``count`` job dicts shaped like the LinkedIn job cache's, each with
+    ``size`` requirements"""
+    jobs = []
+    for i in range(count):
+        requirements = requirement_list(rng, vocabulary, size, free_text)
+        jobs.append({
+            'title': f'Job {i}',
+            'company': 'Example Corp',
+            'requirements': requirements,
+            'description': 'We are hiring an engineer with ' + ', '.join(requirements) + '. ' + 'Details. ' * 50
+        })
+    return jobs
+
+
+def candidate_resumes(rng, vocabulary, count, max_skills=25):
+    """Parsed resumes as CandidateStore.add takes them, with 0 to ``max_skills`` skills each"""
+    return [{
+        'content_hash': f'synthetic-{i}',
+        'filename': f'resume_{i}.txt',
+        'candidate_name': f'Candidate {i}',
+        'resume_skills': skills,
+        'resume_text': ''
+    } for i, skills in enumerate(skill_lists(rng, vocabulary, count, max_skills, min_size=0))]
+
+
+def pdf_bytes(text, lines_per_page=50):
+    """A minimal PDF showing ``text`` in Helvetica, one line per text line"""
+    lines = text.splitlines() or ['']
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None, '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for start in range(0, len(lines), lines_per_page):
+        shown = ' '.join(
+            '({}) Tj T*'.format(line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)'))
+            for line in lines[start:start + lines_per_page]
+        )
+        stream = f'BT /F1 10 Tf 12 TL 50 760 Td {shown} ET'
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+        kids.append(len(objects))
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(f"{kid} 0 R" for kid in kids)}] /Count {len(kids)} >>'
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1'))
+    xref = out.tell()
+    out.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    out.write(''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode())
+    out.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    return out.getvalue()
+
+
+def docx_bytes(text, table_skills=None, text_box_skills=None):
+    """A DOCX with one paragraph per line of ``text``, optionally followed by
+    a one-row table and a text box listing skills"""
+    import docx
+    from docx.oxml import parse_xml
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    if table_skills:
+        table = document.add_table(rows=1, cols=len(table_skills))
+        for cell, skill in zip(table.rows[0].cells, table_skills):
+            cell.text = skill
+    if text_box_skills:
+        paragraph = document.add_paragraph('Profile')
+        paragraph._p.append(parse_xml(TEXT_BOX.format(text=', '.join(text_box_skills))))
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def resume_files(rng, vocabulary, count, words, skill_density):
+    """[(filename, bytes, text)], cycling through PDF, DOCX and TXT"""
+    files = []
+    for i in range(count):
+        text = resume_text(rng, vocabulary, words, skill_density)
+        extension = FORMATS[i % len(FORMATS)]
+        data = {'pdf': pdf_bytes, 'docx': docx_bytes, 'txt': lambda text: text.encode('utf-8')}[extension](text)
+        files.append((f'resume_{i}.{extension}', data, text))
+    return files
+
+
+def zip_bytes(members, compression=zipfile.ZIP_DEFLATED):
+    """A ZIP archive of (name, bytes) members"""
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', compression) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    return out.getvalue()
+
+
+def tar_gz_bytes(members):
+    """A gzipped tarball of (name, bytes) members"""
+    out = io.BytesIO()
+    with tarfile.open(fileobj=out, mode='w:gz') as archive:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return out.getvalue()
@@ -0,0 +1,113 @@
+"""Stand-ins for a selenium WebDriver, for tests and benchmarks that scrape
+LinkedIn activity pages without a browser"""
+import re
+import time
+
+POST = ('<div data-id="urn:li:activity:{number}"><div class="update-components-text">'
+        '<p>We are hiring a Backend Engineer ({number})</p><p>at Example Corp</p>'
+        '<p>Requirements:</p><ul><li>- Python</li><li>- PostgreSQL</li><li>- Docker</li></ul>'
+        '<p>Location: Remote</p></div></div>')
+
+
+def activity_page(numbers):
+    """An activity page with one job post per activity number, newest first"""
+    posts = ''.join(POST.format(number=number) for number in sorted(numbers, reverse=True))
+    return f'<html><body><main>{posts}</main></body></html>'
+
+
+class StubElement:
+    def __init__(self, post_id):
+        self.post_id = post_id
+
+    def get_attribute(self, name):
+        return self.post_id
+
+
+class StubDriver:
+    """Just enough of a selenium WebDriver for LinkedInJobScraper: serves
+    ``pages`` by URL and sleeps to stand in for browser startup and page loads.
+    Once ``alive`` is False every call fails, like a crashed browser."""
+
+    def __init__(self, pages, startup=0.0, page=0.0):
+        time.sleep(startup)
+        self.pages = pages
+        self.page = page
+        self.page_source = ''
+        self.alive = True
+        self.quit_called = False
+
+    def _check(self):
+        if not self.alive:
+            raise RuntimeError('chrome not reachable')
+
+    def get(self, url):
+        self._check()
+        time.sleep(self.page)
+        self.page_source = self.pages[url]
+
+    def execute_script(self, script):
+        self._check()
+        return 'complete'
+
+    def find_elements(self, by, selector):
+        self._check()
+        return [StubElement(post_id) for post_id in re.findall(r'data-id="([^"]+)"', self.page_source)]
+
+    def find_element(self, by, selector):
+        from selenium.common.exceptions import NoSuchElementException
+
+        elements = self.find_elements(by, selector)
+        if not elements:
+            raise NoSuchElementException(selector)
+        return elements[0]
+
+    def quit(self):
+        self.quit_called = True
+
+
+class LazyFeedDriver:
+    """A selenium WebDriver stand-in whose activity feed loads like LinkedIn's:
+    the first ``batch`` posts appear ``render`` seconds after navigation and
+    each scroll to the bottom loads another batch ``scroll_load`` seconds
+    later, until all ``feed`` posts are shown"""
+
+    def __init__(self, render, scroll_load, batch, feed):
+        self.render = render
+        self.scroll_load = scroll_load
+        self.batch = batch
+        self.feed = feed
+        self.numbers = []
+        self.ready_at = []
+
+    def get(self, url):
+        # Newest post first, as on LinkedIn
+        now = time.monotonic()
+        self.numbers = list(range(self.feed, 0, -1))
+        self.ready_at = [now + self.render]
+
+    def visible(self):
+        now = time.monotonic()
+        return min(self.feed, self.batch * sum(1 for ready in self.ready_at if ready <= now))
+
+    def execute_script(self, script):
+        if 'scrollTo' in script and self.visible() and self.ready_at[-1] <= time.monotonic():
+            self.ready_at.append(time.monotonic() + self.scroll_load)
+        return 'complete'
+
+    def find_elements(self, by, selector):
+        return [StubElement(f'urn:li:activity:{number}') for number in self.numbers[:self.visible()]]
+
+    def find_element(self, by, selector):
+        from selenium.common.exceptions import NoSuchElementException
+
+        elements = self.find_elements(by, selector)
+        if not elements:
+            raise NoSuchElementException(selector)
+        return elements[0]
+
+    @property
+    def page_source(self):
+        return activity_page(self.numbers[:self.visible()])
+
+    def quit(self):
+        pass
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_the_app_opens_no_database(tmp_path):
+    env = {name: value for name, value in os.environ.items() if not name.endswith('_DB')}
+    env['PYTHONPATH'] = ROOT
+    subprocess.run([sys.executable, '-c', 'import app'], cwd=tmp_path, env=env, check=True, capture_output=True)
+
+    assert os.listdir(tmp_path / 'uploads') == []
+
+
+def test_txt_upload_loads_no_optional_dependency(tmp_path):
+    # Only PDF/DOCX parsing, scraping or TF-IDF scoring need these
+    lazy_modules = ('selenium', 'bs4', 'PyPDF2', 'docx', 'fuzzywuzzy', 'sklearn', 'scipy')
+    worker = f'''
+import io, sys
+import app
+client = app.app.test_client()
+assert client.get('/health').status_code == 200
+assert client.post('/upload', data={{
+    'resume': (io.BytesIO(b'Jane Doe\\nSkills: Python, Django, AWS, SQL\\n'), 'resume.txt'),
+    'job_description': 'Python developer with Django and AWS'
+}}).status_code == 200
+print(' '.join(name for name in {lazy_modules!r} if name in sys.modules))
+'''
+    env = dict(os.environ, PYTHONPATH=ROOT, LINKEDIN_REFRESH_INTERVAL='0')
+    result = subprocess.run([sys.executable, '-c', worker], cwd=tmp_path, env=env, check=True,
+                            capture_output=True, text=True)
+
+    assert result.stdout.split() == []
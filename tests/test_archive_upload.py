@@ -0,0 +1,103 @@
+import io
+import random
+import zipfile
+
+import pytest
+
+import app as ats
+import corpus
+
+pytest.importorskip('docx')
+
+JANE = ('jane.txt', b'Jane Doe\nSkills: Python, Django, AWS, SQL\n')
+# 8 MB of zeros deflates to about 8 KB, far over ARCHIVE_MAX_RATIO
+BOMB = ('bomb.txt', bytes(8 * 1024 * 1024))
+
+
+@pytest.fixture
+def job_description():
+    return corpus.SAMPLE_JOB_DESCRIPTIONS[0]
+
+
+@pytest.fixture
+def resumes(taxonomy):
+    files = corpus.resume_files(random.Random(42), list(taxonomy.skill_names), 12, 200, 0.1)
+    return [(f'resumes/{filename}', data) for filename, data, _ in files]
+
+
+def post_archive(client, data, filename, job_description):
+    return client.post('/upload-archive', data={
+        'archive': (io.BytesIO(data), filename), 'job_description': job_description
+    })
+
+
+@pytest.mark.parametrize('archive, filename', [
+    (lambda members: corpus.zip_bytes(members + [('__MACOSX/._resume_0.pdf', b'x')]), 'resumes.zip'),
+    (corpus.tar_gz_bytes, 'resumes.tar.gz'),
+])
+def test_archive_ranks_like_upload_multiple(client, resumes, job_description, archive, filename):
+    expected = client.post('/upload-multiple', data={
+        'resumes': [(io.BytesIO(data), name.rsplit('/', 1)[-1]) for name, data in resumes],
+        'job_description': job_description
+    })
+    response = post_archive(client, archive(resumes), filename, job_description)
+    assert expected.status_code == 200
+    assert response.status_code == 200
+    assert response.get_json() == expected.get_json()
+
+
+def test_zip_bomb_member_is_a_file_error(client, job_description):
+    response = post_archive(client, corpus.zip_bytes([JANE, BOMB]), 'bomb.zip', job_description)
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['total_processed'] == 1
+    assert body['errors'] == ['bomb.txt: Compressed too much to be a resume']
+
+
+def test_tar_gz_bomb_is_rejected(client, job_description):
+    response = post_archive(client, corpus.tar_gz_bytes([JANE, BOMB]), 'bomb.tar.gz', job_description)
+    assert response.status_code == 413
+
+
+def test_archive_over_total_size_is_rejected(client, job_description, monkeypatch):
+    monkeypatch.setitem(ats.app.config, 'ARCHIVE_MAX_TOTAL_SIZE', 64)
+    members = [(f'{i}_{JANE[0]}', JANE[1]) for i in range(3)]
+    response = post_archive(client, corpus.zip_bytes(members, zipfile.ZIP_STORED), 'large.zip', job_description)
+    assert response.status_code == 413
+
+
+@pytest.mark.parametrize('archive, filename', [
+    (lambda members: corpus.zip_bytes(members, zipfile.ZIP_STORED), 'many.zip'),
+    (corpus.tar_gz_bytes, 'many.tar.gz'),
+])
+def test_too_many_files_are_rejected(client, job_description, monkeypatch, archive, filename):
+    # Skipped files count against the limit too
+    monkeypatch.setitem(ats.app.config, 'ARCHIVE_MAX_MEMBERS', 2)
+    members = [(f'{i}_{JANE[0]}', JANE[1]) for i in range(2)] + [('setup.exe', b'')]
+    response = post_archive(client, archive(members), filename, job_description)
+    assert response.status_code == 413
+
+
+def test_archive_of_skipped_files_is_rejected(client, job_description):
+    limit = ats.app.config['ARCHIVE_MAX_MEMBERS']
+    junk = corpus.zip_bytes([(f'junk/{i}.exe', b'') for i in range(limit + 1)], zipfile.ZIP_STORED)
+    assert post_archive(client, junk, 'junk.zip', job_description).status_code == 413
+
+
+def test_oversized_member_is_a_file_error(client, job_description, monkeypatch):
+    monkeypatch.setitem(ats.app.config, 'ARCHIVE_MAX_MEMBER_SIZE', 16)
+    response = post_archive(client, corpus.zip_bytes([JANE], zipfile.ZIP_STORED), 'big.zip', job_description)
+    assert response.status_code == 400
+    assert response.get_json()['errors'] == ['jane.txt: Larger than 16 bytes uncompressed']
+
+
+def test_archive_may_be_larger_than_max_content_length(client, resumes, job_description, monkeypatch):
+    archive = corpus.zip_bytes(resumes, zipfile.ZIP_STORED)
+    monkeypatch.setitem(ats.app.config, 'MAX_CONTENT_LENGTH', len(archive) // 2)
+    response = post_archive(client, archive, 'large.zip', job_description)
+    assert response.status_code == 200
+    assert response.get_json()['total_processed'] == len(resumes)
+
+
+def test_file_that_is_not_an_archive_is_rejected(client, job_description):
+    assert post_archive(client, b'not an archive', 'resume.zip', job_description).status_code == 400
@@ -0,0 +1,80 @@
+import io
+import random
+import time
+
+import pytest
+
+import app as ats
+import corpus
+
+pytest.importorskip('docx')
+
+STALE_AFTER = 0.05
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    return ats.BatchJobQueue(str(tmp_path / 'batch_jobs.db'), stale_after=STALE_AFTER, max_attempts=2)
+
+
+@pytest.fixture
+def files(taxonomy):
+    return corpus.resume_files(random.Random(42), list(taxonomy.skill_names), 6, 200, 0.1)
+
+
+@pytest.fixture
+def job_description():
+    return corpus.SAMPLE_JOB_DESCRIPTIONS[0]
+
+
+def submit(job_queue, files, job_description):
+    uploads = [(index, filename, filename, data) for index, (filename, data, _) in enumerate(files)]
+    return job_queue.submit('upload-multiple', {'page': list(ats.Page()), 'job_description': job_description},
+                            uploads, {})
+
+
+def crash(job_queue, job):
+    """Score one candidate for ``job`` and stop heartbeating, like a worker that died"""
+    job_queue.add_event(job['id'], job['attempt'], ats.BatchEvent('candidate', {'filename': 'resume_0.pdf'}))
+    time.sleep(2 * STALE_AFTER)
+
+
+def test_running_job_is_not_claimed_twice(job_queue, files, job_description):
+    submit(job_queue, files, job_description)
+    job = job_queue.claim()
+    job_queue.heartbeat([(job['id'], job['attempt'])])
+    assert job_queue.claim() is None
+
+
+def test_job_is_claimed_again_after_its_worker_crashes(client, job_queue, files, job_description):
+    job_id = submit(job_queue, files, job_description)
+    first = job_queue.claim()
+    crash(job_queue, first)
+
+    second = job_queue.claim()
+    assert second['id'] == job_id and second['attempt'] == 2
+    assert second['uploads'] == first['uploads']
+    # It starts from scratch, and the crashed attempt can no longer write
+    assert job_queue.status(job_id)['processed'] == 0 and job_queue.status(job_id)['candidates'] == []
+    with pytest.raises(ats.BatchJobLost):
+        job_queue.add_event(first['id'], first['attempt'], ats.BatchEvent('candidate', {}))
+
+    ats.run_batch_job(second, job_queue)
+    status, body, http_status = job_queue.result(job_id)
+    expected = client.post('/upload-multiple', data={
+        'resumes': [(io.BytesIO(data), filename) for filename, data, _ in files], 'job_description': job_description
+    })
+    assert (status, http_status) == ('completed', 200)
+    assert body == expected.get_json()
+    assert job_queue.status(job_id)['processed'] == len(files)
+
+
+def test_job_fails_after_max_attempts(job_queue, files, job_description):
+    job_id = submit(job_queue, files, job_description)
+    for _ in range(job_queue.max_attempts):
+        crash(job_queue, job_queue.claim())
+
+    assert job_queue.claim() is None
+    assert job_queue.result(job_id) == (
+        'failed', {'error': 'Batch job stopped responding too many times'}, 500
+    )
@@ -0,0 +1,120 @@
+import threading
+
+import pytest
+
+import app as ats
+from stub_driver import StubDriver, activity_page
+
+
+@pytest.fixture
+def drivers():
+    """Every driver the pool's factory made, in order"""
+    return []
+
+
+@pytest.fixture
+def make_pool(drivers):
+    def make_pool(**options):
+        def driver_factory():
+            drivers.append(StubDriver({}))
+            return drivers[-1]
+        return ats.BrowserPool(driver_factory, **options)
+    return make_pool
+
+
+def test_idle_session_is_reused(make_pool, drivers):
+    pool = make_pool(size=2)
+    with pool.session() as first:
+        pass
+    with pool.session() as second:
+        pass
+    assert first is second
+    assert pool.stats()['created'] == 1 and pool.stats()['reused'] == 1
+
+
+def test_dead_driver_is_replaced_on_checkout(make_pool, drivers):
+    pool = make_pool(size=1)
+    with pool.session() as driver:
+        pass
+    driver.alive = False
+
+    with pool.session() as replacement:
+        assert replacement is not driver
+        assert replacement.alive
+    assert driver.quit_called
+    assert pool.stats()['unhealthy'] == 1 and pool.stats()['created'] == 2
+
+
+def test_driver_is_discarded_after_an_error_in_use(make_pool, drivers):
+    pool = make_pool(size=1)
+    with pytest.raises(RuntimeError):
+        with pool.session() as driver:
+            raise RuntimeError('page crashed')
+    assert driver.quit_called
+    assert pool.stats()['discarded'] == 1 and pool.stats()['idle'] == 0
+
+
+def test_driver_is_recycled_after_max_uses(make_pool, drivers):
+    pool = make_pool(size=1, max_uses=2)
+    for _ in range(3):
+        with pool.session():
+            pass
+    assert len(drivers) == 2
+    assert drivers[0].quit_called and not drivers[1].quit_called
+    assert pool.stats()['recycled'] == 1
+
+
+def test_idle_sessions_expire(make_pool, drivers):
+    pool = make_pool(size=1, idle_timeout=0)
+    with pool.session():
+        pass
+    with pool.session() as driver:
+        assert driver is drivers[1]
+    assert pool.stats()['expired'] == 1
+
+    pool.close_idle(0)
+    assert drivers[1].quit_called and pool.stats()['idle'] == 0
+
+
+def test_checkout_times_out_when_every_session_is_busy(make_pool, drivers):
+    pool = make_pool(size=1)
+    borrowed = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with pool.session():
+            borrowed.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    try:
+        assert borrowed.wait(5)
+        with pytest.raises(TimeoutError):
+            with pool.session(timeout=0.05):
+                pass
+    finally:
+        release.set()
+        holder.join()
+
+    # The session is free again once it is returned
+    with pool.session(timeout=1) as driver:
+        assert driver is drivers[0]
+
+
+def test_pooled_scraping_matches_one_browser_at_a_time():
+    pytest.importorskip('selenium')
+    pytest.importorskip('bs4')
+    profile_urls = ats.TRUSTED_LINKEDIN_PROFILES
+    pages = {f'{profile_url}/recent-activity/': activity_page(range(1, 11)) for profile_url in profile_urls}
+
+    results = []
+    for size in (1, 4):
+        scraper = ats.LinkedInJobScraper(browser_pool=ats.BrowserPool(lambda: StubDriver(pages), size=size))
+        results.append(sorted(
+            (profile_url, [job['post_id'] for job in jobs], watermark, error)
+            for profile_url, jobs, watermark, error in scraper.scrape_profiles(profile_urls, 10)
+        ))
+
+    assert results[0] == results[1]
+    assert all(error is None and len(post_ids) == 10 for _, post_ids, _, error in results[0])
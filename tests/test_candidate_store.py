@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+import app as ats
+import corpus
+
+
+@pytest.fixture
+def resumes(taxonomy):
+    return corpus.candidate_resumes(random.Random(42), list(taxonomy.skill_names), 2000)
+
+
+@pytest.fixture
+def store(tmp_path, resumes, taxonomy):
+    store = ats.CandidateStore(str(tmp_path / 'candidates.db'))
+    store.add(resumes, taxonomy.fingerprint)
+    return store
+
+
+def scan(resumes, job_description, parsed, taxonomy):
+    """Every candidate's calculate_advanced_match_score, best first"""
+    matcher = ats.JobMatcher()
+    return sorted((
+        matcher.calculate_advanced_match_score(
+            resume['resume_skills'], list(parsed.skills), job_description, taxonomy,
+            requirement_index=parsed.requirement_index
+        )['total_score']
+        for resume in resumes
+    ), reverse=True)
+
+
+@pytest.mark.parametrize('job_description', corpus.SAMPLE_JOB_DESCRIPTIONS)
+def test_search_ranks_like_scoring_every_candidate(store, resumes, taxonomy, job_description):
+    parsed = ats.parse_job_description(job_description, taxonomy)
+    ranked, considered = store.search(job_description, parsed, taxonomy, 50)
+
+    assert len(ranked) == 50 and considered < len(resumes)
+    assert [candidate['match_score'] for candidate in ranked] == \
+        scan(resumes, job_description, parsed, taxonomy)[:50]
+
+
+def test_candidates_sharing_nothing_with_the_job_are_not_ranked(store, resumes, taxonomy):
+    job_description = 'Juggling and unicycling'
+    ranked, considered = store.search(job_description, ats.parse_job_description(job_description, taxonomy),
+                                      taxonomy, 50)
+    assert ranked == [] and considered == 0
+
+
+def test_adding_a_resume_again_keeps_one_row(store, resumes, taxonomy):
+    store.add(resumes[:10], taxonomy.fingerprint)
+    assert store.count() == len(resumes)
+
+
+def test_resume_is_reindexed_for_a_new_taxonomy(tmp_path, taxonomy):
+    store = ats.CandidateStore(str(tmp_path / 'candidates.db'))
+    resume = {'content_hash': 'jane', 'filename': 'jane.txt', 'candidate_name': 'Jane Doe',
+              'resume_skills': ['python'], 'resume_text': 'Jane Doe'}
+    store.add([resume], taxonomy.fingerprint)
+
+    job_description = 'Erlang'
+    parsed = ats.parse_job_description(job_description, taxonomy)
+    assert store.search(job_description, parsed, taxonomy)[0] == []
+
+    # Stored with this taxonomy already, so the resume isn't parsed into the pool again
+    store.add([dict(resume, resume_skills=['erlang'])], taxonomy.fingerprint)
+    assert store.search(job_description, parsed, taxonomy)[0] == []
+
+    store.add([dict(resume, resume_skills=['erlang'])], 'another taxonomy')
+    ranked, _ = store.search(job_description, parsed, taxonomy)
+    assert [candidate['match_score'] for candidate in ranked] == [100.0] and store.count() == 1
+
+
+def test_disabled_store_reports_it():
+    store = ats.CandidateStore('')
+    assert not store.enabled and store.stats() == {'enabled': False}
+
+
+def exact_scores(candidates, requirements, taxonomy):
+    """Exact scores computed the way calculate_advanced_match_score does:
+    aliases of one skill count once, on either side"""
+    term_ids = taxonomy.term_ids
+    job_keys = {term_ids.get(req, req) for req in requirements}
+    scores = []
+    for skills in candidates:
+        resume_keys = {term_ids.get(skill, skill) for skill in skills}
+        scores.append((len(resume_keys & job_keys) / len(job_keys)) * 100)
+    return scores
+
+
+def test_bitset_top_k_matches_set_intersection(taxonomy):
+    rng = random.Random(7)
+    vocabulary = list(taxonomy.skill_names)
+    candidates = corpus.skill_lists(rng, vocabulary, 5000, 25, min_size=0)
+    bitsets = ats.SkillBitsetMatrix(taxonomy)
+    bitsets.append(candidates)
+
+    for requirements in corpus.skill_lists(rng, vocabulary, 5, 10) + [['postgres', 'postgresql', 'golang']]:
+        rows, scores = bitsets.top_k(requirements, 50)
+        scanned = exact_scores(candidates, requirements, taxonomy)
+        expected = sorted(range(len(candidates)), key=lambda row: scanned[row], reverse=True)[:50]
+        assert list(rows) == expected
+        assert list(scores) == [scanned[row] for row in expected]
+
+
+@pytest.mark.parametrize('job_description', corpus.SAMPLE_JOB_DESCRIPTIONS)
+def test_bitset_backend_ranks_like_posting_lists(store, taxonomy, job_description):
+    bitset_store = ats.CandidateStore(store.db_path, search_backend='bitset')
+    parsed = ats.parse_job_description(job_description, taxonomy)
+    assert bitset_store.search(job_description, parsed, taxonomy, 50)[0] == \
+        store.search(job_description, parsed, taxonomy, 50)[0]
+
+
+def test_bitset_backend_sees_candidates_added_elsewhere(store, resumes, taxonomy):
+    bitset_store = ats.CandidateStore(store.db_path, search_backend='bitset')
+    job_description = corpus.SAMPLE_JOB_DESCRIPTIONS[2]
+    parsed = ats.parse_job_description(job_description, taxonomy)
+    bitset_store.search(job_description, parsed, taxonomy)
+
+    # Another worker's store adds and re-indexes candidates after the bitsets were loaded
+    store.add([{'content_hash': 'new', 'filename': 'new.txt', 'candidate_name': 'New Candidate',
+                'resume_skills': list(parsed.skills), 'resume_text': ''}], taxonomy.fingerprint)
+    store.add([dict(resumes[0], resume_skills=list(parsed.skills))], 'another taxonomy')
+
+    ranked, _ = bitset_store.search(job_description, parsed, taxonomy)
+    assert ranked == store.search(job_description, parsed, taxonomy)[0]
+    assert {candidate['candidate_name'] for candidate in ranked[:2]} == {'New Candidate', 'Candidate 0'}
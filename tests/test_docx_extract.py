@@ -0,0 +1,41 @@
+import io
+import random
+
+import pytest
+
+import app as ats
+import corpus
+
+docx = pytest.importorskip('docx')
+
+
+def python_docx_text(data):
+    """The original extractor: python-docx's document model, one line per paragraph"""
+    text = ""
+    for paragraph in docx.Document(io.BytesIO(data)).paragraphs:
+        text += paragraph.text + "\n"
+    return text
+
+
+@pytest.mark.parametrize('paragraphs', [1, 50, 1000])
+def test_streamed_text_matches_python_docx(taxonomy, paragraphs):
+    text = corpus.resume_text(random.Random(paragraphs), list(taxonomy.skill_names), paragraphs * 12, 0.1)
+    data = corpus.docx_bytes(text)
+    assert ats.extract_text_from_docx(io.BytesIO(data)) == python_docx_text(data)
+
+
+def test_special_characters_and_empty_paragraphs():
+    data = corpus.docx_bytes('Jane Doe\n\nC++ & C# <backend> "quoted"\nNaïve café résumé — ✓\n')
+    assert ats.extract_text_from_docx(io.BytesIO(data)) == python_docx_text(data)
+
+
+def test_tables_and_text_boxes_are_read_once(taxonomy):
+    table_skills, text_box_skills = ['Kubernetes', 'Terraform'], ['GraphQL', 'Redis']
+    data = corpus.docx_bytes('Jane Doe\nExperience with Python', table_skills, text_box_skills)
+
+    text = ats.extract_text_from_docx(io.BytesIO(data))
+    found = set(ats.extract_skills_and_keywords(text, taxonomy)) - \
+        set(ats.extract_skills_and_keywords(python_docx_text(data), taxonomy))
+    assert found == {'kubernetes', 'terraform', 'graphql', 'redis'}
+    # Word keeps a VML copy of every text box for older readers
+    assert text.count('GraphQL, Redis') == 1
@@ -0,0 +1,83 @@
+import io
+import random
+import time
+
+import pytest
+
+import corpus
+
+pytest.importorskip('docx')
+
+
+@pytest.fixture
+def rng():
+    return random.Random(42)
+
+
+@pytest.fixture
+def vocabulary(taxonomy):
+    return list(taxonomy.skill_names)
+
+
+@pytest.fixture
+def job_description(rng, vocabulary):
+    return corpus.job_description_text(rng, vocabulary, 150, 0.1)
+
+
+@pytest.fixture
+def uploads(rng, vocabulary):
+    """New PDF, DOCX and TXT resumes for every call, so nothing comes from a cache"""
+    def uploads(count=len(corpus.FORMATS)):
+        return [(io.BytesIO(data), name) for name, data, _ in
+                corpus.resume_files(rng, vocabulary, count, 200, 0.1)]
+    return uploads
+
+
+@pytest.mark.parametrize('path', ['/', '/health', '/get-sample-jobs'])
+def test_get_endpoints(client, path):
+    assert client.get(path).status_code == 200
+
+
+def test_single_resume_endpoints_read_every_format(client, uploads, job_description):
+    for upload in uploads():
+        response = client.post('/upload', data={'resume': upload, 'job_description': job_description})
+        assert response.status_code == 200, response.json
+        assert response.json['filename'] == upload[1]
+        assert response.json['debug_info']['resume_skills_count'] >= 8
+
+    for upload in uploads():
+        response = client.post('/analyze-jobs', data={'resume': upload})
+        assert response.status_code == 200, response.json
+        assert response.json['filename'] == upload[1]
+
+
+def test_batch_endpoints_rank_every_resume(client, uploads, job_description):
+    response = client.post('/upload-multiple', data={'resumes': uploads(6), 'job_description': job_description})
+    assert response.status_code == 200, response.json
+    assert sorted(candidate['filename'] for candidate in response.json['candidates']) == \
+        sorted(f'resume_{i}.{corpus.FORMATS[i % 3]}' for i in range(6))
+
+    response = client.post('/analyze-multiple-with-linkedin', data={'resumes': uploads()})
+    assert response.status_code == 200, response.json
+    assert len(response.json['candidates_with_ranked_jobs']) == 3
+
+
+def test_batch_job_runs_to_completion(client, uploads, job_description):
+    response = client.post('/batch-jobs', data={'resumes': uploads(), 'job_description': job_description})
+    assert response.status_code == 202, response.json
+
+    deadline = time.monotonic() + 30
+    while (result := client.get(response.json['result_url'])).status_code == 202:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    assert result.status_code == 200, result.json
+    assert len(result.json['candidates']) == 3
+
+
+def test_indexed_candidates_are_searchable(client, uploads, job_description):
+    response = client.post('/candidates', data={'resumes': uploads()})
+    assert response.status_code == 200 and response.json['indexed'] == 3
+
+    response = client.post('/candidates/search', data={'job_description': job_description})
+    assert response.status_code == 200
+    assert response.json['total_candidates'] >= 3
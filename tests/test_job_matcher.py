@@ -0,0 +1,70 @@
+import random
+
+import numpy as np
+import pytest
+
+import app as ats
+import corpus
+
+
+@pytest.fixture
+def rng():
+    return random.Random(42)
+
+
+@pytest.fixture
+def vocabulary(taxonomy):
+    return list(taxonomy.skill_names)
+
+
+def test_similarity_matrix_scores_like_per_pair_fuzz_ratio(rng, vocabulary, taxonomy):
+    matcher = ats.JobMatcher()
+    candidates = corpus.skill_lists(rng, vocabulary, 30, 25)
+    jobs = []
+    for _ in range(10):
+        requirements = corpus.requirement_list(rng, vocabulary, 12, free_text=0.5)
+        jobs.append((requirements, 'We are hiring an engineer with ' + ', '.join(requirements)))
+
+    similarity = matcher.build_similarity_matrix(candidates, [requirements for requirements, _ in jobs], taxonomy)
+    assert similarity.scores.shape[0] > 0
+
+    for skills in candidates:
+        for requirements, description in jobs:
+            assert matcher.calculate_advanced_match_score(skills, requirements, description, taxonomy, similarity) \
+                == matcher.calculate_advanced_match_score(skills, requirements, description, taxonomy)
+
+
+def test_rapidfuzz_scores_match_fuzzywuzzy(rng, vocabulary, monkeypatch):
+    if ats.cdist is None:
+        pytest.skip('rapidfuzz is not installed')
+    requirements = [requirement.lower() for requirement in corpus.requirement_list(rng, vocabulary, 60, free_text=1)]
+    skills = [skill.lower() for skill in rng.sample(vocabulary, 60)]
+
+    batched = ats.SkillSimilarityMatrix(requirements, skills).scores
+    monkeypatch.setattr(ats, 'cdist', None)
+    assert np.array_equal(batched, ats.SkillSimilarityMatrix(requirements, skills).scores)
+
+
+@pytest.mark.parametrize('k, offset', [(10, 0), (25, 40), (10, 295), (10, 400)])
+def test_rank_jobs_returns_the_page_of_a_full_sort(rng, vocabulary, taxonomy, k, offset):
+    matcher = ats.JobMatcher()
+    resume_skills = rng.sample(vocabulary, 25)
+    jobs = corpus.job_postings(rng, vocabulary, 200, 8)
+    # Repeated postings tie, and keep their order
+    jobs += [dict(job, title=f'{job["title"]} (repost)') for job in jobs[:100]]
+
+    scores = [matcher.calculate_advanced_match_score(resume_skills, matcher.job_requirements(job), job['description'],
+                                                     taxonomy)['total_score'] for job in jobs]
+    order = sorted(range(len(jobs)), key=lambda index: scores[index], reverse=True)[offset:offset + k]
+
+    page = matcher.rank_jobs(resume_skills, jobs, taxonomy, k, offset)
+    assert [job['title'] for job in page] == [jobs[index]['title'] for index in order]
+    assert [job['match_score'] for job in page] == [scores[index] for index in order]
+
+
+def test_best_match_takes_the_first_of_equal_scores():
+    similarity = ats.SkillSimilarityMatrix(['reactjs'], ['react', 'react', 'vue'])
+    assert similarity.best_match('reactjs', similarity.columns(['vue', 'react'])) == (83, 1)
+    assert similarity.best_match('reactjs', similarity.columns(['react', 'react'])) == (83, 0)
+    assert similarity.best_match('unknown', similarity.columns(['react'])) is None
+    assert similarity.columns(['angular']) is None
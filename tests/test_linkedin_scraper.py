@@ -0,0 +1,120 @@
+import os
+import shutil
+
+import pytest
+
+import app as ats
+
+pytest.importorskip('bs4')
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'linkedin')
+ZEESHAN, NAMAN, AVINASH = ats.TRUSTED_LINKEDIN_PROFILES
+
+
+def scrape(fixtures_dir, watermarks=None):
+    scraper = ats.LinkedInJobScraper(fixtures_dir)
+    return {profile_url: (jobs, watermark, error) for profile_url, jobs, watermark, error
+            in scraper.scrape_profiles(ats.TRUSTED_LINKEDIN_PROFILES, 10, watermarks)}
+
+
+def test_parse_activity_posts_keeps_page_order_and_line_breaks():
+    scraper = ats.LinkedInJobScraper(FIXTURES_DIR)
+    posts = scraper.parse_activity_posts(scraper.load_activity_page(ZEESHAN))
+
+    assert [post_id for post_id, _ in posts] == [
+        'urn:li:activity:7241180000000000300',
+        'urn:li:activity:7241170000000000200',
+        'urn:li:activity:7241160000000000100',
+    ]
+    assert posts[0][1].split('\n') == [
+        'Zeeshan Ali', 'Talent Partner', "We're hiring a Senior Python Developer!", 'Join us at Nimbus Labs Inc.',
+        'Requirements:', '• 5+ years of Python', '• Django or FastAPI', '• PostgreSQL and Redis', '• AWS, Docker',
+        'Location: Lahore, Pakistan', '#hiring'
+    ]
+
+
+def test_job_posts_are_extracted_from_saved_pages():
+    results = scrape(FIXTURES_DIR)
+
+    jobs, watermark, error = results[ZEESHAN]
+    assert error is None and watermark == 'urn:li:activity:7241180000000000300'
+    # The meetup post mentions no job keyword
+    assert [job['post_id'] for job in jobs] == ['urn:li:activity:7241180000000000300',
+                                               'urn:li:activity:7241160000000000100']
+    assert jobs[0]['title'] == "We're hiring a Senior Python Developer!"
+    assert jobs[0]['company'] == 'Join us at Nimbus Labs Inc.'
+    assert jobs[0]['requirements'][:4] == ['5+ years of python', 'django or fastapi', 'postgresql and redis',
+                                           'aws, docker']
+    assert jobs[0]['location'] == 'Lahore, Pakistan'
+    assert jobs[1]['requirements'] == ['sql', 'excel and tableau']
+    assert jobs[1]['location'] == 'Karachi'
+    assert all(job['source_profile'] == ZEESHAN for job in jobs)
+
+    jobs, _, error = results[NAMAN]
+    assert error is None
+    assert [job['title'] for job in jobs] == ['Frontend Engineer, React & TypeScript',
+                                             'DevOps Engineer role open on my team']
+    assert jobs[0]['requirements'][:3] == ['react, redux', 'typescript', 'css, html']
+    assert [job['location'] for job in jobs] == ['Bengaluru, India (hybrid)', 'Remote (India)']
+
+
+def test_login_wall_has_no_jobs():
+    assert scrape(FIXTURES_DIR)[AVINASH] == ([], None, None)
+
+
+def test_posts_up_to_the_watermark_are_skipped():
+    results = scrape(FIXTURES_DIR, {ZEESHAN: 'urn:li:activity:7241170000000000200'})
+
+    jobs, watermark, _ = results[ZEESHAN]
+    assert [job['post_id'] for job in jobs] == ['urn:li:activity:7241180000000000300']
+    assert watermark == 'urn:li:activity:7241180000000000300'
+
+
+def test_missing_fixture_is_a_profile_error(tmp_path):
+    jobs, watermark, error = scrape(str(tmp_path))[ZEESHAN]
+    assert jobs == [] and watermark is None and 'No such file' in error
+
+
+def test_refresher_stores_only_new_posts(tmp_path):
+    fixtures_dir = tmp_path / 'fixtures'
+    shutil.copytree(FIXTURES_DIR, fixtures_dir)
+    cache = ats.JobCache(str(tmp_path / 'linkedin_jobs.db'))
+    refresher = ats.LinkedInJobRefresher(cache, ats.TRUSTED_LINKEDIN_PROFILES, 3600, 10, str(fixtures_dir))
+
+    assert refresher.refresh() == {ZEESHAN: 2, NAMAN: 2, AVINASH: 0}
+    # Nothing is due again within the refresh interval
+    assert refresher.refresh() == {}
+
+    page = fixtures_dir / f'{NAMAN.rsplit("/", 1)[-1]}.html'
+    page.write_text(page.read_text(encoding='utf-8').replace(
+        '<ul class="display-flex flex-wrap list-style-none justify-center">',
+        '<ul class="display-flex flex-wrap list-style-none justify-center"><li><div data-id="urn:li:activity:'
+        '7241000000000000030"><span dir="ltr">Hiring a QA Analyst<br>Location: Pune</span></div></li>'
+    ), encoding='utf-8')
+    assert refresher.refresh(force=True) == {ZEESHAN: 0, NAMAN: 1, AVINASH: 0}
+
+    jobs = cache.jobs()
+    assert len(jobs) == 5
+    assert jobs[0]['post_id'] == 'urn:li:activity:7241000000000000030'
+    assert len({(job['source_profile'], job['post_id']) for job in jobs}) == 5
+
+
+def test_refresher_status_shows_when_nothing_refreshes(tmp_path):
+    cache = ats.JobCache(str(tmp_path / 'linkedin_jobs.db'))
+    refresher = ats.LinkedInJobRefresher(cache, ats.TRUSTED_LINKEDIN_PROFILES, 3600, 10, FIXTURES_DIR)
+    assert refresher.status()['state'] == 'never' and refresher.status()['last_refresh'] is None
+
+    refresher.refresh()
+    assert refresher.status()['state'] == 'fresh'
+
+    with cache._connect() as connection:
+        connection.execute('UPDATE linkedin_profiles SET last_scraped_at = last_scraped_at - 3 * 3600')
+    assert refresher.status()['state'] == 'stale'
+
+    refresher.refresh_interval = 0
+    assert refresher.status()['state'] == 'disabled'
+
+
+def test_health_reports_the_refresher(client):
+    refresher = client.get('/health').get_json()['linkedin_refresher']
+    assert refresher['state'] in ('never', 'stale', 'fresh') and refresher['in_workers'] is False
@@ -0,0 +1,95 @@
+import io
+import re
+
+import pytest
+
+import app as ats
+
+RESUMES = (
+    b'Jane Doe\nSkills: Python, Django, Flask, AWS, SQL database, git, docker\n',
+    b'John Smith\nSkills: React, Node.js, JavaScript, MongoDB database, CSS, HTML\n',
+    b'Ana Lima\nSkills: Java, Spring Boot, Kubernetes, PostgreSQL, CI/CD\n',
+)
+JOB_DESCRIPTION = 'Python developer with Django, Flask, AWS, Docker and SQL experience'
+TRACING_HOOKS = ('start_request_trace', 'record_request_metrics', 'end_request_trace')
+
+
+@pytest.fixture
+def metrics(tmp_path, monkeypatch):
+    """A fresh METRICS, shared through a database like the workers' one"""
+    store = ats.MetricsStore(str(tmp_path / 'metrics.db'), flush_interval=60)
+    monkeypatch.setattr(ats, 'METRICS', store)
+    return store
+
+
+def post(client, endpoint):
+    if endpoint == '/upload':
+        data = {'resume': (io.BytesIO(RESUMES[0]), 'resume.txt'), 'job_description': JOB_DESCRIPTION}
+    else:
+        data = {
+            'resumes': [(io.BytesIO(resume), f'resume_{i}.txt') for i, resume in enumerate(RESUMES)],
+            'job_description': JOB_DESCRIPTION
+        }
+    response = client.post(endpoint, data=data)
+    assert response.status_code == 200, response.get_json()
+    return response
+
+
+def series_value(exposition, series):
+    match = re.search(re.escape(series) + r' (\S+)', exposition)
+    return float(match.group(1)) if match else 0
+
+
+@pytest.mark.parametrize('endpoint', ['/upload', '/upload-multiple'])
+def test_tracing_does_not_change_responses(client, monkeypatch, endpoint):
+    traced = post(client, endpoint).get_json()
+    for registry in (ats.app.before_request_funcs, ats.app.after_request_funcs, ats.app.teardown_request_funcs):
+        for key, funcs in registry.items():
+            monkeypatch.setitem(registry, key, [func for func in funcs if func.__name__ not in TRACING_HOOKS])
+    assert post(client, endpoint).get_json() == traced
+
+
+def test_metrics_counts_every_traced_request(client, metrics):
+    for _ in range(3):
+        post(client, '/upload')
+        post(client, '/upload-multiple')
+    # A streamed response is recorded once the server closes it
+    streamed = client.post('/upload-multiple?stream=ndjson', data={
+        'resumes': [(io.BytesIO(RESUMES[0]), 'resume.txt')], 'job_description': JOB_DESCRIPTION
+    })
+    streamed.get_data()
+    multiple = 'ats_request_duration_seconds_count{endpoint="/upload-multiple",status="200"}'
+    assert series_value(metrics.render(), multiple) == 3
+    streamed.close()
+
+    exposition = client.get('/metrics').get_data(as_text=True)
+    assert series_value(exposition, 'ats_request_duration_seconds_count{endpoint="/upload",status="200"}') == 3
+    assert series_value(exposition, multiple) == 4
+    assert series_value(exposition, 'ats_request_resumes_sum{endpoint="/upload-multiple"}') == 3 * 3 + 1
+    assert series_value(exposition, 'ats_stage_duration_seconds_count{endpoint="/upload",stage="save"}') == 3
+
+
+def test_buckets_are_cumulative():
+    metrics = ats.MetricsStore('')
+    for value in (0, 1e9, 1e9):
+        metrics.observe('ats_request_resumes', value, endpoint='/upload')
+    exposition = metrics.render()
+
+    buckets = ats.HISTOGRAMS['ats_request_resumes'][1]
+    labels = 'endpoint="/upload"'
+    assert series_value(exposition, f'ats_request_resumes_bucket{{{labels},le="{float(buckets[0])!r}"}}') == 1
+    assert series_value(exposition, f'ats_request_resumes_bucket{{{labels},le="{float(buckets[-1])!r}"}}') == 1
+    assert series_value(exposition, f'ats_request_resumes_bucket{{{labels},le="+Inf"}}') == 3
+    assert series_value(exposition, f'ats_request_resumes_count{{{labels}}}') == 3
+
+
+def test_processes_add_up_through_the_database(tmp_path):
+    shared = [ats.MetricsStore(str(tmp_path / 'metrics.db')) for _ in range(2)]
+    alone = ats.MetricsStore('')
+    for metrics in shared + [alone]:
+        metrics.observe('ats_request_resumes', 2, endpoint='/upload-multiple')
+
+    key = ('ats_request_resumes', 'endpoint="/upload-multiple"', 'sum')
+    assert shared[0].totals()[key] == 2
+    assert shared[1].totals()[key] == 4
+    assert alone.totals()[key] == 2
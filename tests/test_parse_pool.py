@@ -0,0 +1,90 @@
+import os
+import time
+
+import pytest
+
+import app as ats
+
+
+def nap(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+@pytest.fixture
+def make_pool():
+    def make_pool(processes=2, timeout=10):
+        return ats.ResumeParsePool(processes, timeout)
+    return make_pool
+
+
+def test_outcomes_are_returned_in_submission_order(make_pool):
+    pool = make_pool()
+    outcomes = pool.run(nap, [(0.2, 'slow'), (0, 'fast'), (0.1, 'medium')])
+    assert outcomes == [('slow', None), ('fast', None), ('medium', None)]
+
+    completed = [result for _, result, _ in pool.run_iter(nap, [(0.3, 'slow'), (0, 'fast')])]
+    assert completed == ['fast', 'slow']
+
+
+def test_errors_are_returned_not_raised(make_pool):
+    (result, error), = make_pool().run(int, [('not a number',)])
+    assert result is None and isinstance(error, ValueError)
+
+
+def test_unpicklable_task_fails_without_losing_the_process(make_pool):
+    pool = make_pool(processes=1)
+    outcomes = pool.run(nap, [(0, lambda: None), (0, 'next')])
+    assert outcomes[0][1] is not None
+    assert outcomes[1] == ('next', None)
+    assert pool.stats()['started'] == 1
+
+
+def test_only_the_late_task_times_out(make_pool):
+    pool = make_pool(timeout=1)
+    outcomes = pool.run(nap, [(0, 'a'), (30, 'late'), (0.1, 'b'), (0, 'c')])
+
+    assert [outcome for outcome in outcomes if outcome[1] is None] == [('a', None), ('b', None), ('c', None)]
+    assert isinstance(outcomes[1][1], TimeoutError)
+    assert pool.stats()['timed_out'] == 1
+
+    # The killed process is replaced on the next task
+    assert pool.run(nap, [(0, 'after')]) == [('after', None)]
+
+
+def test_crashed_process_is_reported_and_replaced(make_pool):
+    pool = make_pool(processes=1)
+    (result, error), = pool.run(os._exit, [(1,)])
+    assert result is None and 'exited unexpectedly' in str(error)
+
+    assert pool.run(pow, [(2, 10)]) == [(1024, None)]
+    assert pool.stats()['crashed'] == 1 and pool.stats()['started'] == 2
+
+
+def test_processes_are_not_forked_from_the_caller(make_pool):
+    pool = make_pool()
+    assert pool.start_method in ('forkserver', 'spawn')
+    if pool.start_method == 'forkserver':
+        # They are children of the forkserver, not of this multithreaded process
+        (parent, _), = pool.run(os.getppid, [()])
+        assert parent != os.getpid()
+
+
+def test_run_iter_reads_args_only_as_tasks_complete(make_pool):
+    read = []
+
+    def arg_list():
+        for number in range(10):
+            read.append(number)
+            yield 0.05, number
+
+    outcomes = make_pool().run_iter(nap, arg_list(), limit=2)
+    first = next(outcomes)
+    assert len(read) <= 3
+    assert sorted(result for _, result, _ in [first, *outcomes]) == list(range(10))
+
+
+def test_inline_pool_times_out_without_processes():
+    pool = ats.ResumeParsePool(0, 0.2)
+    outcomes = pool.run(nap, [(5, 'late'), (0, 'next')])
+    assert isinstance(outcomes[0][1], TimeoutError) and outcomes[1] == ('next', None)
@@ -0,0 +1,65 @@
+import io
+import random
+
+import pytest
+
+import app as ats
+import corpus
+
+PyPDF2 = pytest.importorskip('PyPDF2')
+
+LINES_PER_PAGE = 50
+
+
+@pytest.fixture
+def pdf(taxonomy):
+    """A PDF of ``pages`` synthetic resume pages and the PyPDF2 text of each"""
+    def pdf(pages):
+        text = corpus.resume_text(random.Random(pages), list(taxonomy.skill_names), pages * LINES_PER_PAGE * 12, 0.1)
+        data = corpus.pdf_bytes(text, lines_per_page=LINES_PER_PAGE)
+        return data, [page.extract_text() for page in PyPDF2.PdfReader(io.BytesIO(data)).pages]
+    return pdf
+
+
+@pytest.fixture
+def caps(monkeypatch):
+    def caps(max_pages=0, max_chars=0):
+        monkeypatch.setitem(ats.app.config, 'PDF_MAX_PAGES', max_pages)
+        monkeypatch.setitem(ats.app.config, 'PDF_MAX_CHARS', max_chars)
+    return caps
+
+
+def extract(data, taxonomy):
+    return ats.extract_resume_text_and_skills(io.BytesIO(data), 'resume.pdf', taxonomy)
+
+
+@pytest.mark.parametrize('backend', [name for name in ats.PDF_BACKENDS.names() if ats.PDF_BACKENDS.installed(name)])
+@pytest.mark.parametrize('pages', [1, 3, 12])
+def test_streamed_pages_match_the_whole_text(pdf, caps, taxonomy, monkeypatch, backend, pages):
+    caps()
+    monkeypatch.setattr(ats, 'PDF_BACKEND', backend)
+    data, _ = pdf(pages)
+    whole_text = ''.join(ats.PDF_BACKENDS.get(backend)(io.BytesIO(data)))
+
+    text, skills = extract(data, taxonomy)
+    assert text == whole_text
+    assert skills == ats.extract_skills_and_keywords(whole_text, taxonomy)
+    assert skills
+
+
+def test_page_cap_keeps_the_first_pages(pdf, caps, taxonomy, monkeypatch):
+    caps(max_pages=2)
+    monkeypatch.setattr(ats, 'PDF_BACKEND', 'pypdf2')
+    data, page_texts = pdf(5)
+    assert extract(data, taxonomy)[0] == ''.join(page_texts[:2])
+
+
+def test_character_cap_cuts_the_text_off(pdf, caps, taxonomy, monkeypatch):
+    monkeypatch.setattr(ats, 'PDF_BACKEND', 'pypdf2')
+    data, page_texts = pdf(5)
+    max_chars = len(page_texts[0]) + 100
+    caps(max_chars=max_chars)
+
+    text, skills = extract(data, taxonomy)
+    assert text == ''.join(page_texts)[:max_chars]
+    assert skills == ats.extract_skills_and_keywords(text, taxonomy)
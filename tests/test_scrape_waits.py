@@ -0,0 +1,52 @@
+import pytest
+
+import app as ats
+from stub_driver import LazyFeedDriver
+
+pytest.importorskip('selenium')
+pytest.importorskip('bs4')
+
+PROFILE_URL = ats.TRUSTED_LINKEDIN_PROFILES[0]
+
+
+def scrape(feed, max_posts=10, watermark=None, render=0.05, scroll_load=0.05, batch=5):
+    pool = ats.BrowserPool(lambda: LazyFeedDriver(render, scroll_load, batch, feed), size=1)
+    scraper = ats.LinkedInJobScraper(browser_pool=pool)
+    # Short waits for a stub feed that loads in milliseconds
+    scraper.page_timeout = scraper.scroll_timeout = 0.5
+    scraper.wait_poll = 0.01
+    (_, jobs, new_watermark, error), = scraper.scrape_profiles([PROFILE_URL], max_posts,
+                                                               {PROFILE_URL: watermark})
+    assert error is None
+    return [job['post_id'] for job in jobs], new_watermark, scraper.timings[PROFILE_URL]
+
+
+def activity(number):
+    return f'urn:li:activity:{number}'
+
+
+def test_scrolls_until_enough_posts_are_loaded():
+    post_ids, watermark, timing = scrape(feed=30, max_posts=12)
+    assert post_ids == [activity(number) for number in range(30, 18, -1)]
+    assert watermark == activity(30)
+    assert timing['scrolls'] == 2 and timing['posts'] == 15
+    assert timing['first_post'] >= 0.05
+
+
+def test_stops_at_the_end_of_the_feed():
+    post_ids, _, timing = scrape(feed=7)
+    assert post_ids == [activity(number) for number in range(7, 0, -1)]
+    assert timing['posts'] == 7
+
+
+def test_stops_at_posts_already_scraped():
+    post_ids, watermark, timing = scrape(feed=30, watermark=activity(27))
+    assert post_ids == [activity(30), activity(29), activity(28)]
+    assert watermark == activity(30)
+    assert timing.get('scrolls', 0) == 0
+
+
+def test_page_without_posts_gives_no_jobs():
+    post_ids, watermark, timing = scrape(feed=0)
+    assert post_ids == [] and watermark is None
+    assert timing['posts'] == 0 and timing['first_post'] is None
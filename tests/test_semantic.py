@@ -0,0 +1,76 @@
+import io
+import json
+import random
+
+import numpy as np
+import pytest
+
+import app as ats
+import corpus
+
+pytest.importorskip('sklearn')
+pytest.importorskip('docx')
+
+
+@pytest.fixture
+def rng():
+    return random.Random(42)
+
+
+@pytest.fixture
+def vocabulary(taxonomy):
+    return list(taxonomy.skill_names)
+
+
+@pytest.fixture
+def semantic_model(tmp_path, taxonomy, monkeypatch):
+    """Swap in a SemanticModel of the given mode, fitted on the default corpus for tfidf"""
+    def semantic_model(mode):
+        model = ats.SemanticModel(str(tmp_path / 'semantic_tfidf.pkl'), mode=mode)
+        if mode == 'tfidf':
+            model.fit(ats.default_semantic_corpus(taxonomy))
+        monkeypatch.setattr(ats, 'SEMANTIC_MODEL', model)
+        return model
+    return semantic_model
+
+
+def test_batched_scores_match_pair_by_pair(rng, vocabulary, semantic_model):
+    vectorizer = semantic_model('tfidf').current()
+    resume_skill_lists = corpus.skill_lists(rng, vocabulary, 20, 25)
+    job_descriptions = [corpus.job_description_text(rng, vocabulary, 120, 0.3) for _ in range(8)]
+
+    batched = ats.semantic_scores(vectorizer, resume_skill_lists, ats.semantic_vectors(vectorizer, job_descriptions))
+    pairwise = np.array([
+        [ats.semantic_scores(vectorizer, [skills], ats.semantic_vectors(vectorizer, [description]))[0, 0]
+         for description in job_descriptions]
+        for skills in resume_skill_lists
+    ])
+    assert batched.shape == (20, 8)
+    assert batched.max() > 0
+    assert np.allclose(pairwise, batched, atol=1e-4)
+
+
+def test_no_resumes_or_jobs_score_nothing(semantic_model):
+    vectorizer = semantic_model('tfidf').current()
+    assert ats.semantic_scores(vectorizer, [], ats.semantic_vectors(vectorizer, ['python'])).shape == (0, 1)
+    assert ats.semantic_scores(vectorizer, [['python']], ats.semantic_vectors(vectorizer, [])).shape == (1, 0)
+
+
+@pytest.mark.parametrize('mode', ['overlap', 'tfidf'])
+def test_one_batch_ranks_like_streamed_scoring(client, rng, vocabulary, semantic_model, mode):
+    semantic_model(mode)
+    job_description = corpus.job_description_text(rng, vocabulary, 150, 0.1)
+    files = corpus.resume_files(rng, vocabulary, 6, 200, 0.1)
+
+    def post(path):
+        return client.post(path, data={
+            'resumes': [(io.BytesIO(data), filename) for filename, data, _ in files],
+            'job_description': job_description
+        })
+
+    batched = post('/upload-multiple')
+    streamed = post('/upload-multiple?stream=ndjson')
+    events = [json.loads(line) for line in streamed.get_data(as_text=True).splitlines()]
+    assert batched.status_code == 200
+    assert [event['event'] for event in events] == ['candidate'] * len(files) + ['result']
+    assert events[-1]['data'] == batched.get_json()
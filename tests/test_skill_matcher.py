@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+import app as ats
+import baseline_skills
+
+FILLER_WORDS = (
+    'experience with building and maintaining services using the team responsible for database design '
+    'delivered projects in years of worked on applications db production systems skills knowledge sql'
+).split()
+PUNCTUATION = ('', '', '', ',', '.', ';', '\n', ' experience', ' database')
+
+EDGE_CASES = [
+    'Oracle database, Redis experience and MongoDB; no mysql.',
+    'The oracle said redis would be fine',
+    'Tuned postgres queries. Also postgresql',
+    'Spring Boot and Spring, React Native and React, Node.js/nodejs',
+    'C++ and C# with .NET (dotnet), ASP.NET MVC',
+    'CI/CD pipelines over TCP/IP, R and Go, SQL Server via mssql',
+    'Machine learning (ML) and AI, scikit-learn/sklearn, Power BI',
+    'Quality assurance (QA), test driven development (TDD)',
+    'Worked in db teams; cassandra and oracle for the warehouse',
+    '',
+]
+
+
+def baseline_vocabulary(taxonomy):
+    """Taxonomy terms the original extractor finds on their own; aliases
+    added with the taxonomy (golang, k8s, ...) are new behaviour"""
+    return sorted(term for term in taxonomy.term_ids
+                  if term in baseline_skills.extract_skills_and_keywords(term + ','))
+
+
+def synthetic_resumes(vocabulary, count=300, seed=7):
+    rng = random.Random(seed)
+    for _ in range(count):
+        words = []
+        for _ in range(rng.randint(20, 200)):
+            if rng.random() < 0.15:
+                words.append(rng.choice(vocabulary) + rng.choice(PUNCTUATION))
+            else:
+                words.append(rng.choice(FILLER_WORDS))
+        yield ' '.join(words).capitalize()
+
+
+def canonical_baseline_ids(text, taxonomy):
+    return {taxonomy.term_ids[skill] for skill in baseline_skills.extract_skills_and_keywords(text)}
+
+
+def test_baseline_vocabulary_is_in_the_taxonomy(taxonomy):
+    vocabulary = baseline_vocabulary(taxonomy)
+    assert len(vocabulary) > 200
+    assert 'postgres' in vocabulary and 'golang' not in vocabulary
+
+
+@pytest.mark.parametrize('text', EDGE_CASES)
+def test_edge_cases_match_the_original_extractor(text, taxonomy):
+    assert ats.extract_skill_ids(text, taxonomy) == canonical_baseline_ids(text, taxonomy)
+
+
+def test_synthetic_corpus_matches_the_original_extractor(taxonomy):
+    mismatches = []
+    for text in synthetic_resumes(baseline_vocabulary(taxonomy)):
+        expected = canonical_baseline_ids(text, taxonomy)
+        found = ats.extract_skill_ids(text, taxonomy)
+        if found != expected:
+            mismatches.append(sorted(taxonomy.skill_names[skill_id] for skill_id in found ^ expected))
+    assert mismatches == []
+
+
+def test_skill_matcher_finds_prefix_skills():
+    matcher = ats.SkillMatcher(['spring', 'spring boot', 'react', 'react native'])
+    assert matcher.find('spring boot and react native') == {'spring', 'spring boot', 'react', 'react native'}
+    assert matcher.find('springboot') == set()
@@ -0,0 +1,78 @@
+import json
+import time
+
+import app as ats
+
+
+def skill_names(text, taxonomy):
+    return set(ats.extract_skills_and_keywords(text, taxonomy))
+
+
+def test_aliases_share_the_canonical_id(taxonomy):
+    assert taxonomy.canonical_id('nodejs') == taxonomy.canonical_id('node.js')
+    assert taxonomy.canonical_id('Postgres') == taxonomy.canonical_id('postgresql')
+    assert taxonomy.canonical_id('not a skill') is None
+
+
+def test_extraction_reports_canonical_names(taxonomy):
+    assert skill_names('Built services in nodejs and sklearn', taxonomy) == {'node.js', 'scikit-learn'}
+
+
+def test_database_names_need_database_context(taxonomy):
+    assert 'postgresql' not in skill_names('I like postgresql a lot', taxonomy)
+    assert 'postgresql' in skill_names('Skills: postgresql, docker', taxonomy)
+    assert 'oracle' not in skill_names('The oracle said so', taxonomy)
+
+
+def test_alias_of_a_validated_skill_is_not_validated(taxonomy):
+    # Only the name carries the validation rule, as in the original extractor
+    # that validated "postgresql" but not "postgres"
+    assert 'postgres' not in taxonomy.validators
+    assert 'postgresql' in skill_names('Tuned postgres queries for the billing team', taxonomy)
+
+
+def edited_taxonomy_file(tmp_path, extra_skill):
+    """A copy of the taxonomy with one more skill and the same version label"""
+    with open(ats.app.config['SKILL_TAXONOMY_PATH'], encoding='utf-8') as file:
+        data = json.load(file)
+    path = tmp_path / 'skills_taxonomy.json'
+    path.write_text(json.dumps(data), encoding='utf-8')
+    data['categories']['programming_languages'].append(extra_skill)
+    return path, data
+
+
+def test_editing_the_file_without_bumping_version_changes_the_fingerprint(tmp_path):
+    path, edited = edited_taxonomy_file(tmp_path, 'zig')
+    store = ats.SkillTaxonomyStore(str(path), reload_interval=0.001)
+    before = store.current()
+
+    path.write_text(json.dumps(edited, indent=2), encoding='utf-8')
+    time.sleep(0.01)
+    after = store.current()
+
+    assert after is not before
+    assert after.version == before.version
+    assert after.fingerprint != before.fingerprint
+    # Reformatting alone keeps the fingerprint
+    assert ats.SkillTaxonomy(json.loads(path.read_text(encoding='utf-8'))).fingerprint == after.fingerprint
+
+    # The JD cache doesn't serve the old taxonomy's skills
+    job_description = 'Systems programmer: zig, c and rust'
+    assert 'zig' not in ats.parse_job_description(job_description, before).skills
+    assert 'zig' in ats.parse_job_description(job_description, after).skills
+
+
+def test_bitsets_are_rebuilt_for_an_edited_taxonomy(tmp_path):
+    path, edited = edited_taxonomy_file(tmp_path, 'zig')
+    before = ats.SkillTaxonomy.from_file(str(path))
+    after = ats.SkillTaxonomy(edited)
+    store = ats.CandidateStore(str(tmp_path / 'candidates.db'), 'bitset')
+    store.add([{
+        'content_hash': 'a', 'filename': 'a.txt', 'candidate_name': 'A', 'resume_skills': ['python', 'zig'],
+        'resume_text': 'python zig'
+    }], before.fingerprint)
+
+    for taxonomy in (before, after):
+        job_description = 'python and zig'
+        store.search(job_description, ats.parse_job_description(job_description, taxonomy), taxonomy)
+        assert store._bitsets['matrix'].taxonomy is taxonomy